@@ -0,0 +1,70 @@
+import os
+
+import log
+
+try:
+    from bson import ObjectId
+    from pymongo import MongoClient
+except ImportError:  # deployed without pymongo: prefetch is skipped
+    MongoClient = None
+
+
+# ======================================================
+# 🔥 Batch prefetch of tb_file_details
+# ======================================================
+#
+# One $in query per PREFETCH_BATCH_SIZE files instead of one find_one per
+# file in OCR_lambda1: originalS3File is attached to each Map item, and
+# entries whose file does not exist (or belongs to another user/cluster)
+# are rejected before any Textract work is started. originalS3File on a Map
+# item comes only from here, so OCR_lambda1 may skip its ownership lookup.
+# Enabled when pymongo is packaged with the loader and PROD_MONGO_URI is set.
+
+MONGO_URI = os.getenv("PROD_MONGO_URI")
+MONGO_DB = os.getenv("MONGO_DATABASE", "yc-invoice")
+FILE_DETAILS = os.getenv("FILE_DETAILS", "tb_file_details")
+PREFETCH_ENABLED = os.getenv("PREFETCH_FILE_DETAILS", "true").lower() == "true"
+PREFETCH_BATCH_SIZE = int(os.getenv("PREFETCH_BATCH_SIZE", "1000"))
+
+_client = None
+
+
+def prefetch_available():
+    return PREFETCH_ENABLED and MongoClient is not None and bool(MONGO_URI)
+
+
+def _collection():
+    global _client
+    if _client is None:
+        _client = MongoClient(MONGO_URI)
+    return _client[MONGO_DB][FILE_DETAILS]
+
+
+def prefetch_file_details(files):
+    """
+    Attach originalS3File to each entry from one $in query per batch.
+    Returns (files that exist, rejected entries).
+    """
+    col = _collection()
+    found = {}
+    for start in range(0, len(files), PREFETCH_BATCH_SIZE):
+        batch = files[start:start + PREFETCH_BATCH_SIZE]
+        cursor = col.find(
+            {"_id": {"$in": [ObjectId(f["fileId"]) for f in batch]}},
+            {"originalS3File": 1, "userId": 1, "clusterId": 1},
+        )
+        for doc in cursor:
+            found[str(doc["_id"])] = doc
+
+    kept, rejected = [], []
+    for entry in files:
+        doc = found.get(entry["fileId"])
+        if not doc:
+            rejected.append({"fileId": entry["fileId"], "reason": "file not found in tb_file_details"})
+        elif str(doc.get("userId")) != entry["userId"] or str(doc.get("clusterId")) != entry["clusterId"]:
+            rejected.append({"fileId": entry["fileId"], "reason": "userId/clusterId do not match the file"})
+        else:
+            kept.append(dict(entry, originalS3File=doc.get("originalS3File")))
+
+    log.info("prefetch", found=len(found), files=len(files), queries=-(-len(files) // PREFETCH_BATCH_SIZE))
+    return kept, rejected
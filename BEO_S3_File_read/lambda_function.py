@@ -1,32 +1,70 @@
-import json
 import boto3
 from urllib.parse import urlparse
 
+from manifest import iter_manifest, read_entries, dump_manifest, REJECTED_SAMPLE_SIZE
+from file_details import prefetch_available, prefetch_file_details
+from tracing import span, trace_context
+import log
+
 s3 = boto3.client("s3")
 
+# validateOnly writes the cleaned manifest here for the Distributed Map's ItemReader
+VALIDATED_PREFIX = "validated"
+
 def lambda_handler(event, context):
-    print("Incoming event:", json.dumps(event))
+    with trace_context(executionId=event.get("executionId")), \
+            log.request(event.get("executionInput") or {}), span("load"):
+        return _load(event)
+
+
+def _load(event):
+    log.payload("load_event", event)
     try:
         s3_uri = event["s3Uri"]
         parsed = urlparse(s3_uri)
         bucket = parsed.netloc
         key = parsed.path.lstrip("/")
-        print(f"Reading from S3 -> Bucket: {bucket}, Key: {key}")
+        log.info("manifest_read", bucket=bucket, key=key)
+
+        # Stream, validate and de-duplicate entries without holding the raw document
+        with span("s3_read", object="manifest") as trace:
+            obj = s3.get_object(Bucket=bucket, Key=key)
+            files, report = read_entries(iter_manifest(obj["Body"], key))
+            trace["entries"] = report["received"]
+
+        if files and prefetch_available():
+            with span("mongo_read", collection="tb_file_details", files=len(files)):
+                files, missing = prefetch_file_details(files)
+            report["valid"] = len(files)
+            report["rejected"] += len(missing)
+            report["rejectedSample"] = (report["rejectedSample"] + missing)[:REJECTED_SAMPLE_SIZE]
+            report["prefetched"] = True
+
+        # forceReprocess/debug/profile in the execution input apply to every file of the run
+        run_options = event.get("executionInput") or {}
+        overrides = {k: True for k in ("forceReprocess", "debug", "profile") if run_options.get(k)}
+        if overrides:
+            files = [dict(f, **overrides) for f in files]
 
-        obj = s3.get_object(Bucket=bucket, Key=key)
-        data = obj["Body"].read().decode("utf-8")
-        print("Raw file contents:", data[:500])  # print first 500 chars
+        log.info("manifest", **report)
+        if report["received"] and not files:
+            raise ValueError(f"No valid entries in manifest s3://{bucket}/{key}")
 
-        content = json.loads(data)
-        if "files" not in content:
-            raise ValueError("Missing 'files' key in JSON")
+        # Distributed Map reads the items itself; write the cleaned manifest and hand back a pointer
+        if event.get("validateOnly"):
+            validated_key = f"{VALIDATED_PREFIX}/{key}"
+            s3.put_object(Bucket=bucket, Key=validated_key, Body=dump_manifest(files, key).encode("utf-8"))
+            return {
+                "bucket": bucket,
+                "key": validated_key,
+                "fileCount": len(files),
+                "validation": report,
+            }
 
-        print("Parsed content successfully.")
-        return content
+        return {"files": files, "validation": report}
 
     except Exception as e:
         import traceback
         traceback_str = traceback.format_exc()
-        print("ERROR:", str(e))
-        print("TRACE:", traceback_str)
+        log.error("load_failed", error=str(e), traceback=traceback_str)
         raise e
@@ -0,0 +1,210 @@
+import re
+import json
+import codecs
+
+
+# ======================================================
+# 📄 Manifest format
+# ======================================================
+#
+# JSON:  {"files": [{"fileId", "userId", "clusterId", "creditId", ...}, ...]}
+# JSONL: one file object per line (key ends with .jsonl)
+#
+# Both are read as a stream of entries from the S3 body, so only the
+# entries themselves (never the raw document) are held in memory.
+
+REQUIRED_FIELDS = ("fileId", "userId", "clusterId", "creditId")
+ID_FIELDS = ("fileId", "userId", "clusterId", "creditId")
+# Carried through to the Map items when present
+OPTIONAL_FIELDS = ("priority", "pageCount", "sizeBytes", "forceReprocess", "debug", "profile")
+# Set only by the loader's tenant-scoped prefetch (file_details.py), never taken from the manifest
+PREFETCHED_FIELDS = ("originalS3File",)
+
+OBJECT_ID_RE = re.compile(r"^[0-9a-fA-F]{24}$")
+CHUNK_SIZE = 64 * 1024
+REJECTED_SAMPLE_SIZE = 20
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def is_jsonl(key):
+    return key.endswith(".jsonl")
+
+
+def dump_manifest(files, key, items_key="files"):
+    """Serialize items back into the format implied by key ({items_key: [...]} for JSON)."""
+    if is_jsonl(key):
+        return "\n".join(json.dumps(f) for f in files) + "\n"
+    return json.dumps({items_key: files})
+
+
+# ======================================================
+# 🌊 Streaming readers
+# ======================================================
+
+class _ChunkBuffer:
+    """Decodes UTF-8 chunks into a sliding text window for raw_decode."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self.text = self.text[self.pos:] + self._utf8.decode(b"", final=True)
+            self.pos = 0
+            self.eof = True
+            return False
+        # Drop what was already consumed so memory stays at about one chunk
+        self.text = self.text[self.pos:] + self._utf8.decode(chunk)
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character, or "" at the end of the stream."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if self.eof or not self._fill():
+                return ""
+
+    def take(self, allowed):
+        char = self.peek()
+        if char not in allowed or not char:
+            raise ValueError(f"Malformed manifest: expected one of {allowed!r}, got {char!r}")
+        self.pos += 1
+        return char
+
+    def value(self):
+        """Decode the next complete JSON value, reading more chunks as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.text, self.pos)
+                # A number at the end of the window may continue in the next chunk
+                if end < len(self.text) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def iter_json_entries(chunks):
+    """Yield the elements of the top-level "files" array of a JSON manifest."""
+    stream = _ChunkBuffer(chunks)
+    stream.take("{")
+    found = False
+
+    if stream.peek() == "}":
+        stream.pos += 1
+    else:
+        while True:
+            key = stream.value()
+            stream.take(":")
+            if key == "files" and stream.peek() == "[":
+                found = True
+                stream.take("[")
+                if stream.peek() == "]":
+                    stream.pos += 1
+                else:
+                    while True:
+                        yield stream.value()
+                        if stream.take(",]") == "]":
+                            break
+            else:
+                stream.value()  # unrelated key: decode and discard
+            if stream.take(",}") == "}":
+                break
+
+    if not found:
+        raise ValueError("Missing 'files' key in JSON")
+
+
+def iter_jsonl_entries(lines):
+    """Yield one entry per non-empty line of a JSON Lines manifest."""
+    for number, line in enumerate(lines, start=1):
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            # Keep going; validate_entry reports it with the line number
+            yield {"_error": f"line {number}: invalid JSON ({e.msg})"}
+
+
+def iter_manifest(body, key):
+    """Stream entries from an S3 StreamingBody (or anything with iter_chunks/iter_lines)."""
+    if is_jsonl(key):
+        return iter_jsonl_entries(body.iter_lines(chunk_size=CHUNK_SIZE))
+    return iter_json_entries(body.iter_chunks(chunk_size=CHUNK_SIZE))
+
+
+# ======================================================
+# ✅ Validation
+# ======================================================
+
+def validate_entry(entry):
+    """Return (normalized entry, None) or (None, reason)."""
+    if not isinstance(entry, dict):
+        return None, "entry is not an object"
+    if entry.get("_error"):
+        return None, entry["_error"]
+
+    missing = [f for f in REQUIRED_FIELDS if not entry.get(f)]
+    if missing:
+        return None, f"missing {', '.join(missing)}"
+
+    invalid = [f for f in ID_FIELDS if not OBJECT_ID_RE.match(str(entry[f]))]
+    if invalid:
+        return None, f"invalid ObjectId in {', '.join(invalid)}"
+
+    normalized = {f: str(entry[f]).lower() for f in ID_FIELDS}
+    for field in OPTIONAL_FIELDS:
+        normalized[field] = entry.get(field)
+    for field in PREFETCHED_FIELDS:
+        normalized[field] = None
+    return normalized, None
+
+
+def read_entries(entries):
+    """
+    Validate and de-duplicate a stream of entries (first fileId wins).
+    Returns (files, report).
+    """
+    files = []
+    seen = set()
+    rejected = []
+    received = duplicates = 0
+
+    for index, entry in enumerate(entries):
+        received += 1
+        normalized, reason = validate_entry(entry)
+        if reason:
+            rejected.append({"index": index, "fileId": entry.get("fileId") if isinstance(entry, dict) else None,
+                             "reason": reason})
+            continue
+        if normalized["fileId"] in seen:
+            duplicates += 1
+            continue
+        seen.add(normalized["fileId"])
+        files.append(normalized)
+
+    report = {
+        "received": received,
+        "valid": len(files),
+        "duplicates": duplicates,
+        "rejected": len(rejected),
+        "rejectedSample": rejected[:REJECTED_SAMPLE_SIZE],
+    }
+    return files, report
@@ -0,0 +1,167 @@
+import os
+import math
+import heapq
+import boto3
+from collections import defaultdict, deque
+
+from manifest import iter_manifest, dump_manifest
+import log
+
+s3 = boto3.client("s3")
+
+# Page estimate when the manifest carries neither pageCount nor sizeBytes
+DEFAULT_PAGES = int(os.getenv("SCHEDULE_DEFAULT_PAGES", "2"))
+BYTES_PER_PAGE = int(os.getenv("SCHEDULE_BYTES_PER_PAGE", "150000"))
+SCHEDULED_PREFIX = os.getenv("SCHEDULED_MANIFEST_PREFIX", "scheduled")
+
+
+def estimate_pages(item):
+    """Pages a file is expected to have: pageCount/pages, else sizeBytes, else DEFAULT_PAGES."""
+    for field in ("pageCount", "pages", "estimatedPages"):
+        try:
+            if item.get(field):
+                return max(int(item[field]), 1)
+        except (TypeError, ValueError):
+            pass
+    try:
+        if item.get("sizeBytes"):
+            return max(math.ceil(int(item["sizeBytes"]) / BYTES_PER_PAGE), 1)
+    except (TypeError, ValueError):
+        pass
+    return DEFAULT_PAGES
+
+
+def priority_of(item):
+    try:
+        return int(item.get("priority") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def tenant_of(item):
+    return f"{item.get('userId')}/{item.get('clusterId')}"
+
+
+def schedule(files, tenant_weights=None):
+    """
+    Order files for the Map state:
+    1. Priority: higher "priority" first, strictly between classes.
+    2. Fair share: inside a class, tenants (userId/clusterId) take turns in
+       proportion to estimated pages (start-time fair queuing), so one
+       tenant's 500-page batch cannot hold another tenant's 1-page BEO back.
+    3. Shortest first inside a tenant.
+    tenant_weights ({userId: weight}) gives a user a larger share.
+    """
+    tenant_weights = tenant_weights or {}
+    classes = defaultdict(lambda: defaultdict(list))
+    for index, item in enumerate(files):
+        classes[priority_of(item)][tenant_of(item)].append((estimate_pages(item), index, item))
+
+    ordered = []
+    for priority in sorted(classes, reverse=True):
+        queues = {
+            tenant: deque(sorted(items, key=lambda e: (e[0], e[1])))
+            for tenant, items in classes[priority].items()
+        }
+        # (virtual start time, first position in manifest, tenant)
+        heap = [(0.0, min(e[1] for e in queue), tenant) for tenant, queue in queues.items()]
+        heapq.heapify(heap)
+
+        while heap:
+            start, first_seen, tenant = heapq.heappop(heap)
+            pages, _, item = queues[tenant].popleft()
+            ordered.append(dict(item, estimatedPages=pages, priority=priority))
+            if queues[tenant]:
+                weight = float(tenant_weights.get(tenant.split("/")[0], 1.0)) or 1.0
+                heapq.heappush(heap, (start + pages / weight, first_seen, tenant))
+
+    return ordered
+
+
+def make_batches(ordered, small_file_pages=2, max_files=10, max_pages=10):
+    """
+    Group scheduled files into Map items {"batchId", "files"}.
+
+    Files estimated at small_file_pages or fewer share an item (up to
+    max_files files / max_pages pages), so one invocation pays the cold
+    start and connection setup for all of them; larger files get an item of
+    their own. A batch takes the position of its first file, so the
+    schedule order is kept.
+    """
+    batches = []
+    current = None
+    for item in ordered:
+        pages = item["estimatedPages"]
+        if pages > small_file_pages:
+            batches.append({"batchId": f"{len(batches):05d}", "files": [item]})
+            continue
+        if current is None or len(current["files"]) >= max_files or current["pages"] + pages > max_pages:
+            current = {"batchId": f"{len(batches):05d}", "files": [], "pages": 0}
+            batches.append(current)
+        current["files"].append(item)
+        current["pages"] += pages
+
+    for batch in batches:
+        batch.pop("pages", None)
+    return batches
+
+
+def describe(ordered):
+    tenants = {tenant_of(f) for f in ordered}
+    priorities = defaultdict(int)
+    for f in ordered:
+        priorities[str(f["priority"])] += 1
+    return {
+        "fileCount": len(ordered),
+        "tenants": len(tenants),
+        "estimatedPages": sum(f["estimatedPages"] for f in ordered),
+        "priorities": dict(priorities),
+    }
+
+
+def lambda_handler(event, context):
+    """
+    Scheduling stage between LoadFilesFromS3 and ProcessFiles.
+
+    INLINE Map (loader output):
+        {"files": [...]}  →  {"files": [...scheduled...], "schedule": {...}}
+
+    DISTRIBUTED Map (loader ran with validateOnly):
+        {"bucket": "...", "key": "..."}  →  writes the scheduled manifest to
+        s3://bucket/scheduled/<key> and returns {"bucket", "key", "fileCount", "schedule"}
+
+    With "batching" ({"smallFilePages", "maxFiles", "maxPages"}) the items are
+    batches of small files instead, returned/written under "batches".
+    """
+    weights = event.get("tenantWeights")
+    batching = event.get("batching")
+
+    if "files" in event:
+        ordered = schedule(event["files"], weights)
+    else:
+        obj = s3.get_object(Bucket=event["bucket"], Key=event["key"])
+        ordered = schedule(list(iter_manifest(obj["Body"], event["key"])), weights)
+    summary = describe(ordered)
+
+    items_key, items = "files", ordered
+    if batching:
+        items_key = "batches"
+        items = make_batches(
+            ordered,
+            small_file_pages=batching.get("smallFilePages", 2),
+            max_files=batching.get("maxFiles", 10),
+            max_pages=batching.get("maxPages", 10),
+        )
+        summary["batches"] = len(items)
+
+    if "files" in event:
+        log.info("scheduled", files=summary["fileCount"], tenants=summary["tenants"])
+        return {items_key: items, "schedule": summary}
+
+    bucket = event["bucket"]
+    scheduled_key = f"{SCHEDULED_PREFIX}/{event['key']}"
+    body = dump_manifest(items, event["key"], items_key)
+    s3.put_object(Bucket=bucket, Key=scheduled_key, Body=body.encode("utf-8"))
+    log.info("scheduled", files=summary["fileCount"], tenants=summary["tenants"], bucket=bucket, key=scheduled_key)
+
+    return {"bucket": bucket, "key": scheduled_key, "fileCount": len(ordered), "schedule": summary}
@@ -0,0 +1,126 @@
+import os
+import sys
+import json
+import time
+import threading
+from contextlib import contextmanager
+
+
+# ======================================================
+# ⏱️ Per-stage tracing spans
+# ======================================================
+#
+# Shared by BEO_S3_File_read, OCR_lambda1, beofinallambda2 and lambdabeoFAIL
+# (keep all copies identical). Each span is one JSON line on stdout, so it
+# lands in CloudWatch Logs next to the Lambda's other output:
+#
+#   {"type": "span", "span": "textract_poll", "parent": "ocr", "service": "ycbeoocrlambda1",
+#    "fileId": "...", "executionId": "...", "startedAt": 1718000000.123,
+#    "durationMs": 5012.4, "status": "ok", "pages": 3}
+#
+# fileId/executionId come from trace_context(), which the handlers open per
+# file (per thread in batch mode), so the spans of one file can be joined
+# across the four Lambdas. TRACE_EXPORTER=emf writes the same record in
+# CloudWatch Embedded Metric Format (DurationMs by service/span); "off"
+# disables tracing. TRACE_FILE appends the lines to a file instead of stdout.
+# trace_report.py computes per-stage p50/p95 from either format.
+
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "jsonl").lower()   # jsonl | emf | off
+TRACE_FILE = os.getenv("TRACE_FILE")
+TRACE_NAMESPACE = os.getenv("TRACE_NAMESPACE", "BEO/Pipeline")
+SERVICE = os.getenv("AWS_LAMBDA_FUNCTION_NAME", "local")
+
+_state = threading.local()
+_write_lock = threading.Lock()
+_sinks = []
+
+
+def _context():
+    if not hasattr(_state, "context"):
+        _state.context = {}
+        _state.stack = []
+    return _state.context
+
+
+def current_context():
+    """The attributes set by the enclosing trace_context() blocks (used by log.py)."""
+    return dict(_context())
+
+
+def add_sink(sink):
+    """Also pass every span dict to sink(span) (used by local_runner.py)."""
+    _sinks.append(sink)
+
+
+def _emf(record):
+    return dict(record, _aws={
+        "Timestamp": int(record["startedAt"] * 1000),
+        "CloudWatchMetrics": [{
+            "Namespace": TRACE_NAMESPACE,
+            "Dimensions": [["service", "span"]],
+            "Metrics": [{"Name": "DurationMs", "Unit": "Milliseconds"}],
+        }],
+    }, DurationMs=record["durationMs"])
+
+
+def export(record):
+    for sink in _sinks:
+        sink(record)
+    line = json.dumps(_emf(record) if TRACE_EXPORTER == "emf" else record, default=str)
+    with _write_lock:
+        if TRACE_FILE:
+            with open(TRACE_FILE, "a") as f:
+                f.write(line + "\n")
+        else:
+            sys.stdout.write(line + "\n")
+
+
+@contextmanager
+def trace_context(**attributes):
+    """Attach fileId/executionId (or any attribute) to the spans opened inside the block."""
+    context = _context()
+    previous = dict(context)
+    context.update({k: v for k, v in attributes.items() if v is not None})
+    try:
+        yield context
+    finally:
+        context.clear()
+        context.update(previous)
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Time the block as one span. Yields a dict; keys added to it (e.g. pages)
+    are exported with the span. Exceptions are recorded and re-raised.
+    """
+    if TRACE_EXPORTER == "off":
+        yield {}
+        return
+
+    context = _context()
+    stack = _state.stack
+    extra = dict(attributes)
+    record = {
+        "type": "span",
+        "span": name,
+        "parent": stack[-1] if stack else None,
+        "service": SERVICE,
+        **context,
+        "startedAt": round(time.time(), 3),
+    }
+    started = time.perf_counter()
+    stack.append(name)
+    try:
+        yield extra
+        record["status"] = "ok"
+    except BaseException as e:
+        record["status"] = "error"
+        record["error"] = type(e).__name__
+        raise
+    finally:
+        stack.pop()
+        record["durationMs"] = round((time.perf_counter() - started) * 1000, 1)
+        record.update(extra)
+        export(record)
+
@@ -22,3 +22,8 @@ AZURE_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
 AZURE_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
 AZURE_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION")
 AZURE_DEPLOYMENT = os.getenv("AZURE_OPENAI_DEPLOYMENT")
+
+# Textract job lease (tb_textract_jobs claims)
+TEXTRACT_LEASE_SECONDS = int(os.getenv("TEXTRACT_LEASE_SECONDS", "60"))
+TEXTRACT_HEARTBEAT_SECONDS = int(os.getenv("TEXTRACT_HEARTBEAT_SECONDS", "20"))
+TEXTRACT_FOLLOWER_WAIT_SECONDS = int(os.getenv("TEXTRACT_FOLLOWER_WAIT_SECONDS", "600"))
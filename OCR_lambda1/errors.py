@@ -0,0 +1,134 @@
+import functools
+import threading
+from collections import Counter
+
+from botocore.exceptions import (
+    ClientError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError,
+)
+from pymongo.errors import ConnectionFailure, ExecutionTimeout, PyMongoError
+
+
+# ======================================================
+# 🚦 Retryable vs terminal errors
+# ======================================================
+#
+# Shared by OCR_lambda1 and beofinallambda2 (keep both copies identical).
+# Lambda reports the exception class name as the Step Functions error, so
+# the state machine retries "RetryableError" in place (see the "retry"
+# policies in stepfunction_builder.py) and sends everything else to FailLambda.
+#
+# The definition passes "retryCount" ($$.State.RetryCount) and "maxRetries"
+# to each task; once they are equal no retry is left and handlers fall back
+# to their terminal path (e.g. releasing the reserved credit).
+
+RETRYABLE_AWS_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ProvisionedThroughputExceededException",
+    "LimitExceededException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "SlowDown",
+    "RequestTimeout",
+    "InternalServerError",
+    "InternalError",
+    "ServiceUnavailable",
+}
+
+RETRYABLE_MONGO_LABELS = ("TransientTransactionError", "RetryableWriteError")
+
+THROTTLE_AWS_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "ProvisionedThroughputExceededException",
+    "LimitExceededException",
+    "RequestLimitExceeded",
+    "TooManyRequestsException",
+    "SlowDown",
+}
+
+
+class RetryableError(Exception):
+    """Transient failure (throttling, timeouts, 5xx); the whole task is safe to re-run."""
+
+    retryable = True
+
+
+class TerminalError(Exception):
+    """Failure that will not go away on retry (bad input, missing file, rejected document)."""
+
+    retryable = False
+
+
+def is_retryable(exc) -> bool:
+    """Classify an exception raised by AWS, MongoDB or our own code."""
+    if isinstance(exc, (RetryableError, TerminalError)):
+        return exc.retryable
+
+    if isinstance(exc, ClientError):
+        error = exc.response.get("Error", {})
+        status = exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return error.get("Code") in RETRYABLE_AWS_CODES or status >= 500
+
+    if isinstance(exc, (EndpointConnectionError, ConnectTimeoutError, ReadTimeoutError)):
+        return True
+
+    if isinstance(exc, (ConnectionFailure, ExecutionTimeout)):
+        return True
+    if isinstance(exc, PyMongoError):
+        return any(exc.has_error_label(label) for label in RETRYABLE_MONGO_LABELS)
+
+    return False
+
+
+def is_throttle(exc) -> bool:
+    """True for AWS throttling responses (a subset of the retryable errors)."""
+    return isinstance(exc, ClientError) and exc.response.get("Error", {}).get("Code") in THROTTLE_AWS_CODES
+
+
+# --- Throttle counters (read by JobStatusRecorder, see concurrency_controller.py) ---
+# Thread-local so files processed on different threads are counted separately.
+
+_throttles = threading.local()
+
+
+def record_throttle(source: str, count: int = 1):
+    """Count a 429/ThrottlingException from a downstream service (e.g. "textract")."""
+    counter = getattr(_throttles, "counter", None)
+    if counter is None:
+        counter = _throttles.counter = Counter()
+    counter[source] += count
+
+
+def drain_throttles() -> dict:
+    """Return and reset the throttle counts recorded on this thread."""
+    counter = getattr(_throttles, "counter", None)
+    _throttles.counter = Counter()
+    return dict(counter or {})
+
+
+def retries_remaining(event) -> bool:
+    """True while the state machine will run this task again on RetryableError."""
+    return int(event.get("retryCount") or 0) < int(event.get("maxRetries") or 0)
+
+
+def surface_retryable(handler):
+    """
+    lambda_handler decorator: while retries remain, re-raise transient
+    exceptions as RetryableError so Step Functions retries the task instead
+    of routing the file to FailLambda.
+    """
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        try:
+            return handler(event, context)
+        except RetryableError:
+            raise
+        except Exception as e:
+            if retries_remaining(event) and is_retryable(e):
+                raise RetryableError(f"{type(e).__name__}: {e}") from e
+            raise
+    return wrapper
@@ -1,15 +1,27 @@
 import os
 import time
+import threading
 from typing import Tuple, List, Union
 import boto3
 from mongo import (
     try_claim_processing,
+    takeover_stale_lease,
+    renew_lease,
+    release_lease,
+    lease_expired,
+    wait_for_job_result,
     fetch_job_record,
     set_job_started,
     set_job_succeeded,
     set_job_failed,
-    get_textract_job_collection
+    record_api_calls,
 )
+from config import TEXTRACT_HEARTBEAT_SECONDS, TEXTRACT_FOLLOWER_WAIT_SECONDS
+from errors import RetryableError, TerminalError, is_retryable, is_throttle, record_throttle
+from textract_calls import TextractCallCounter
+from tracing import span
+from memprofile import stage
+import log
 from datetime import datetime, timezone
 from trp import Document
 from botocore.exceptions import ClientError
@@ -36,21 +48,35 @@ S3_SOURCE_REGION = "ap-south-1"
 # S3 / Textract Helpers
 # ============================================================
 
+# boto3 clients are thread-safe once created (creating them is not), so one
+# client per service/region is shared by warm invocations and batch workers
+_regional_clients = {}
+_regional_clients_lock = threading.Lock()
+
+
+def regional_client(service: str, region: str):
+    with _regional_clients_lock:
+        client = _regional_clients.get((service, region))
+        if client is None:
+            client = _regional_clients[(service, region)] = boto3.client(service, region_name=region)
+        return client
+
+
 def get_random_textract_client():
     """Select a random AWS region for Textract and return client + temp bucket name."""
     region = S3_SOURCE_REGION
-    print(f"🌍 Using Textract in region: {region}")
-    textract = boto3.client("textract", region_name=region)
+    log.debug("textract_region", region=region)
+    textract = regional_client("textract", region)
     temp_bucket = f"{TEMP_BUCKET_PREFIX}{region}"
     return textract, region, temp_bucket
 
 
 def copy_to_temp_bucket(source_bucket: str, source_key: str, temp_bucket: str, region: str) -> Optional[str]:
     """Copy file to temporary bucket in the same region."""
-    s3_dest = boto3.client("s3", region_name=region)
+    s3_dest = regional_client("s3", region)
     try:
         temp_key = f"{uuid4().hex}_{source_key.split('/')[-1]}"
-        print(f"📤 Copying file to temp bucket: s3://{temp_bucket}/{temp_key}")
+        log.debug("s3_copy", bucket=temp_bucket, key=temp_key)
         s3_dest.copy_object(
             Bucket=temp_bucket,
             CopySource={"Bucket": source_bucket, "Key": source_key},
@@ -58,10 +84,14 @@ def copy_to_temp_bucket(source_bucket: str, source_key: str, temp_bucket: str, r
         )
         return temp_key
     except ClientError as e:
-        print(f"⚠️ S3 ClientError: {e}")
+        log.warning("s3_copy_failed", error=str(e))
+        if is_throttle(e):
+            record_throttle("s3")
+        if is_retryable(e):
+            raise RetryableError(f"S3 copy throttled: {e}") from e
         return None
     except Exception as e:
-        print(f"⚠️ Unexpected S3 copy error: {e}")
+        log.warning("s3_copy_failed", error=f"{type(e).__name__}: {e}")
         return None
 
 
@@ -70,57 +100,10 @@ def cleanup_temp_bucket(temp_bucket: str, temp_key: Optional[str], region: str):
     if not temp_key:
         return
     try:
-        print(f"🗑️ Cleaning up temp file: s3://{temp_bucket}/{temp_key}")
-        boto3.client("s3", region_name=region).delete_object(Bucket=temp_bucket, Key=temp_key)
-    except Exception as e:
-        print(f"⚠️ Cleanup failed: {e}")
-
-
-def poll_existing_job(textract_client, job_id: str, wait_time: int = 5, max_wait_minutes: int = 20):
-    """Poll an existing Textract job until completion or timeout. Used when another worker has already started the same job."""
-    print(f"🔁 Polling Textract job {job_id} (max {max_wait_minutes} min)")
-    elapsed = 0
-    job_output = None
-    status = "IN_PROGRESS"
-    try:
-        while elapsed < max_wait_minutes * 60:
-            resp = textract_client.get_document_analysis(JobId=job_id)
-            status = resp.get("JobStatus", status)
-            print(f"... Job {job_id} → {status}")
-            if status in ["SUCCEEDED", "FAILED"]:
-                job_output = resp
-                break
-            time.sleep(wait_time)
-            elapsed += wait_time
-
-        if status != "SUCCEEDED":
-            raise Exception(f"Job {job_id} did not succeed (status: {status})")
-
-        # Collect all pages if succeeded
-        results = job_output.get("Blocks", [])
-        next_token = job_output.get("NextToken")
-        while next_token:
-            next_resp = textract_client.get_document_analysis(JobId=job_id, NextToken=next_token)
-            results.extend(next_resp.get("Blocks", []))
-            next_token = next_resp.get("NextToken")
-
-        textract_json = {
-            "Blocks": results,
-            "DocumentMetadata": job_output.get("DocumentMetadata", {})
-        }
-        normalized_data = normalize_textract_response(textract_json)
-        page_count = textract_json["DocumentMetadata"].get("Pages", 0)
-        final_output = {
-            "page_count": page_count,
-            "normalized_data": normalized_data,
-            "raw_textract": textract_json
-        }
-        print(f"✅ Finished polling existing job {job_id}")
-        return final_output
-
+        log.debug("s3_cleanup", bucket=temp_bucket, key=temp_key)
+        regional_client("s3", region).delete_object(Bucket=temp_bucket, Key=temp_key)
     except Exception as e:
-        print(f"❌ Error polling job {job_id}: {e}")
-        raise
+        log.warning("s3_cleanup_failed", error=str(e))
 
 
 # ============================================================
@@ -136,9 +119,6 @@ def normalize_textract_response(textract_output: Dict[str, Any]) -> Dict[str, An
         "lines": [...]
     }
     """
-    
-
-    print("🔄 Normalizing Textract JSON using TRP (tables + lines)...")
     doc = Document(textract_output)
     normalized = {"tables": [], "lines": []}
 
@@ -158,10 +138,7 @@ def normalize_textract_response(textract_output: Dict[str, Any]) -> Dict[str, An
             if line.text and line.text.strip():
                 normalized["lines"].append(line.text.strip())
 
-    print(
-        f"✅ Normalization complete: {len(normalized['tables'])} tables, "
-        f"{len(normalized['lines'])} lines"
-    )
+    log.debug("normalized", tables=len(normalized["tables"]), lines=len(normalized["lines"]))
     return normalized
 
 
@@ -170,116 +147,127 @@ def normalize_textract_response(textract_output: Dict[str, Any]) -> Dict[str, An
 # Main Orchestrator
 # ============================================================
 
-def run_textract(bucket: str, key: str, file_id: str, textract_client, temp_bucket: str, region: str) -> Dict[str, Any]:
+def run_textract(bucket: str, key: str, file_id: str, textract_client, temp_bucket: str, region: str,
+                 raise_retryable: bool = False) -> Dict[str, Any]:
     """Distributed-safe Textract runner:
-    - Uses Mongo locking (_id = fileId)
+    - Uses a Mongo lease (_id = fileId, leaseExpiresAt + owner heartbeats)
     - Reuses completed jobs when available
+    - Takes over stale leases with a compare-and-swap (resuming the jobId)
     - Avoids duplicate concurrent processing
+    - raise_retryable: throttling/timeouts raise RetryableError (lease released,
+      jobId kept); any other failure, or any failure once retries are
+      exhausted, fails the job and raises TerminalError
     """
     temp_key = None
     owner_id = str(uuid4())[:8]
-    col = get_textract_job_collection()  # ✅ initialize collection once
+    job_id = None
+    textract_client = TextractCallCounter(textract_client)
+    calls = textract_client.counts
 
     try:
         # --- Try to claim (acts as distributed lock) ---
-        claimed = try_claim_processing(file_id, owner_id)
+        with span("claim"):
+            claimed = try_claim_processing(file_id, owner_id)
         if not claimed:
             # Another process already created the record
             existing = fetch_job_record(file_id)
-            if existing:
-                status = existing.get("status")
-                print(f"ℹ️ Existing Textract job found for {file_id}: {status}")
-                if status == "SUCCEEDED":
-                    print("✅ Using cached Textract result from Mongo")
-                    
-                    return existing.get("result", {})
-                
-                elif status in ["IN_PROGRESS", "CLAIMED"]:
-                    job_id = existing.get("jobId")
-                    if not job_id:
-                        print("⏳ Waiting for jobId to be set...")
-                        for _ in range(10):
-                            time.sleep(3)
-                            existing = fetch_job_record(file_id)
-                            job_id = existing.get("jobId")
-                            if job_id:
-                                break
-                    if job_id:
-                        print(f"⏳ Polling existing JobId: {job_id}")
-                        result = poll_existing_job(textract_client, job_id)
-                        return result
-                    else:
-                        raise Exception("Job already claimed but no JobId yet (timeout)")
-                    
-                elif status == "FAILED":
-                    print("⚠️ Retrying after previous failed attempt")
-
-                    # Instead of trying to insert again, update existing record
-                    col.update_one(
-                        {"_id": file_id},
-                        {
-                            "$set": {
-                                "status": "CLAIMED",
-                                "owner": owner_id,
-                                "jobId": None,
-                                "result": None,
-                                "updatedAt": datetime.utcnow()
-                            },
-                            "$inc": {"attempts": 1}
-                        }
-                    )
-                    print(f"🔁 Re-claimed file {file_id} after failure")
-
-            else:
+            if not existing:
                 raise Exception("Could not find or claim textract_jobs record.")
 
-        # --- This process is the new owner ---
-        temp_key = copy_to_temp_bucket(bucket, key, temp_bucket, region)
-        if not temp_key:
-            raise Exception("Failed to copy to temp bucket")
-
-        print("📄 Starting Textract Document Analysis...")
-        start_resp = textract_client.start_document_analysis(
-            DocumentLocation={"S3Object": {"Bucket": temp_bucket, "Name": temp_key}},
-            FeatureTypes=["TABLES"],
-        )
-        job_id = start_resp["JobId"]
-        print(f"🎯 Job ID: {job_id}")
+            status = existing.get("status")
+            log.info("textract_job_exists", status=status)
+            if status == "SUCCEEDED":
+                return existing.get("result", {})
+
+            if status in ["IN_PROGRESS", "CLAIMED"] and not lease_expired(existing):
+                # Follower: subscribe to the owner's record; only the owner talks to Textract
+                log.info("textract_follow", owner=existing.get("owner"), jobId=existing.get("jobId"))
+                calls["followerWaits"] += 1
+                with span("follower_wait"):
+                    existing = wait_for_job_result(file_id, timeout=TEXTRACT_FOLLOWER_WAIT_SECONDS)
+                if existing is None:
+                    # The record was deleted while we followed it: claim it afresh
+                    log.info("textract_follow_lost")
+                    with span("claim"):
+                        claimed = try_claim_processing(file_id, owner_id)
+                else:
+                    status = existing.get("status")
+                    if status == "SUCCEEDED":
+                        return existing.get("result", {})
+                    if status in ["IN_PROGRESS", "CLAIMED"] and not lease_expired(existing):
+                        raise RetryableError(f"Timed out following Textract job for {file_id}")
 
-        # Save job start
-        set_job_started(file_id, job_id)
-
-        # Poll for completion
+        if not claimed:
+            # --- Owner crashed (stale lease) or last attempt failed: compare-and-swap takeover ---
+            with span("claim", takeover=True):
+                previous = takeover_stale_lease(file_id, owner_id)
+            if not previous:
+                raise RetryableError("Job already claimed but no JobId yet (lease still held)")
+            if previous.get("status") == "IN_PROGRESS" and previous.get("jobId"):
+                job_id = previous["jobId"]
+                calls["resumes"] += 1
+                log.info("textract_resume", jobId=job_id, previousOwner=previous.get("owner"))
+
+        # --- This process is the lease owner ---
+        if not job_id:
+            with span("s3_copy"):
+                temp_key = copy_to_temp_bucket(bucket, key, temp_bucket, region)
+            if not temp_key:
+                raise Exception("Failed to copy to temp bucket")
+
+            with span("textract_start"):
+                start_resp = textract_client.start_document_analysis(
+                    DocumentLocation={"S3Object": {"Bucket": temp_bucket, "Name": temp_key}},
+                    FeatureTypes=["TABLES"],
+                )
+            job_id = start_resp["JobId"]
+            log.info("textract_started", jobId=job_id, region=region)
+
+            # Save job start
+            if not set_job_started(file_id, job_id, owner_id):
+                raise Exception("Lost Textract lease before recording JobId")
+
+        # Poll for completion, heartbeating the lease
         status = "IN_PROGRESS"
         job_output = None
-        while status == "IN_PROGRESS":
-            time.sleep(5)
-            resp = textract_client.get_document_analysis(JobId=job_id)
-            status = resp.get("JobStatus", status)
-            print(f"... Status: {status}")
-            if status in ["SUCCEEDED", "FAILED"]:
-                job_output = resp
-                break
+        last_heartbeat = time.monotonic()
+        with span("textract_poll") as poll:
+            polls = 0
+            while status == "IN_PROGRESS":
+                time.sleep(5)
+                if time.monotonic() - last_heartbeat >= TEXTRACT_HEARTBEAT_SECONDS:
+                    if not renew_lease(file_id, owner_id):
+                        raise Exception("Lost Textract lease to another worker")
+                    last_heartbeat = time.monotonic()
+                resp = textract_client.get_document_analysis(JobId=job_id)
+                polls += 1
+                status = resp.get("JobStatus", status)
+                log.debug("textract_poll", jobId=job_id, status=status, poll=polls)
+                if status in ["SUCCEEDED", "FAILED"]:
+                    job_output = resp
+                    break
+            poll["polls"] = polls
 
         if status != "SUCCEEDED":
-            set_job_failed(file_id, f"Textract job failed: {status}")
             raise Exception(f"Textract failed with status {status}")
 
         # Collect all pages
-        results = job_output.get("Blocks", [])
-        next_token = job_output.get("NextToken")
-        while next_token:
-            next_resp = textract_client.get_document_analysis(JobId=job_id, NextToken=next_token)
-            results.extend(next_resp.get("Blocks", []))
-            next_token = next_resp.get("NextToken")
+        with span("textract_results"), stage("textract_results"):
+            results = job_output.get("Blocks", [])
+            next_token = job_output.get("NextToken")
+            while next_token:
+                next_resp = textract_client.get_document_analysis(JobId=job_id, NextToken=next_token)
+                results.extend(next_resp.get("Blocks", []))
+                next_token = next_resp.get("NextToken")
 
         textract_json = {
             "Blocks": results,
             "DocumentMetadata": job_output.get("DocumentMetadata", {})
         }
 
-        normalized_data = normalize_textract_response(textract_json)
-        
+        with span("normalize", blocks=len(results)), stage("normalize"):
+            normalized_data = normalize_textract_response(textract_json)
+
         page_count = textract_json["DocumentMetadata"].get("Pages", 0)
         final_output = {
             "page_count": page_count,
@@ -287,15 +275,26 @@ def run_textract(bucket: str, key: str, file_id: str, textract_client, temp_buck
             "raw_textract": textract_json
         }
 
-        set_job_succeeded(file_id, final_output, page_count)
-        print("✅ Textract job succeeded and stored in Mongo")
+        with span("mongo_write", collection="tb_textract_jobs"), stage("mongo_write"):
+            if not set_job_succeeded(file_id, final_output, page_count, owner_id):
+                # Taken over while finishing: the new owner records its own result
+                log.warning("textract_lease_lost", jobId=job_id)
+        log.info("textract_succeeded", jobId=job_id, pages=page_count, blocks=len(results))
         return final_output
 
     except Exception as e:
-        print(f"❌ run_textract_with_lock error: {e}")
-        traceback.print_exc()
-        set_job_failed(file_id, str(e))
-        return {}
+        log.error("textract_failed", jobId=job_id, error=f"{type(e).__name__}: {e}",
+                  traceback=traceback.format_exc())
+        if is_throttle(e):
+            record_throttle("textract")
+        if raise_retryable and is_retryable(e):
+            release_lease(file_id, owner_id)
+            raise RetryableError(f"Textract: {e}") from e
+        set_job_failed(file_id, str(e), owner_id)
+        raise TerminalError(f"Textract: {type(e).__name__}: {e}") from e
 
     finally:
         cleanup_temp_bucket(temp_bucket, temp_key, region)
+        if calls:
+            log.info("textract_calls", jobId=job_id, **calls)
+            record_api_calls(file_id, calls)
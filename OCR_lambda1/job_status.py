@@ -0,0 +1,150 @@
+import os
+import time
+from datetime import datetime, timezone
+
+from pymongo.errors import PyMongoError
+
+from errors import drain_throttles
+import log
+
+
+# ======================================================
+# 🧭 Write-behind Job Status Recorder
+# ======================================================
+#
+# Shared by OCR_lambda1 and beofinallambda2 (keep both copies identical).
+# One job_status document per file, keyed by job_id (unique index, see
+# ensure_indexes; the Lambdas create it at cold start):
+# {
+#     "job_id": "<fileId>",
+#     "status": "completed",
+#     "stages": {
+#         "ocr":        {"startedAt": ..., "completedAt": ...},
+#         "structured": {"startedAt": ..., "failedAt": ...}
+#     },
+#     "transitions": [{"stage", "status", "message", "data", "at"}, ...],
+#     "invocations": [{"stage", "executionId", "status", "startedAt",
+#                      "durationMs", "throttles": {"textract": 2}}, ...]
+# }
+#
+# "invocations" has one entry per handler run (retries included) and feeds
+# the throttle rate / p95 signals of concurrency_controller.py. Both arrays
+# keep only their latest entries ($slice), so a file that is retried or
+# redriven many times does not grow its document without bound.
+
+JOB_STATUS_MAX_TRANSITIONS = int(os.getenv("JOB_STATUS_MAX_TRANSITIONS", "50"))
+JOB_STATUS_MAX_INVOCATIONS = int(os.getenv("JOB_STATUS_MAX_INVOCATIONS", "20"))
+JOB_STATUS_COLLECTION = "job_status"
+
+
+def ensure_indexes(db):
+    """
+    Unique job_id index for the recorder's upserts: without it every flush
+    scans job_status and two first flushes of one file can insert two
+    documents. Idempotent; never raises.
+    """
+    try:
+        db[JOB_STATUS_COLLECTION].create_index([("job_id", 1)], unique=True)
+        return True
+    except PyMongoError as e:
+        log.warning("job_status_index_failed", error=str(e))
+        return False
+
+
+class JobStatusRecorder:
+    """
+    Buffers job-status transitions in memory and writes them in a single
+    upsert when the invocation ends (flush), instead of one write per update.
+
+    Usable as a context manager: an exception escaping the block records a
+    'failed' transition for the stage ('retrying' for retryable errors,
+    see errors.py) before flushing. The block is timed and, together with
+    the throttles counted through errors.record_throttle, written as an
+    "invocations" entry.
+    """
+
+    def __init__(self, collection, job_id, stage, **attributes):
+        self.collection = collection
+        self.job_id = str(job_id)
+        self.stage = stage
+        self.attributes = {k: v for k, v in attributes.items() if v is not None}
+        self.transitions = []
+        self.invocation = None
+
+    def record(self, status, message=None, data=None, stage=None):
+        """Buffer a transition; nothing is written until flush()."""
+        self.transitions.append({
+            "stage": stage or self.stage,
+            "status": status,
+            "message": message,
+            "data": data,
+            "at": datetime.now(timezone.utc),
+        })
+        log.info("job_status", stage=stage or self.stage, status=status, message=message)
+
+    def build_update(self):
+        """Combine the buffered transitions into one upsert document."""
+        last = self.transitions[-1]
+        to_set = {
+            "status": last["status"],
+            "stage": last["stage"],
+            "message": last["message"],
+            "updatedAt": last["at"],
+        }
+        for key, value in self.attributes.items():
+            to_set[key] = value
+
+        # Per-stage timestamps, e.g. stages.ocr.completedAt
+        for t in self.transitions:
+            to_set[f"stages.{t['stage']}.{t['status']}At"] = t["at"]
+
+        push = {"transitions": {"$each": self.transitions, "$slice": -JOB_STATUS_MAX_TRANSITIONS}}
+        if self.invocation:
+            push["invocations"] = {"$each": [self.invocation], "$slice": -JOB_STATUS_MAX_INVOCATIONS}
+
+        return {
+            "$set": to_set,
+            "$setOnInsert": {"job_id": self.job_id, "createdAt": self.transitions[0]["at"]},
+            "$push": push,
+        }
+
+    def _finish_invocation(self):
+        started = self.invocation.pop("_started")
+        self.invocation.update({
+            "status": self.transitions[-1]["status"] if self.transitions else None,
+            "durationMs": round((time.perf_counter() - started) * 1000, 1),
+            "throttles": drain_throttles(),
+        })
+
+    def flush(self):
+        """Write all buffered transitions in one upsert; never raises."""
+        if not self.transitions:
+            return None
+
+        try:
+            result = self.collection.update_one(
+                {"job_id": self.job_id}, self.build_update(), upsert=True
+            )
+            self.transitions = []
+            self.invocation = None
+            return result
+        except PyMongoError as e:
+            log.warning("job_status_flush_failed", jobId=self.job_id, error=str(e))
+            return None
+
+    def __enter__(self):
+        drain_throttles()  # drop counts left over from a previous invocation
+        self.invocation = {
+            "stage": self.stage,
+            "executionId": self.attributes.get("executionId"),
+            "startedAt": datetime.now(timezone.utc),
+            "_started": time.perf_counter(),
+        }
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.record("retrying" if getattr(exc, "retryable", False) else "failed", str(exc))
+        self._finish_invocation()
+        self.flush()
+        return False
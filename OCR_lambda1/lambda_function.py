@@ -5,6 +5,14 @@ from bson import ObjectId
 from pymongo import MongoClient
 from datetime import datetime, timezone
 from extract_text import run_textract , get_random_textract_client
+from job_status import JOB_STATUS_COLLECTION, JobStatusRecorder, ensure_indexes
+from payload_store import store_text
+from errors import TerminalError, surface_retryable, retries_remaining
+from batch import is_batch, run_batch
+from tracing import span, trace_context
+from memprofile import profile, stage
+from sampler import sampled
+import log
 
 
 
@@ -15,6 +23,8 @@ MONGO_DB = os.getenv("MONGO_DATABASE")
 mongo_client = MongoClient(MONGO_URI)
 db =  mongo_client[MONGO_DB]
 col_files = db["tb_file_details"]
+col_job_status = db[JOB_STATUS_COLLECTION]
+ensure_indexes(db)
 
 
 
@@ -53,7 +63,21 @@ def structure_textract_output(data):
     
     return "\n".join(structured)
 
+@surface_retryable
 def lambda_handler(event, context):
+    # Batch of small files (see batch.py): per-file results, failures isolated
+    if is_batch(event):
+        return run_batch(process_file, event)
+    return process_file(event)
+
+
+def process_file(event):
+    with trace_context(fileId=event.get("fileId"), executionId=event.get("executionId")), \
+            log.request(event), span("ocr"), profile(), sampled(event):
+        return _process_file(event)
+
+
+def _process_file(event):
 
     fileId = event["fileId"]
     userId = event["userId"]
@@ -67,47 +91,75 @@ def lambda_handler(event, context):
     cluster_oid = ObjectId(clusterId)
     credit_oid = ObjectId(creditId)
 
-    # Fetch mongo document
-    file_doc = col_files.find_one(
-        {"_id": file_oid, "clusterId": cluster_oid, "userId": user_oid},
-        {"originalS3File": 1}
+    # --- Job status is buffered and written once when the block exits ---
+    job_status = JobStatusRecorder(
+        col_job_status, fileId, "ocr",
+        fileId=file_oid, userId=user_oid, clusterId=cluster_oid,
+        executionId=event.get("executionId")
     )
 
-    if not file_doc:
-        return {"error": "File not found in MongoDB"}
+    with job_status:
+        job_status.record("started", "Starting OCR")
 
-    originalS3File = file_doc.get("originalS3File")
-    if not originalS3File:
-        return {"error": "Missing originalS3File in DB"}
+        # Only the loader's prefetch sets originalS3File, after checking the file belongs to
+        # userId/clusterId; without it, look the file up here with the same ownership filter
+        originalS3File = event.get("originalS3File")
+        if not originalS3File:
+            with span("mongo_read", collection="tb_file_details"):
+                file_doc = col_files.find_one(
+                    {"_id": file_oid, "clusterId": cluster_oid, "userId": user_oid},
+                    {"originalS3File": 1}
+                )
 
-    local_path = f"/tmp/{originalS3File}"
+            if not file_doc:
+                raise TerminalError("File not found in MongoDB")
 
-    # cleanup old file
-    if os.path.exists(local_path):
-        os.remove(local_path)
+            originalS3File = file_doc.get("originalS3File")
 
-    # S3 download path
-    s3_key = f"{userId}/{clusterId}/raw/{originalS3File}"
+        if not originalS3File:
+            raise TerminalError("Missing originalS3File in DB")
 
-    textract_client, region, temp_bucket = get_random_textract_client()
+        local_path = f"/tmp/{originalS3File}"
 
-    # Run Textract
-    extraction_result = run_textract(
-        S3_BUCKET_NAME, s3_key, file_oid, textract_client, temp_bucket, region
-    )
+        # cleanup old file
+        if os.path.exists(local_path):
+            os.remove(local_path)
+
+        # S3 download path
+        s3_key = f"{userId}/{clusterId}/raw/{originalS3File}"
+
+        textract_client, region, temp_bucket = get_random_textract_client()
+
+        # Run Textract (throttling is retried by the state machine while retries remain)
+        extraction_result = run_textract(
+            S3_BUCKET_NAME, s3_key, file_oid, textract_client, temp_bucket, region,
+            raise_retryable=retries_remaining(event)
+        )
+        if not extraction_result:
+            raise TerminalError("Textract returned no result")
+
+        pages = extraction_result.get("page_count", 0)
+        raw_tables = extraction_result.get("normalized_data", {}).get("tables", [])
+        raw_lines = extraction_result.get("normalized_data", {}).get("lines", [])
+
+        with stage("structure"):
+            tables = structure_textract_output(raw_tables)
+            text_content = f"{tables}\n\nRAW_LINES\n" + "\n".join(raw_lines)
+        log.payload("ocr_text", text_content, pages=pages)
 
-    pages = extraction_result.get("page_count", 0)
-    raw_tables = extraction_result.get("normalized_data", {}).get("tables", [])
-    raw_lines = extraction_result.get("normalized_data", {}).get("lines", [])
+        job_status.record("completed", f"OCR finished ({pages} pages)", {"pages": pages})
 
-    tables = structure_textract_output(raw_tables)
-    text_content = f"{tables}\n\nRAW_LINES\n" + "\n".join(raw_lines)
+    # Large text goes to S3; the state payload carries only a pointer
+    with span("payload_store"), stage("payload_store"):
+        payload = store_text(text_content, fileId)
 
     return {
         "pages": pages,
-        "text_content": text_content,
+        "text_content": payload["text_content"],
+        "text_ref": payload["text_ref"],
         "fileId": fileId,
         "userId": userId,
         "clusterId": clusterId,
-        "creditId": creditId
+        "creditId": creditId,
+        "sourceETag": event.get("sourceETag")
     }
@@ -0,0 +1,104 @@
+import os
+import sys
+import time
+import random
+import threading
+from contextlib import contextmanager
+
+from tracing import SERVICE, current_context
+
+try:
+    import orjson
+
+    def _dumps(record):
+        return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    import json
+
+    def _dumps(record):
+        return json.dumps(record, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+# ======================================================
+# 📝 Structured logging
+# ======================================================
+#
+# Shared by BEO_S3_File_read, OCR_lambda1, beofinallambda2 and lambdabeoFAIL
+# (keep all copies identical). One JSON line per message, tagged with the
+# fileId/executionId of the enclosing trace_context():
+#
+#   {"level": "INFO", "msg": "textract_started", "service": "ycbeoocrlambda1",
+#    "fileId": "...", "executionId": "...", "ts": 1718000000.123, "jobId": "..."}
+#
+# Messages below LOG_LEVEL cost one comparison: fields passed as callables
+# (e.g. size=lambda: len(body)) are only evaluated when the line is written.
+# A request with "debug": true in its event (per manifest entry, or for the
+# whole run in the execution input) logs at DEBUG and also writes payload
+# dumps (log.payload); LOG_DEBUG_SAMPLE_RATE logs that fraction of requests
+# at DEBUG without payloads. High-volume messages can pass sample=0.1.
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+LOG_LEVEL = LEVELS.get(os.getenv("LOG_LEVEL", "INFO").upper(), 20)
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0"))
+
+_state = threading.local()
+_write_lock = threading.Lock()
+
+
+def _level():
+    return getattr(_state, "level", LOG_LEVEL)
+
+
+@contextmanager
+def request(event):
+    """Apply the event's debug flag (and debug sampling) to the messages logged inside the block."""
+    previous = (_level(), getattr(_state, "payloads", False))
+    debug = bool(event.get("debug"))
+    if debug or random.random() < LOG_DEBUG_SAMPLE_RATE:
+        _state.level = LEVELS["DEBUG"]
+    _state.payloads = debug
+    try:
+        yield
+    finally:
+        _state.level, _state.payloads = previous
+
+
+def enabled(level="DEBUG"):
+    return LEVELS[level] >= _level()
+
+
+def _write(level, msg, fields):
+    record = {"level": level, "msg": msg, "service": SERVICE, **current_context(), "ts": round(time.time(), 3)}
+    for key, value in fields.items():
+        record[key] = value() if callable(value) else value
+    line = _dumps(record)
+    with _write_lock:
+        sys.stdout.write(line + "\n")
+
+
+def _log(level, msg, sample, fields):
+    if LEVELS[level] < _level() or (sample < 1 and random.random() >= sample):
+        return
+    _write(level, msg, fields)
+
+
+def debug(msg, *, sample=1.0, **fields):
+    _log("DEBUG", msg, sample, fields)
+
+
+def info(msg, *, sample=1.0, **fields):
+    _log("INFO", msg, sample, fields)
+
+
+def warning(msg, *, sample=1.0, **fields):
+    _log("WARNING", msg, sample, fields)
+
+
+def error(msg, **fields):
+    _log("ERROR", msg, 1.0, fields)
+
+
+def payload(msg, value, **fields):
+    """Dump a request/response body; only for requests with the debug flag set."""
+    if getattr(_state, "payloads", False):
+        _write("DEBUG", msg, dict(fields, payload=value))
@@ -0,0 +1,153 @@
+import os
+import sys
+import math
+import resource
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+import log
+
+
+# ======================================================
+# 🧠 Memory high-water-mark profiling (opt-in)
+# ======================================================
+#
+# With MEMORY_PROFILE=1 on the function, each file runs under tracemalloc and
+# the stages marked with stage() (textract_results, normalize, mongo_write,
+# structure, payload_store) report:
+#
+#   peakMB      highest traced Python allocation while the stage ran
+#   retainedMB  traced memory the stage left allocated
+#   rssPeakMB   process RSS high-water mark (ru_maxrss) at the end of the stage
+#   top         source lines holding the most memory the stage allocated
+#               (allocations freed before the stage ends are only in peakMB)
+#
+# One "memory_profile" log line per file carries the stages and a
+# recommendedMemoryMB (peak RSS plus MEMORY_HEADROOM, in 64 MB steps).
+#
+# MEMORY_PROFILE_EXCLUDE lists file patterns (comma-separated, fnmatch) whose
+# allocations are not the function's own, e.g. the local fakes when
+# benchmarks/memory.py runs the function in-process. Memory allocated by
+# lines of those files is left out of top, reported as excludedMB, and
+# subtracted from the peaks and the RSS before the memory size is recommended.
+# tracemalloc slows the code down several times and counts every thread, so
+# profile single-file invocations, not batches, and leave it off otherwise.
+# benchmarks/memory.py replays a fixture through this and recommends a size.
+
+MEMORY_PROFILE = os.getenv("MEMORY_PROFILE", "").lower() in ("1", "true", "yes")
+MEMORY_PROFILE_TOP = int(os.getenv("MEMORY_PROFILE_TOP", "5"))
+MEMORY_HEADROOM = float(os.getenv("MEMORY_HEADROOM", "1.3"))
+
+LAMBDA_MIN_MB = 128
+LAMBDA_MAX_MB = 10240
+MEMORY_STEP_MB = 64
+
+# Allocations made by the profiler itself
+_IGNORED = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+_EXCLUDED = tuple(
+    tracemalloc.Filter(False, pattern.strip())
+    for pattern in os.getenv("MEMORY_PROFILE_EXCLUDE", "").split(",") if pattern.strip()
+)
+
+_state = threading.local()
+last_report = None
+
+
+def _mb(size_bytes):
+    return round(size_bytes / (1024 * 1024), 2)
+
+
+def rss_peak_mb():
+    """Process RSS high-water mark (what Lambda reports as Max Memory Used)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KB on Linux and in bytes on macOS
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def recommend_memory_mb(peak_mb, headroom=MEMORY_HEADROOM):
+    size = math.ceil(peak_mb * headroom / MEMORY_STEP_MB) * MEMORY_STEP_MB
+    return min(max(size, LAMBDA_MIN_MB), LAMBDA_MAX_MB)
+
+
+def _snapshot(report):
+    """Snapshot of the function's own traces; records how much the excluded files hold."""
+    snapshot = tracemalloc.take_snapshot().filter_traces(_IGNORED)
+    if not _EXCLUDED:
+        return snapshot, 0
+    own = snapshot.filter_traces(_EXCLUDED)
+    excluded = sum(t.size for t in snapshot.traces) - sum(t.size for t in own.traces)
+    report["_excluded"] = max(report["_excluded"], excluded)
+    return own, excluded
+
+
+def _fold_peak(report):
+    """Carry the traced peak so far into the open stages before it is reset."""
+    _, peak = tracemalloc.get_traced_memory()
+    report["_peak"] = max(report["_peak"], peak)
+    for open_stage in report["_open"]:
+        open_stage["_peak"] = max(open_stage["_peak"], peak)
+    tracemalloc.reset_peak()
+
+
+@contextmanager
+def profile(enabled=None):
+    """Profile one file; yields the report (None when profiling is off)."""
+    global last_report
+    if not (MEMORY_PROFILE if enabled is None else enabled):
+        yield None
+        return
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    report = {"stages": [], "rssStartMB": rss_peak_mb(), "_peak": 0, "_excluded": 0, "_open": []}
+    _state.report = report
+    tracemalloc.reset_peak()
+    try:
+        yield report
+    finally:
+        _fold_peak(report)
+        _state.report = None
+        if started_tracing:
+            tracemalloc.stop()
+        report.pop("_open")
+        excluded = report.pop("_excluded")
+        report["excludedMB"] = _mb(excluded)
+        report["tracedPeakMB"] = _mb(report.pop("_peak") - excluded)
+        report["rssPeakMB"] = round(rss_peak_mb() - report["excludedMB"], 1)
+        report["recommendedMemoryMB"] = recommend_memory_mb(report["rssPeakMB"])
+        last_report = report
+        log.info("memory_profile", **report)
+
+
+@contextmanager
+def stage(name):
+    """Measure the block as one stage of the enclosing profile(); free when profiling is off."""
+    report = getattr(_state, "report", None)
+    if report is None:
+        yield
+        return
+
+    _fold_peak(report)
+    before, excluded_before = _snapshot(report)
+    current_before, _ = tracemalloc.get_traced_memory()
+    entry = {"stage": name, "_peak": 0}
+    report["_open"].append(entry)
+    try:
+        yield
+    finally:
+        _fold_peak(report)
+        report["_open"].remove(entry)
+        current, _ = tracemalloc.get_traced_memory()
+        after, excluded = _snapshot(report)
+        grown = [s for s in after.compare_to(before, "lineno") if s.size_diff > 0]
+        top = [
+            {"where": f"{s.traceback[0].filename}:{s.traceback[0].lineno}",
+             "sizeKB": round(s.size_diff / 1024, 1), "count": s.count_diff}
+            for s in grown[:MEMORY_PROFILE_TOP]
+        ]
+        entry.update(peakMB=_mb(entry.pop("_peak") - excluded),
+                     retainedMB=_mb(current - current_before - (excluded - excluded_before)),
+                     excludedMB=_mb(excluded), rssPeakMB=round(rss_peak_mb() - _mb(excluded), 1), top=top)
+        report["stages"].append(entry)
@@ -1,14 +1,20 @@
 from pymongo import MongoClient, ReturnDocument
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import DuplicateKeyError, PyMongoError
 from bson import ObjectId
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
 from uuid import uuid4
 from typing import List, Dict, Any
 import traceback
 import json
 import re
+import time
 
-from config import MONGO_URI, DB_NAME, FILE_DETAILS_COLLECTION, CREDIT_COLLECTION
+from job_status import JobStatusRecorder
+import log
+from config import (
+    MONGO_URI, DB_NAME, FILE_DETAILS_COLLECTION, CREDIT_COLLECTION,
+    TEXTRACT_LEASE_SECONDS,
+)
 
 # --- Initialize MongoDB Client ---
 mongo_client = MongoClient(MONGO_URI)
@@ -23,8 +29,27 @@ def get_textract_job_collection():
     return db["tb_textract_jobs"]
 
 
+def _lease_deadline():
+    return datetime.now(timezone.utc) + timedelta(seconds=TEXTRACT_LEASE_SECONDS)
+
+
+def _as_utc(value):
+    """pymongo returns naive datetimes (UTC) unless the client is tz_aware."""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def lease_expired(record) -> bool:
+    """True when the owner of a job record has stopped heartbeating."""
+    expires = record.get("leaseExpiresAt")
+    if expires is None:
+        # Records written before leases existed: fall back to updatedAt
+        updated = record.get("updatedAt") or datetime.min
+        expires = updated + timedelta(seconds=TEXTRACT_LEASE_SECONDS)
+    return _as_utc(expires) < datetime.now(timezone.utc)
+
+
 def try_claim_processing(file_id, owner):
-    """Attempt to claim a file for processing (insert new job record)."""
+    """Attempt to claim a file for processing (insert new job record with a lease)."""
     try:
         col=get_textract_job_collection()
         col.insert_one({
@@ -34,30 +59,175 @@ def try_claim_processing(file_id, owner):
             "jobId": None,
             "result": None,
             "attempts": 0,
-            "createdAt": datetime.utcnow(),
-            "updatedAt": datetime.utcnow(),
+            "leaseExpiresAt": _lease_deadline(),
+            "heartbeatAt": datetime.now(timezone.utc),
+            "createdAt": datetime.now(timezone.utc),
+            "updatedAt": datetime.now(timezone.utc),
         })
-        print(f"✅ Claimed file {file_id}")
+        log.debug("textract_lease_claimed", owner=owner)
         return True
     except DuplicateKeyError:
-        print(f"⚠️ File {file_id} already exists, reusing existing job.")
+        log.debug("textract_lease_held")
         return False
 
 
+def takeover_stale_lease(file_id, owner):
+    """
+    Compare-and-swap takeover of a job whose owner crashed (lease expired)
+    or whose previous attempt FAILED. Only one contender can win.
+
+    Returns the record as it was *before* the takeover (so the caller can
+    resume an in-flight Textract jobId), or None if someone else won.
+    """
+    col = get_textract_job_collection()
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=TEXTRACT_LEASE_SECONDS)
+
+    # 1) In-flight but abandoned: keep jobId so the new owner resumes polling
+    previous = col.find_one_and_update(
+        {
+            "_id": file_id,
+            "status": {"$in": ["CLAIMED", "IN_PROGRESS"]},
+            "$or": [
+                {"leaseExpiresAt": {"$lt": now}},
+                {"leaseExpiresAt": {"$exists": False}, "updatedAt": {"$lt": stale_before}},
+            ],
+        },
+        {
+            "$set": {
+                "owner": owner,
+                "leaseExpiresAt": _lease_deadline(),
+                "heartbeatAt": now,
+                "updatedAt": now,
+            },
+            "$inc": {"takeovers": 1},
+        },
+        return_document=ReturnDocument.BEFORE,
+    )
+    if previous:
+        log.info("textract_lease_takeover", owner=owner, previousOwner=previous.get("owner"))
+        return previous
+
+    # 2) Previous attempt failed: start over (set_job_started counts the new attempt)
+    previous = col.find_one_and_update(
+        {"_id": file_id, "status": "FAILED"},
+        {
+            "$set": {
+                "status": "CLAIMED",
+                "owner": owner,
+                "jobId": None,
+                "result": None,
+                "leaseExpiresAt": _lease_deadline(),
+                "heartbeatAt": now,
+                "updatedAt": now,
+            },
+        },
+        return_document=ReturnDocument.BEFORE,
+    )
+    if previous:
+        log.info("textract_lease_reclaimed", owner=owner)
+    return previous
+
+
+def renew_lease(file_id, owner) -> bool:
+    """Heartbeat from the owner; False means the lease was lost to another worker."""
+    col = get_textract_job_collection()
+    result = col.update_one(
+        {"_id": file_id, "owner": owner},
+        {"$set": {"leaseExpiresAt": _lease_deadline(), "heartbeatAt": datetime.now(timezone.utc)}},
+    )
+    return result.matched_count == 1
+
+
+def release_lease(file_id, owner) -> bool:
+    """
+    Owner gives the lease up without failing the job (transient error): the
+    record keeps its status and jobId, so the retried task takes it over
+    immediately and resumes polling instead of starting a new Textract job.
+    """
+    col = get_textract_job_collection()
+    now = datetime.now(timezone.utc)
+    result = col.update_one(
+        {"_id": file_id, "owner": owner},
+        {"$set": {"leaseExpiresAt": now, "updatedAt": now}},
+    )
+    return result.matched_count == 1
+
+
+def _watch_job_record(file_id, done, deadline, record):
+    """Follow a job record through a change stream until done(record) or the deadline."""
+    col = get_textract_job_collection()
+    pipeline = [{"$match": {
+        "documentKey._id": file_id,
+        "operationType": {"$in": ["insert", "update", "replace"]},
+    }}]
+    with col.watch(pipeline, full_document="updateLookup", max_await_time_ms=1000) as stream:
+        # Re-read after subscribing so a change made in between is not missed
+        record = fetch_job_record(file_id) or record
+        while record and not done(record) and time.monotonic() < deadline:
+            change = stream.try_next()
+            if change and change.get("fullDocument"):
+                record = change["fullDocument"]
+    return record
+
+
+def _poll_job_record(file_id, done, deadline, record, poll_interval=1.0, max_interval=5.0):
+    """Polling fallback for deployments without change streams (standalone mongod)."""
+    while record and not done(record) and time.monotonic() < deadline:
+        time.sleep(min(poll_interval, max(deadline - time.monotonic(), 0)))
+        poll_interval = min(poll_interval * 2, max_interval)
+        record = fetch_job_record(file_id)
+    return record
+
+
+def wait_for_job_record(file_id, done, timeout: float):
+    """
+    Wait until done(record) holds for the job record, or the timeout elapses.
+    Subscribes to a change stream on tb_textract_jobs and falls back to
+    bounded polling when change streams are unavailable. Returns the latest record.
+    """
+    deadline = time.monotonic() + timeout
+    record = fetch_job_record(file_id)
+    if not record or done(record):
+        return record
+    try:
+        return _watch_job_record(file_id, done, deadline, record)
+    except PyMongoError as e:
+        log.info("change_stream_unavailable", error=str(e))
+        return _poll_job_record(file_id, done, deadline, record)
+
+
+def wait_for_job_result(file_id, timeout: float):
+    """
+    Follower side of a duplicate in-flight job: wait for the owner's record to
+    reach SUCCEEDED/FAILED (or for its lease to lapse) without calling Textract.
+    """
+    return wait_for_job_record(
+        file_id,
+        lambda r: r.get("status") in ("SUCCEEDED", "FAILED") or lease_expired(r),
+        timeout,
+    )
+
+
 def fetch_job_record(file_id: str):
     col = get_textract_job_collection()
     return col.find_one({"_id": file_id})
 
 
-def set_job_started(file_id: str, job_id: str):
+def set_job_started(file_id: str, job_id: str, owner: str = None):
     col = get_textract_job_collection()
+    query = {"_id": file_id}
+    if owner:
+        query["owner"] = owner  # only the lease holder may record the jobId
     return col.find_one_and_update(
-        {"_id": file_id},
+        query,
         {
             "$set": {
                 "jobId": job_id,
                 "status": "IN_PROGRESS",
-                "updatedAt": datetime.utcnow(),
+                "leaseExpiresAt": _lease_deadline(),
+                "heartbeatAt": datetime.now(timezone.utc),
+                "updatedAt": datetime.now(timezone.utc),
             },
             "$inc": {"attempts": 1},
         },
@@ -65,37 +235,58 @@ def set_job_started(file_id: str, job_id: str):
     )
 
 
-def set_job_succeeded(file_id: str, result: dict, page_count: int):
+def set_job_succeeded(file_id: str, result: dict, page_count: int, owner: str = None):
     col = get_textract_job_collection()
+    query = {"_id": file_id}
+    if owner:
+        query["owner"] = owner  # never overwrite the result of a worker that took the job over
     return col.find_one_and_update(
-        {"_id": file_id},
+        query,
         {
             "$set": {
                 "status": "SUCCEEDED",
                 "result": result,
                 "page_count": page_count,
-                "updatedAt": datetime.utcnow(),
+                "leaseExpiresAt": None,
+                # updatedAt also moves on lease renewals and releases
+                "succeededAt": datetime.now(timezone.utc),
+                "updatedAt": datetime.now(timezone.utc),
             }
         },
         return_document=ReturnDocument.AFTER,
     )
 
 
-def set_job_failed(file_id: str, error_msg: str):
+def set_job_failed(file_id: str, error_msg: str, owner: str = None):
     col = get_textract_job_collection()
+    query = {"_id": file_id}
+    if owner:
+        query["owner"] = owner  # never fail a job another worker has taken over
     return col.find_one_and_update(
-        {"_id": file_id},
+        query,
         {
             "$set": {
                 "status": "FAILED",
                 "error": error_msg,
-                "updatedAt": datetime.utcnow(),
+                "leaseExpiresAt": None,
+                "updatedAt": datetime.now(timezone.utc),
             }
         },
         return_document=ReturnDocument.AFTER,
     )
 
 
+def record_api_calls(file_id: str, counts: dict):
+    """Add one invocation's Textract call counts (textract_calls.py) to the job record."""
+    inc = {f"apiCalls.{kind}": n for kind, n in counts.items() if n}
+    inc["apiCalls.invocations"] = 1
+    try:
+        get_textract_job_collection().update_one({"_id": file_id}, {"$inc": inc})
+    except PyMongoError as e:
+        # Accounting only: never fail the job over it
+        log.warning("textract_calls_write_failed", error=str(e))
+
+
 # ======================================================
 # 🗃️ Mongo Utilities
 # ======================================================
@@ -124,7 +315,7 @@ def fetch_requested_fields(user_id, cluster_id):
     doc = collection.find_one(query, projection)
 
     if not doc:
-        print(f"⚠️ No requested fields found for user {user_id}, cluster {cluster_id}")
+        log.warning("requested_fields_missing", userId=user_id, clusterId=cluster_id)
         return []
 
     requested_fields = doc.get("requestedFields", [])
@@ -148,7 +339,7 @@ def fetch_requested_fields(user_id, cluster_id):
             table_name = field_name
             table_data = field.get("tableData", [])
             if not table_data:
-                print(f"⚠️ Table '{table_name}' has no columns defined.")
+                log.warning("requested_table_empty", table=table_name)
                 continue
 
             for col in table_data:
@@ -214,19 +405,10 @@ def mark_file_as_failed(doc_id):
 # ======================================================
 
 def update_job_status(job_id: str, status: str, summary: dict = None, message: str = None):
-    """Insert or update job status."""
-    collection = get_mongo_collection("job_status")
-    doc = {
-        "job_id": job_id,
-        "status": status,
-        "updatedAt": datetime.now(timezone.utc),
-    }
-    if summary:
-        doc["summary"] = summary
-    if message:
-        doc["message"] = message
-
-    collection.update_one({"job_id": job_id}, {"$set": doc}, upsert=True)
+    """Insert or update job status immediately (handlers buffer via JobStatusRecorder)."""
+    recorder = JobStatusRecorder(get_mongo_collection("job_status"), job_id, "ocr")
+    recorder.record(status, message, summary)
+    return recorder.flush()
 
 
 def fetch_job_status(job_id: str):
@@ -300,7 +482,7 @@ Return only the JSON, nothing else.
     try:
         value = agent.complete(prompt, context=context) if context else agent.complete(prompt)
     except Exception as e:
-        print(f"⚠️ LLM extraction failed: {e}")
+        log.warning("llm_extraction_failed", error=str(e))
         return [[["NA"]]]
 
     # --- Parse JSON safely ---
@@ -475,7 +657,7 @@ def update_extracted_values_to_mongo(
     }
 
     result = collection.update_one(filter_query, update_query, upsert=True)
-    print("✅ Extracted values stored successfully in MongoDB.")
+    log.info("extracted_values_stored", modified=result.modified_count)
     return {
         "status": "success" if result.modified_count > 0 else "no-change",
         "storedData": final_update
@@ -495,7 +677,7 @@ def insert_debit_credit(user_id, cluster_id, field_id, credits_to_deduct, job_id
 
     try:
         if not credit_id:
-            print("⚠️ Missing creditId — cannot update credit record.")
+            log.warning("credit_id_missing", operation="debit")
             return {"status": "error", "message": "Missing creditId"}
 
         result = collection.update_one(
@@ -504,15 +686,15 @@ def insert_debit_credit(user_id, cluster_id, field_id, credits_to_deduct, job_id
         )
 
         if result.matched_count == 0:
-            print(f"⚠️ No record found with creditId: {credit_id}")
+            log.warning("credit_not_found", creditId=credit_id, operation="debit")
             return {"status": "not-found", "message": f"No record found for creditId {credit_id}"}
 
-        print(f"✅ Credit record {credit_id} updated successfully for user {user_id}")
+        log.info("credit_settled", creditId=credit_id, operation="debit", userId=user_id)
         return {"status": "success", "message": f"Updated credit record {credit_id}"}
 
     except Exception as e:
-        print(f"❌ Error updating credit record {credit_id}: {e}")
-        traceback.print_exc()
+        log.error("credit_settle_failed", creditId=credit_id, operation="debit", error=str(e),
+                  traceback=traceback.format_exc())
         return {"status": "error", "message": str(e)}
 
 
@@ -525,19 +707,19 @@ def delete_credit_record(credit_id):
 
     try:
         if not credit_id:
-            print("⚠️ Missing creditId — cannot delete credit record.")
+            log.warning("credit_id_missing", operation="rollback")
             return {"status": "error", "message": "Missing creditId"}
 
         result = collection.delete_one({"_id": ObjectId(credit_id)})
 
         if result.deleted_count == 0:
-            print(f"⚠️ No credit record found with creditId: {credit_id}")
+            log.warning("credit_not_found", creditId=credit_id, operation="rollback")
             return {"status": "not-found", "message": f"No record found for creditId {credit_id}"}
 
-        print(f"✅ Credit record {credit_id} deleted successfully")
+        log.info("credit_settled", creditId=credit_id, operation="rollback")
         return {"status": "success", "message": f"Deleted credit record {credit_id}"}
 
     except Exception as e:
-        print(f"❌ Error deleting credit record {credit_id}: {e}")
-        traceback.print_exc()
+        log.error("credit_settle_failed", creditId=credit_id, operation="rollback", error=str(e),
+                  traceback=traceback.format_exc())
         return {"status": "error", "message": str(e)}
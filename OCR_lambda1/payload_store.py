@@ -0,0 +1,86 @@
+import os
+import gzip
+import hashlib
+from uuid import uuid4
+
+import log
+
+
+# ======================================================
+# 📦 Claim-check for large Step Functions payloads
+# ======================================================
+#
+# Shared by OCR_lambda1 (writer) and beofinallambda2 (reader); keep both
+# copies identical. Text under INLINE_PAYLOAD_MAX_BYTES travels inline as
+# before; anything larger is gzipped to S3 and only a small pointer is
+# passed between states. Expire PAYLOAD_PREFIX with an S3 lifecycle rule.
+
+PAYLOAD_BUCKET = os.getenv("PAYLOAD_BUCKET") or os.getenv("S3_BUCKET_NAME")
+PAYLOAD_PREFIX = os.getenv("PAYLOAD_PREFIX", "stepfunction-payloads")
+INLINE_PAYLOAD_MAX_BYTES = int(os.getenv("INLINE_PAYLOAD_MAX_BYTES", "32768"))
+
+_s3 = None
+
+
+def _s3_client():
+    global _s3
+    if _s3 is None:
+        import boto3  # only needed when a text is stored or resolved by reference
+
+        _s3 = boto3.client("s3")
+    return _s3
+
+
+def store_text(text: str, file_id: str, inline_max_bytes: int = None) -> dict:
+    """
+    Return {"text_content": ..., "text_ref": ...} for the state output.
+    Exactly one of the two is set, depending on the encoded size.
+    """
+    limit = INLINE_PAYLOAD_MAX_BYTES if inline_max_bytes is None else inline_max_bytes
+    raw = text.encode("utf-8")
+    if len(raw) <= limit:
+        return {"text_content": text, "text_ref": None}
+
+    if not PAYLOAD_BUCKET:
+        raise RuntimeError("Missing ENV: PAYLOAD_BUCKET (or S3_BUCKET_NAME) for large payloads")
+
+    body = gzip.compress(raw)
+    key = f"{PAYLOAD_PREFIX}/{file_id}/{uuid4().hex}.txt.gz"
+    _s3_client().put_object(
+        Bucket=PAYLOAD_BUCKET,
+        Key=key,
+        Body=body,
+        ContentType="text/plain; charset=utf-8",
+        ContentEncoding="gzip",
+    )
+    log.debug("payload_stored", bucket=PAYLOAD_BUCKET, key=key, size=len(raw), storedSize=len(body))
+
+    return {
+        "text_content": None,
+        "text_ref": {
+            "bucket": PAYLOAD_BUCKET,
+            "key": key,
+            "encoding": "gzip",
+            "size": len(raw),
+            "sha256": hashlib.sha256(raw).hexdigest(),
+        },
+    }
+
+
+def resolve_text(text_content=None, text_ref=None) -> str:
+    """Inverse of store_text: return the inline text or fetch the referenced object."""
+    if text_content is not None:
+        return text_content
+    if not text_ref:
+        raise KeyError("text_content")
+
+    obj = _s3_client().get_object(Bucket=text_ref["bucket"], Key=text_ref["key"])
+    body = obj["Body"].read()
+    if text_ref.get("encoding") == "gzip":
+        body = gzip.decompress(body)
+
+    if text_ref.get("sha256") and hashlib.sha256(body).hexdigest() != text_ref["sha256"]:
+        raise ValueError(f"Checksum mismatch for s3://{text_ref['bucket']}/{text_ref['key']}")
+
+    log.debug("payload_resolved", bucket=text_ref["bucket"], key=text_ref["key"], size=len(body))
+    return body.decode("utf-8")
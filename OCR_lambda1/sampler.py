@@ -0,0 +1,147 @@
+import os
+import sys
+import time
+import threading
+from collections import Counter
+from uuid import uuid4
+
+from tracing import SERVICE
+import log
+
+
+# ======================================================
+# 🔥 Sampling profiler (opt-in per request)
+# ======================================================
+#
+# Shared by OCR_lambda1 and beofinallambda2; keep both copies identical.
+# A request with "profile": true in its event (per manifest entry, or for the
+# whole run in the execution input) is sampled: a daemon thread reads the
+# handler thread's stack every PROFILE_INTERVAL_MS through
+# sys._current_frames(). No trace hooks are installed, so the profiled code
+# runs at full speed. When the request ends the stacks are written in the
+# collapsed ("folded") format of flamegraph.pl and speedscope, one
+# "outer;...;inner count" line per stack, to
+#
+#   s3://PROFILE_BUCKET/PROFILE_PREFIX/<service>/<fileId>/<ms>-<id>.folded
+#
+# and a "profile" log line gives the key and the functions with the most
+# self samples. Expire PROFILE_PREFIX with an S3 lifecycle rule.
+
+PROFILE_BUCKET = os.getenv("PROFILE_BUCKET") or os.getenv("S3_BUCKET_NAME")
+PROFILE_PREFIX = os.getenv("PROFILE_PREFIX", "profiles")
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_MAX_DEPTH = 128
+PROFILE_TOP = 10
+
+_labels = {}
+_s3 = None
+
+
+def _s3_client():
+    global _s3
+    if _s3 is None:
+        import boto3  # only needed when a profile is written
+
+        _s3 = boto3.client("s3")
+    return _s3
+
+
+def _label(code):
+    label = _labels.get(code)
+    if label is None:
+        module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        label = _labels[code] = f"{module}:{code.co_name}"
+    return label
+
+
+class _Sampler(threading.Thread):
+    """Counts the collapsed stacks of one thread, from its root frame down."""
+
+    def __init__(self, thread_id, root, interval):
+        super().__init__(name="profile-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.root = root
+        self.interval = interval
+        self.stacks = Counter()
+        self.cpu_seconds = 0.0
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < PROFILE_MAX_DEPTH:
+                stack.append(_label(frame.f_code))
+                if frame is self.root:
+                    break
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+        self.cpu_seconds = time.thread_time()
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+
+def folded(stacks) -> str:
+    """Collapsed-stack text, one "frame;frame;frame count" line per stack."""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+def top_functions(stacks, top=PROFILE_TOP):
+    """Functions by self samples (the innermost frame), as {"function", "samples", "percent"}."""
+    own = Counter()
+    for stack, count in stacks.items():
+        own[stack.rsplit(";", 1)[-1]] += count
+    total = sum(own.values()) or 1
+    return [{"function": f, "samples": n, "percent": round(100 * n / total, 1)} for f, n in own.most_common(top)]
+
+
+def write_profile(stacks, file_id):
+    key = f"{PROFILE_PREFIX}/{SERVICE}/{file_id or 'unknown'}/{int(time.time() * 1000)}-{uuid4().hex[:8]}.folded"
+    _s3_client().put_object(Bucket=PROFILE_BUCKET, Key=key, Body=folded(stacks).encode("utf-8"),
+                            ContentType="text/plain; charset=utf-8")
+    return key
+
+
+class sampled:
+    """
+    Sample the calling thread for the duration of the block when the event
+    has "profile": true; a no-op otherwise. Stacks are cut at the frame that
+    opened the block, so the Lambda runtime's frames are left out.
+    """
+
+    def __init__(self, event, interval_ms=None):
+        self.enabled = bool(event.get("profile"))
+        self.file_id = event.get("fileId")
+        self.interval = (PROFILE_INTERVAL_MS if interval_ms is None else interval_ms) / 1000
+        self.sampler = None
+
+    def __enter__(self):
+        if self.enabled:
+            self.started = time.perf_counter()
+            self.sampler = _Sampler(threading.get_ident(), sys._getframe(1), self.interval)
+            self.sampler.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.sampler is None:
+            return False
+        self.sampler.stop()
+        stacks = self.sampler.stacks
+        fields = {
+            "samples": sum(stacks.values()),
+            "durationMs": round((time.perf_counter() - self.started) * 1000, 1),
+            "intervalMs": round(self.interval * 1000, 2),
+            "samplerCpuMs": round(self.sampler.cpu_seconds * 1000, 1),
+            "top": top_functions(stacks),
+        }
+        try:
+            if stacks and PROFILE_BUCKET:
+                fields.update(bucket=PROFILE_BUCKET, key=write_profile(stacks, self.file_id))
+        except Exception as e:
+            # Profiling must never fail the request
+            log.warning("profile_write_failed", error=f"{type(e).__name__}: {e}")
+        log.info("profile", **fields)
+        return False
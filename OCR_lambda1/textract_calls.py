@@ -0,0 +1,125 @@
+import os
+import argparse
+from collections import Counter
+
+from errors import is_throttle
+
+
+# ======================================================
+# 🔢 Textract API call accounting
+# ======================================================
+#
+# run_textract wraps its Textract client in TextractCallCounter, and at the
+# end of every invocation adds the counts to the job's tb_textract_jobs
+# record (mongo.record_api_calls), so a job retried or taken over several
+# times accumulates all of its calls:
+#
+#   "apiCalls": {"start": 1, "poll": 7, "page": 3,
+#                "retries": 2,        # botocore retries (ResponseMetadata.RetryAttempts)
+#                "throttled": 1,      # calls that still failed on throttling
+#                "errors": 0,         # other failed calls
+#                "invocations": 2, "followerWaits": 1, "resumes": 1}
+#
+# Every GetDocumentAnalysis call without a NextToken is a poll, with one a
+# page. A job needs one start, one poll that sees it finished and one call
+# per extra page, so polls beyond the first and every retry/throttled call
+# are wasted. Followers wait on the job record and make no Textract calls;
+# followerWaits shows how many duplicate runs that saved. The report below
+# (python OCR_lambda1/textract_calls.py) gives the per-job call histogram.
+
+CALL_KINDS = ("start", "poll", "page")
+OUTCOME_FIELDS = ("retries", "throttled", "errors")
+
+# Calls per job, as $bucket boundaries for the histogram
+CALL_BUCKETS = [0, 3, 5, 10, 20, 50, 100, 1000]
+
+
+def call_kind(operation, kwargs):
+    if operation == "get_document_analysis":
+        return "page" if kwargs.get("NextToken") else "poll"
+    if operation == "start_document_analysis":
+        return "start"
+    return operation
+
+
+def _retry_attempts(response):
+    return (response or {}).get("ResponseMetadata", {}).get("RetryAttempts", 0) or 0
+
+
+class TextractCallCounter:
+    """Proxy for a boto3 Textract client that counts calls by kind and outcome."""
+
+    def __init__(self, client):
+        self._client = client
+        self.counts = Counter()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            self.counts[call_kind(name, kwargs)] += 1
+            try:
+                response = attr(*args, **kwargs)
+            except Exception as e:
+                self.counts["throttled" if is_throttle(e) else "errors"] += 1
+                self.counts["retries"] += _retry_attempts(getattr(e, "response", None))
+                raise
+            self.counts["retries"] += _retry_attempts(response)
+            return response
+
+        return call
+
+
+def wasted_calls(api_calls):
+    """Calls a job made beyond one start, one finishing poll and its pages."""
+    polls = api_calls.get("poll", 0)
+    return max(polls - 1, 0) + sum(api_calls.get(f, 0) for f in OUTCOME_FIELDS)
+
+
+def call_report(col, since=None):
+    """Totals and the histogram of calls per job over tb_textract_jobs records with apiCalls."""
+    match = {"apiCalls": {"$exists": True}}
+    if since:
+        match["updatedAt"] = {"$gte": since}
+    total_calls = {"$add": [{"$ifNull": [f"$apiCalls.{k}", 0]} for k in CALL_KINDS]}
+
+    histogram = list(col.aggregate([
+        {"$match": match},
+        {"$bucket": {"groupBy": total_calls, "boundaries": CALL_BUCKETS, "default": "1000+",
+                     "output": {"jobs": {"$sum": 1}, "pages": {"$sum": "$page_count"}}}},
+    ]))
+
+    totals = Counter()
+    jobs = wasted = 0
+    for record in col.find(match, {"apiCalls": 1, "page_count": 1}):
+        jobs += 1
+        totals.update({k: v for k, v in record["apiCalls"].items() if isinstance(v, int)})
+        totals["pageCount"] += record.get("page_count") or 0
+        wasted += wasted_calls(record["apiCalls"])
+
+    calls = sum(totals[k] for k in CALL_KINDS)
+    return {
+        "jobs": jobs,
+        "calls": calls,
+        "callsPerJob": round(calls / jobs, 2) if jobs else 0.0,
+        "callsPerPage": round(calls / totals["pageCount"], 2) if totals["pageCount"] else None,
+        "wastedCalls": wasted,
+        "totals": dict(totals),
+        "histogram": histogram,
+    }
+
+
+if __name__ == "__main__":
+    import json
+    from datetime import datetime
+    from pymongo import MongoClient
+
+    parser = argparse.ArgumentParser(description="Textract API calls per job from tb_textract_jobs")
+    parser.add_argument("--since", help="ISO date, e.g. 2026-10-01")
+    args = parser.parse_args()
+
+    db = MongoClient(os.getenv("PROD_MONGO_URI"))[os.getenv("MONGO_DATABASE", "yc-invoice")]
+    since = datetime.fromisoformat(args.since) if args.since else None
+    print(json.dumps(call_report(db["tb_textract_jobs"], since), indent=2, default=str))
@@ -0,0 +1,211 @@
+"""
+Recorded Textract and Azure OpenAI responses for the offline benchmarks.
+
+A fixture is one document: the GetDocumentAnalysis response sequence of a
+finished job (NextToken pages) and the two LLM answers the structured
+Lambda asks for. They live in benchmarks/fixtures/<name>.json.gz, which is
+git-ignored because recordings contain customer BEOs:
+
+    {"name": "beo_10p", "pages": 10, "source": "recorded",
+     "textract": [{"JobStatus": "SUCCEEDED", "Blocks": [...], "NextToken": "..."}, ...],
+     "llm": {"complete": "<json text>", "extract_invoice_and_items": {...}}}
+
+Record from a real job (credentials and Azure settings from the environment):
+
+    python benchmarks/fixtures.py textract --job-id <JobId> --region ap-south-1 --name beo_10p
+    python benchmarks/fixtures.py llm --name beo_10p --text ocr_text.txt
+
+The OCR text for the llm command is the "ocr_text" payload the OCR Lambda
+logs for requests with "debug": true. Sizes without a recording are
+synthesized from local_fakes.make_textract_blocks (the same blocks the
+local runner uses), with LLM answers from local_fakes.FakeLLMAgent.
+"""
+import argparse
+import gzip
+import json
+import os
+import sys
+from uuid import uuid4
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURE_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+STRUCTURED_DIR = os.path.join(ROOT, "beofinallambda2")
+
+# Blocks per GetDocumentAnalysis response of synthetic fixtures (Textract returns up to 1000)
+SYNTHETIC_PAGE_SIZE = 1000
+
+
+def fixture_path(name):
+    return os.path.join(FIXTURE_DIR, f"{name}.json.gz")
+
+
+def load_fixture(name):
+    with gzip.open(fixture_path(name), "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_fixture(fixture):
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with gzip.open(fixture_path(fixture["name"]), "wt", encoding="utf-8") as f:
+        json.dump(fixture, f)
+    return fixture_path(fixture["name"])
+
+
+def paginate(blocks, pages, page_size=SYNTHETIC_PAGE_SIZE):
+    """Split blocks into the NextToken-chained responses of a finished job."""
+    responses = []
+    for start in range(0, max(len(blocks), 1), page_size):
+        response = {
+            "JobStatus": "SUCCEEDED",
+            "Blocks": blocks[start:start + page_size],
+            "DocumentMetadata": {"Pages": pages},
+        }
+        if start + page_size < len(blocks):
+            response["NextToken"] = f"token-{start + page_size}"
+        responses.append(response)
+    return responses
+
+
+def synthetic_fixture(pages):
+    """Fixture from the local fakes; "llm" is filled in by the benchmark from the OCR text."""
+    from local_fakes import make_textract_blocks
+
+    return {
+        "name": f"beo_{pages}p",
+        "pages": pages,
+        "source": "synthetic",
+        "textract": paginate(make_textract_blocks(pages), pages),
+        "llm": None,
+    }
+
+
+def fixture_for(pages):
+    """The recorded fixture beo_<pages>p if there is one, else a synthetic one."""
+    name = f"beo_{pages}p"
+    if os.path.exists(fixture_path(name)):
+        return load_fixture(name)
+    return synthetic_fixture(pages)
+
+
+def fake_llm_answers(text):
+    """What local_fakes.FakeLLMAgent answers for this OCR text (no simulated latency)."""
+    from local_fakes import FakeLLMAgent
+
+    agent = FakeLLMAgent()
+    agent.latency = agent.latency_per_kchar = agent.throttle_rate = 0
+    return {
+        "complete": agent.complete(agent.build_prompt(text)),
+        "extract_invoice_and_items": agent.extract_invoice_and_items(text),
+    }
+
+
+# ============================================================
+# Replay
+# ============================================================
+
+class ReplayTextract:
+    """
+    Textract client that serves a recorded response sequence for every job.
+    Each job answers IN_PROGRESS in_progress_polls times before the first page.
+    """
+
+    def __init__(self, responses=(), in_progress_polls=0):
+        self.in_progress_polls = in_progress_polls
+        self.calls = {"start_document_analysis": 0, "get_document_analysis": 0}
+        self._polls = {}
+        self.use(responses)
+
+    def use(self, responses):
+        self.responses = list(responses)
+        self._after = {r["NextToken"]: i + 1 for i, r in enumerate(self.responses) if r.get("NextToken")}
+
+    def start_document_analysis(self, DocumentLocation=None, FeatureTypes=None, **kwargs):
+        self.calls["start_document_analysis"] += 1
+        job_id = uuid4().hex
+        self._polls[job_id] = 0
+        return {"JobId": job_id}
+
+    def get_document_analysis(self, JobId, NextToken=None, **kwargs):
+        self.calls["get_document_analysis"] += 1
+        if NextToken is None and self._polls.get(JobId, 0) < self.in_progress_polls:
+            self._polls[JobId] += 1
+            return {"JobStatus": "IN_PROGRESS"}
+        response = self.responses[self._after[NextToken] if NextToken else 0]
+        # run_textract extends the first page's Blocks list in place
+        return dict(response, Blocks=list(response["Blocks"]))
+
+
+class ReplayLLMAgent:
+    """Same interface as azure_llm_agent.AzureLLMAgent, answering from a fixture."""
+
+    model = "replay"
+
+    def __init__(self, answers):
+        self.answers = answers
+
+    def build_prompt(self, extracted_text):
+        return extracted_text
+
+    def complete(self, prompt):
+        return self.answers["complete"]
+
+    def extract_invoice_and_items(self, ocr_text):
+        return dict(self.answers["extract_invoice_and_items"])
+
+
+# ============================================================
+# Recording
+# ============================================================
+
+def record_textract(job_id, region):
+    import boto3
+
+    client = boto3.client("textract", region_name=region)
+    responses, token = [], None
+    while True:
+        kwargs = {"JobId": job_id, "NextToken": token} if token else {"JobId": job_id}
+        response = client.get_document_analysis(**kwargs)
+        response.pop("ResponseMetadata", None)
+        if response["JobStatus"] != "SUCCEEDED":
+            raise SystemExit(f"Job {job_id} is {response['JobStatus']}; record a finished job")
+        responses.append(response)
+        token = response.get("NextToken")
+        if not token:
+            return responses
+
+
+def record_llm(text):
+    sys.path.insert(0, STRUCTURED_DIR)
+    from azure_llm_agent import AzureLLMAgent
+
+    agent = AzureLLMAgent()
+    return {
+        "complete": agent.complete(agent.build_prompt(text)),
+        "extract_invoice_and_items": agent.extract_invoice_and_items(text),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record Textract/LLM fixtures for the offline benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+    textract = sub.add_parser("textract", help="Record the responses of a finished Textract job")
+    textract.add_argument("--job-id", required=True)
+    textract.add_argument("--region", default=os.getenv("AWS_REGION", "ap-south-1"))
+    textract.add_argument("--name", required=True, help="Fixture name, e.g. beo_10p")
+    llm = sub.add_parser("llm", help="Record the Azure OpenAI answers for a fixture's OCR text")
+    llm.add_argument("--name", required=True)
+    llm.add_argument("--text", required=True, help="File with the OCR text (the ocr_text debug payload)")
+    args = parser.parse_args()
+
+    if args.command == "textract":
+        responses = record_textract(args.job_id, args.region)
+        pages = responses[0].get("DocumentMetadata", {}).get("Pages", 0)
+        fixture = {"name": args.name, "pages": pages, "source": "recorded", "textract": responses, "llm": None}
+        if os.path.exists(fixture_path(args.name)):
+            fixture["llm"] = load_fixture(args.name).get("llm")
+    else:
+        fixture = load_fixture(args.name)
+        with open(args.text, encoding="utf-8") as f:
+            fixture["llm"] = record_llm(f.read())
+
+    print(f"Wrote {save_fixture(fixture)}")
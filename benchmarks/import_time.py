@@ -0,0 +1,136 @@
+"""
+Import-time profile of the Lambda handlers, the part of Init Duration that
+the code controls.
+
+Each target is imported in a fresh interpreter with `-X importtime`, from
+its Lambda directory (so the vendored packages are the ones loaded) and
+with placeholder settings; no AWS or MongoDB calls are made. The median
+run is reported with its time per top-level package (self time, so the
+packages add up to the total).
+
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py beofinallambda2:lambda_function --top 20
+    python benchmarks/import_time.py --json > benchmarks/baselines/import_time.json
+    python benchmarks/import_time.py --compare benchmarks/baselines/import_time.json
+
+The vendored binary wheels (orjson, jiter, pydantic_core, ...) are built
+for CPython 3.12, the Lambda runtime; use --python to point at a 3.12
+interpreter when the default one differs.
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "<Lambda directory>:<module>" per handler
+TARGETS = (
+    "BEO_S3_File_read:lambda_function",
+    "BEO_S3_File_read:schedule_files",
+    "OCR_lambda1:lambda_function",
+    "beofinallambda2:lambda_function",
+    "beofinallambda2:precheck",
+    "beofinallambda2:settle_credits",
+    "lambdabeoFAIL:lambda_function",
+)
+
+PLACEHOLDER_ENV = {
+    "PROD_MONGO_URI": "mongodb://localhost:27017/?serverSelectionTimeoutMS=1",
+    "MONGO_DATABASE": "yc-invoice",
+    "S3_BUCKET_NAME": "import-time-bucket",
+    "AWS_DEFAULT_REGION": "ap-south-1",
+    "AWS_ACCESS_KEY_ID": "placeholder",
+    "AWS_SECRET_ACCESS_KEY": "placeholder",
+}
+
+LINE_RE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def profile_once(target, python):
+    directory, module = target.split(":")
+    env = dict(os.environ, **PLACEHOLDER_ENV)
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.join(ROOT, directory), env=env, capture_output=True, text=True, timeout=300,
+    )
+
+    packages = defaultdict(int)
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        packages[name.split(".")[0]] += self_us
+        if name == module and not indent:
+            total_us = cumulative_us
+
+    error = None
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["import failed"])[-1]
+        # Partial profile: everything imported before the failure
+        total_us = sum(packages.values())
+    return {"totalMs": round(total_us / 1000, 1), "packages": packages, "error": error}
+
+
+def profile(target, python, repeat=5, top=10):
+    runs = [profile_once(target, python) for _ in range(repeat)]
+    median = statistics.median(r["totalMs"] for r in runs)
+    run = min(runs, key=lambda r: abs(r["totalMs"] - median))
+    ranked = sorted(run["packages"].items(), key=lambda kv: kv[1], reverse=True)[:top]
+    return {
+        "target": target,
+        "medianMs": median,
+        "minMs": min(r["totalMs"] for r in runs),
+        "maxMs": max(r["totalMs"] for r in runs),
+        "topPackagesMs": {name: round(us / 1000, 1) for name, us in ranked},
+        "error": run["error"],
+    }
+
+
+def format_results(results, baseline=None):
+    previous = {r["target"]: r for r in (baseline or {}).get("results", [])}
+    lines = []
+    for r in results:
+        head = f"{r['target']:<36} median={r['medianMs']:>8.1f} ms  (min {r['minMs']}, max {r['maxMs']})"
+        if r["target"] in previous:
+            before = previous[r["target"]]["medianMs"]
+            change = (r["medianMs"] - before) / before * 100 if before else 0.0
+            head += f"  baseline={before} ms ({change:+.0f}%)"
+        lines.append(head)
+        if r["error"]:
+            lines.append(f"    import failed: {r['error']}")
+        lines.append("    " + ", ".join(f"{name} {ms}" for name, ms in r["topPackagesMs"].items()))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time profile of the Lambda handlers")
+    parser.add_argument("targets", nargs="*", help="<Lambda directory>:<module> (default: all handlers)")
+    parser.add_argument("--python", default=sys.executable, help="Interpreter to profile with")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Packages listed per target")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON written earlier with --json")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    python_version = subprocess.run(
+        [args.python, "-c", "import sys; print('%d.%d.%d' % sys.version_info[:3])"],
+        capture_output=True, text=True,
+    ).stdout.strip()
+    results = [profile(t, args.python, args.repeat, args.top) for t in args.targets or TARGETS]
+
+    if args.json:
+        print(json.dumps({"python": python_version, "repeat": args.repeat, "results": results}, indent=2))
+    else:
+        baseline = None
+        if args.compare:
+            with open(args.compare) as f:
+                baseline = json.load(f)
+        print(f"python {python_version}, {args.repeat} runs per target")
+        print(format_results(results, baseline))
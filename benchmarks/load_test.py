@@ -0,0 +1,233 @@
+"""
+Load test: where does the pipeline saturate?
+
+Seeds a manifest of --files synthetic files with page counts drawn from
+--distribution and runs it through the local state machine
+(local_runner.run_local) once per --concurrency level, against the
+local_fakes stand-ins with simulated latency, capacity and throttling.
+For each level it reports throughput (files/s, pages/s), and from the
+tracing spans the time each stage takes per file. It then names the
+saturation point (the first level whose throughput gains less than
+--knee-gain over the previous level) and the bottleneck stage. The
+bottleneck is the stage whose time per file grew the most from the lowest
+level to the highest, or the largest stage when none grew (the pipeline
+is then bound by concurrency, not by a backend).
+
+Everything runs in one process, so CPU-bound work (trp normalization, the
+fake MongoDB copying documents) shares one core: a level whose CPU use
+reaches HARNESS_CPU_BOUND is flagged, because there the stages inflate
+from the harness itself rather than from the simulated backends.
+
+    python benchmarks/load_test.py --files 100 --concurrency 1 2 4 8 16 32
+    python benchmarks/load_test.py --distribution lognormal:1.2,0.8 --textract-max-jobs 8 --llm-capacity 4
+    python benchmarks/load_test.py --env prod-batched --distribution mix:1=0.6,10=0.3,50=0.1 --json
+
+Distributions: fixed:N, uniform:A-B, lognormal:MU,SIGMA (pages = round(e^N(MU,SIGMA)),
+at least 1) and mix:PAGES=WEIGHT,... The same page counts are used at
+every level (--seed). Sleeps inside the Lambdas (Textract polling,
+retries) are scaled by --time-scale; the stand-ins' own latencies are not.
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Quiet Lambdas: spans still reach the sink below, INFO logs are dropped
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from trace_report import FILE_STAGES  # noqa: E402
+
+DEFAULT_CONCURRENCY = (1, 2, 4, 8, 16, 32)
+# A stage "grew" when its time per file rose by more than both of these
+GROWTH_MIN_RATIO = 0.2
+GROWTH_MIN_MS = 5.0
+# Process CPU time per wall second at which the harness, not the backends, limits a level
+HARNESS_CPU_BOUND = 0.9
+
+
+def page_counts(spec, files, rng):
+    """Page counts for `files` files from a distribution spec (see the module docstring)."""
+    kind, _, arg = spec.partition(":")
+    if kind == "fixed":
+        return [int(arg)] * files
+    if kind == "uniform":
+        low, high = (int(x) for x in arg.split("-"))
+        return [rng.randint(low, high) for _ in range(files)]
+    if kind == "lognormal":
+        mu, sigma = (float(x) for x in arg.split(","))
+        return [max(1, round(math.exp(rng.gauss(mu, sigma)))) for _ in range(files)]
+    if kind == "mix":
+        weights = {int(p): float(w) for p, w in (item.split("=") for item in arg.split(","))}
+        return rng.choices(list(weights), weights=list(weights.values()), k=files)
+    raise ValueError(f"Unknown distribution {spec!r}")
+
+
+def stage_ms_per_file(spans, files):
+    """Total span time per file for each parent/span name."""
+    totals = defaultdict(float)
+    for record in spans:
+        name = f"{record['parent']}/{record['span']}" if record.get("parent") else record["span"]
+        totals[name] += record["durationMs"]
+    return {name: round(total / files, 1) for name, total in sorted(totals.items())}
+
+
+def run_level(pipeline, config, counts, concurrency, spans, time_scale):
+    from local_runner import run_local
+    from stepfunction_builder import merge_config
+
+    level_config = merge_config(config, {"map": {"max_concurrency": concurrency}})
+    first_span = len(spans)
+    throttled_before = pipeline.textract.calls.get("throttled", 0)
+    cpu_before = time.process_time()
+    _, summary = run_local(level_config, counts, time_scale=time_scale, pipeline=pipeline)
+
+    wall = summary["wall_seconds"]
+    cpu = round((time.process_time() - cpu_before) / wall, 2) if wall else 0.0
+    return {
+        "concurrency": concurrency,
+        "files": len(counts),
+        "pages": sum(counts),
+        "wallSeconds": wall,
+        "filesPerSecond": round(len(counts) / wall, 2) if wall else 0.0,
+        "pagesPerSecond": round(sum(counts) / wall, 2) if wall else 0.0,
+        "stateErrors": sum(s["errors"] for s in summary["states"].values()),
+        "textractThrottled": pipeline.textract.calls.get("throttled", 0) - throttled_before,
+        "cpuUtilization": cpu,
+        "harnessBound": cpu >= HARNESS_CPU_BOUND,
+        "stagesMsPerFile": stage_ms_per_file(spans[first_span:], len(counts)),
+    }
+
+
+def find_knee(levels, knee_gain):
+    """The first level that adds less than knee_gain throughput over the previous one."""
+    for previous, level in zip(levels, levels[1:]):
+        if level["filesPerSecond"] < previous["filesPerSecond"] * (1 + knee_gain):
+            return previous
+    return None
+
+
+def find_bottleneck(levels):
+    """
+    The stage whose time per file grew most between the lowest and the
+    highest level, skipping harness-bound levels when there are others.
+    """
+    compared = [level for level in levels[1:] if not level["harnessBound"]] or levels[1:]
+    low, high = levels[0]["stagesMsPerFile"], compared[-1]["stagesMsPerFile"]
+    # File-level stages contain the others; rank the stages inside them
+    inner = [name for name in high if name not in FILE_STAGES]
+    growth = {
+        name: high[name] - low.get(name, 0.0)
+        for name in inner
+        if high[name] - low.get(name, 0.0) > max(GROWTH_MIN_MS, low.get(name, 0.0) * GROWTH_MIN_RATIO)
+    }
+    if growth:
+        stage = max(growth, key=growth.get)
+        return {"stage": stage, "reason": "grew with concurrency", "growthMsPerFile": round(growth[stage], 1),
+                "lowMsPerFile": low.get(stage, 0.0), "highMsPerFile": high[stage]}
+    if not inner:
+        return None
+    stage = max(inner, key=high.get)
+    return {"stage": stage, "reason": "largest stage; none grew (bound by concurrency)",
+            "highMsPerFile": high[stage]}
+
+
+def run(args):
+    from local_runner import LocalPipeline
+    from stepfunction_builder import load_config
+
+    config = load_config(args.env, args.config)
+    counts = page_counts(args.distribution, args.files, random.Random(args.seed))
+
+    stdout = sys.stdout
+    sys.stdout = open(os.devnull, "w")
+    try:
+        pipeline = LocalPipeline(time_scale=args.time_scale, s3_latency=args.s3_latency,
+                                 llm_latency=args.llm_latency, textract_kwargs={
+                                     "base_seconds": args.textract_seconds,
+                                     "per_page_seconds": args.textract_page_seconds,
+                                     "throttle_rate": args.textract_throttle,
+                                     "max_active_jobs": args.textract_max_jobs,
+                                 })
+        pipeline.fakes.FakeLLMAgent.throttle_rate = args.llm_throttle
+        pipeline.fakes.FakeLLMAgent.set_capacity(args.llm_capacity)
+        spans = []
+        sys.modules["tracing"].add_sink(spans.append)
+        levels = [run_level(pipeline, config, counts, c, spans, args.time_scale) for c in sorted(args.concurrency)]
+    finally:
+        sys.stdout = stdout
+
+    knee = find_knee(levels, args.knee_gain)
+    return {
+        "env": args.env,
+        "distribution": args.distribution,
+        "pageCounts": {"files": len(counts), "pages": sum(counts), "min": min(counts), "max": max(counts)},
+        "levels": levels,
+        "saturation": {"concurrency": knee["concurrency"], "filesPerSecond": knee["filesPerSecond"]} if knee else None,
+        "bottleneck": find_bottleneck(levels) if len(levels) > 1 else None,
+    }
+
+
+def format_result(result, top):
+    lines = [f"{result['env']}: {result['pageCounts']['files']} files, {result['pageCounts']['pages']} pages "
+             f"({result['distribution']}, {result['pageCounts']['min']}-{result['pageCounts']['max']} pages/file)",
+             f"{'concurrency':>11} {'files/s':>8} {'pages/s':>8} {'wall s':>7} {'errors':>6} {'throttled':>9} "
+             f"{'cpu':>5}  slowest stages (ms/file)"]
+    for level in result["levels"]:
+        stages = {k: v for k, v in level["stagesMsPerFile"].items() if k not in FILE_STAGES}
+        slowest = sorted(stages.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        lines.append(f"{level['concurrency']:>11} {level['filesPerSecond']:>8} {level['pagesPerSecond']:>8} "
+                     f"{level['wallSeconds']:>7} {level['stateErrors']:>6} {level['textractThrottled']:>9} "
+                     f"{level['cpuUtilization']:>5}{'*' if level['harnessBound'] else ' '} "
+                     + ", ".join(f"{name} {ms}" for name, ms in slowest))
+    if result["saturation"]:
+        lines.append(f"Saturates at concurrency {result['saturation']['concurrency']} "
+                     f"({result['saturation']['filesPerSecond']} files/s)")
+    else:
+        lines.append("No saturation within the tested concurrency levels")
+    bottleneck = result["bottleneck"]
+    if bottleneck:
+        detail = (f"{bottleneck['lowMsPerFile']} → {bottleneck['highMsPerFile']} ms/file"
+                  if "lowMsPerFile" in bottleneck else f"{bottleneck['highMsPerFile']} ms/file")
+        lines.append(f"Bottleneck: {bottleneck['stage']} ({bottleneck['reason']}, {detail})")
+    if any(level["harnessBound"] for level in result["levels"]):
+        lines.append("* harness CPU-bound: CPU-heavy stages are inflated by the local process, "
+                     "not by the simulated backends")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    from stepfunction_builder import ENVIRONMENTS
+
+    parser = argparse.ArgumentParser(description="Throughput vs concurrency of the local pipeline")
+    parser.add_argument("--env", choices=sorted(ENVIRONMENTS), default="prod")
+    parser.add_argument("--config", help="JSON file with config overrides")
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--distribution", default="uniform:1-10", help="Page counts, e.g. fixed:3, mix:1=0.7,20=0.3")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--time-scale", type=float, default=0.01, help="Multiplier for sleeps inside the Lambdas")
+    parser.add_argument("--s3-latency", type=float, default=0.005, help="Seconds per S3 call")
+    parser.add_argument("--textract-seconds", type=float, default=0.05, help="Textract job base duration")
+    parser.add_argument("--textract-page-seconds", type=float, default=0.01, help="Textract duration per page")
+    parser.add_argument("--textract-throttle", type=float, default=0.0, help="Fraction of Textract calls throttled")
+    parser.add_argument("--textract-max-jobs", type=int, help="Concurrent Textract job limit")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds per LLM completion")
+    parser.add_argument("--llm-throttle", type=float, default=0.0, help="Fraction of LLM calls rate limited")
+    parser.add_argument("--llm-capacity", type=int, help="Concurrent LLM completions (the rest queue)")
+    parser.add_argument("--knee-gain", type=float, default=0.1, help="Throughput gain below which a level saturates")
+    parser.add_argument("--top", type=int, default=3, help="Stages listed per level")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args()
+
+    result = run(args)
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_result(result, args.top))
@@ -0,0 +1,120 @@
+"""
+Memory high-water mark of the OCR Lambda per document size, and the
+Lambda memory size to configure.
+
+Each size runs in a fresh interpreter (ru_maxrss never goes down), which
+loads the Lambdas against the local fakes, replays the Textract fixture for
+that size (see fixtures.py) through OCR process_file with MEMORY_PROFILE=1
+and prints the memprofile.py report: traced peak and RSS high-water mark per
+stage, the top allocating lines, and a recommended memory size.
+
+    python benchmarks/memory.py
+    python benchmarks/memory.py --pages 10 50 200 --top 3
+    python benchmarks/memory.py --json
+
+The fake MongoDB keeps its own copy of everything written (about 16 MB for
+the 50-page Textract result), which a real client does not. The worker sets
+MEMORY_PROFILE_EXCLUDE to local_fakes.py, so that memory is reported as
+"fakes" and subtracted from the peaks and RSS before sizing. The worker
+still holds the other Lambdas and the local runner, so "loaded" is above the
+real function's and the recommendation errs high. Run with the Lambda
+runtime's Python (3.12) for representative numbers.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_PAGES = (1, 10, 50)
+WORKER_ENV = {
+    "MEMORY_PROFILE": "1",
+    # The fake MongoDB keeps a deep copy of what the function writes; a real client does not
+    "MEMORY_PROFILE_EXCLUDE": "*/local_fakes.py",
+    "TRACE_EXPORTER": "off",
+    "LOG_LEVEL": "WARNING",
+}
+
+
+def profile_pages(pages):
+    """Run one file of this size through OCR process_file; runs inside the worker process."""
+    from fixtures import ReplayTextract, fixture_for
+    from local_runner import LocalPipeline
+
+    textract = ReplayTextract()
+    pipeline = LocalPipeline(time_scale=0, llm_latency=0, textract=textract)
+    fixture = fixture_for(pages)
+    textract.use(fixture["textract"])
+    memprofile = sys.modules["memprofile"]
+    rss_loaded = memprofile.rss_peak_mb()
+
+    bucket, key = pipeline.seed([pages])[len("s3://"):].split("/", 1)
+    entry = json.loads(pipeline.s3.get_object(Bucket=bucket, Key=key)["Body"].read())["files"][0]
+    pipeline.modules["ocr"].process_file(dict(entry, executionId="memory-benchmark"))
+
+    report = dict(memprofile.last_report, pages=pages, fixture=fixture["source"], rssLoadedMB=rss_loaded)
+    report["requestGrowthMB"] = round(report["rssPeakMB"] - rss_loaded, 1)
+    return report
+
+
+def run(pages_list, python):
+    reports = []
+    for pages in pages_list:
+        proc = subprocess.run(
+            [python, os.path.abspath(__file__), "--worker", str(pages)],
+            env=dict(os.environ, **WORKER_ENV), capture_output=True, text=True, timeout=900,
+        )
+        if proc.returncode != 0:
+            raise SystemExit(f"{pages} pages: worker failed\n{proc.stderr.strip()}")
+        reports.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return reports
+
+
+def recommend(reports, headroom):
+    from memprofile import recommend_memory_mb
+
+    peak = max(r["rssPeakMB"] for r in reports)
+    return {"rssPeakMB": peak, "headroom": headroom, "recommendedMemoryMB": recommend_memory_mb(peak, headroom)}
+
+
+def format_reports(reports, recommendation, top):
+    lines = [f"{'pages':>5} {'stage':<18} {'peak MB':>9} {'retained MB':>12} {'RSS peak MB':>12}"]
+    for r in reports:
+        for s in r["stages"]:
+            lines.append(f"{r['pages']:>5} {s['stage']:<18} {s['peakMB']:>9.2f} {s['retainedMB']:>12.2f} "
+                         f"{s['rssPeakMB']:>12.1f}")
+            for alloc in s["top"][:top]:
+                lines.append(f"{'':>25}{alloc['sizeKB']:>9.1f} KB  {alloc['where']} ({alloc['count']} blocks)")
+        lines.append(f"{r['pages']:>5} {'total':<18} {r['tracedPeakMB']:>9.2f} {'':>12} {r['rssPeakMB']:>12.1f}"
+                     f"  (loaded {r['rssLoadedMB']} MB, request +{r['requestGrowthMB']} MB, "
+                     f"fakes {r['excludedMB']} MB excluded, {r['fixture']} fixture)")
+    lines.append(f"Recommended memory: {recommendation['recommendedMemoryMB']} MB "
+                 f"(peak RSS {recommendation['rssPeakMB']} MB x {recommendation['headroom']} headroom, "
+                 f"up to {max(r['pages'] for r in reports)} pages)")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OCR Lambda memory profile and memory size recommendation")
+    parser.add_argument("--pages", type=int, nargs="+", default=list(DEFAULT_PAGES))
+    parser.add_argument("--python", default=sys.executable, help="Interpreter for the worker processes")
+    parser.add_argument("--headroom", type=float, default=1.3, help="Multiplier over the peak RSS")
+    parser.add_argument("--top", type=int, default=3, help="Allocating lines listed per stage")
+    parser.add_argument("--json", action="store_true", help="Print the reports as JSON")
+    parser.add_argument("--worker", type=int, metavar="PAGES", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(profile_pages(args.worker), default=str))
+        sys.exit(0)
+
+    sys.path.insert(0, os.path.join(ROOT, "OCR_lambda1"))
+    reports = run(args.pages, args.python)
+    recommendation = recommend(reports, args.headroom)
+    if args.json:
+        print(json.dumps({"reports": reports, "recommendation": recommendation}, indent=2))
+    else:
+        print(format_reports(reports, recommendation, args.top))
@@ -0,0 +1,193 @@
+"""
+Offline per-stage benchmark of the OCR and structured Lambdas.
+
+Replays Textract and Azure OpenAI fixtures (see fixtures.py) through the
+real code, with S3 and MongoDB replaced by the local_fakes used by
+local_runner.py, and measures each stage per document size:
+
+    run_textract         lease, polling, pagination, normalization, Mongo write
+    normalize            normalize_textract_response (trp)
+    structure            structure_textract_output + RAW_LINES text
+    itemdescription      itemdescription_function (LLM answers replayed)
+    invoice_number       generate_invoice_number over --invoices existing invoices
+
+Time is the median of --repeat runs. Memory is the tracemalloc peak of
+one separate run, because tracing allocations slows the code down.
+
+    python benchmarks/pipeline.py
+    python benchmarks/pipeline.py --pages 1 10 50 --repeat 5
+    python benchmarks/pipeline.py --save benchmarks/baselines/pipeline.json
+    python benchmarks/pipeline.py --compare benchmarks/baselines/pipeline.json
+
+--compare exits with status 1 when a stage is slower or uses more memory
+than the baseline by more than --tolerance (and more than MIN_DELTA). Timings from the in-memory fakes
+are only comparable on the same machine. Record a new baseline after an
+intended change.
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Quiet Lambdas: no spans or INFO logs on stdout while measuring
+os.environ.setdefault("TRACE_EXPORTER", "off")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+from fixtures import ReplayLLMAgent, ReplayTextract, fake_llm_answers, fixture_for  # noqa: E402
+
+DEFAULT_PAGES = (1, 10, 50)
+# Differences below these are noise, whatever the relative change
+MIN_DELTA = {"medianMs": 5.0, "peakKB": 64.0}
+
+
+class Bench:
+    """The Lambda modules loaded once against the fakes, with a replayed Textract."""
+
+    def __init__(self, invoices=1000):
+        from local_runner import LocalPipeline
+
+        self.textract = ReplayTextract()
+        self.pipeline = LocalPipeline(time_scale=0, llm_latency=0, textract=self.textract)
+        self.extract_text = sys.modules["extract_text"]
+        self.itemdescription = sys.modules["itemdescription"]
+        self.ocr = self.pipeline.modules["ocr"]
+        self.user_id = self._seed_invoices(invoices)
+
+    def _seed_invoices(self, count):
+        from bson import ObjectId
+
+        user_oid = ObjectId()
+        self.pipeline.db["tb_file_details"].insert_many([
+            {"_id": ObjectId(), "userId": user_oid, "status": "1",
+             "updatedExtractedValues": {"invoiceNo": f"PFI-E25-{n:04d}"}}
+            for n in range(1, count + 1)
+        ])
+        return str(user_oid)
+
+    def stages(self, fixture):
+        """(stage, callable) pairs for one document; each callable runs the stage once."""
+        from bson import ObjectId
+
+        self.textract.use(fixture["textract"])
+        extract_text = self.extract_text
+        client, region, temp_bucket = extract_text.get_random_textract_client()
+        bucket = os.environ["S3_BUCKET_NAME"]
+        key = "bench/raw/document.pdf"
+        self.pipeline.s3.put_object(Bucket=bucket, Key=key, Body=b"%PDF")
+
+        textract_json = {"Blocks": [b for r in fixture["textract"] for b in r["Blocks"]],
+                         "DocumentMetadata": fixture["textract"][0].get("DocumentMetadata", {})}
+        normalized = extract_text.normalize_textract_response(textract_json)
+
+        def structure():
+            tables = self.ocr.structure_textract_output(normalized["tables"])
+            return f"{tables}\n\nRAW_LINES\n" + "\n".join(normalized["lines"])
+
+        text = structure()
+        agent = ReplayLLMAgent(fixture["llm"] or fake_llm_answers(text))
+        self.itemdescription.get_agent = lambda: agent
+        invoice_date = time.strftime("%Y-%m-%d")
+
+        return [
+            ("run_textract", lambda: extract_text.run_textract(
+                bucket, key, ObjectId(), client, temp_bucket, region, raise_retryable=True)),
+            ("normalize", lambda: extract_text.normalize_textract_response(textract_json)),
+            ("structure", structure),
+            ("itemdescription", lambda: self.itemdescription.itemdescription_function(text)),
+            ("invoice_number", lambda: self.itemdescription.generate_invoice_number(
+                self.pipeline.db, invoice_date, self.user_id)),
+        ]
+
+
+def measure(fn, repeat):
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "medianMs": round(statistics.median(durations), 2),
+        "minMs": round(min(durations), 2),
+        "peakKB": round(peak / 1024, 1),
+    }
+
+
+def run(pages_list, repeat, invoices):
+    bench = Bench(invoices=invoices)
+    results = []
+    for pages in pages_list:
+        fixture = fixture_for(pages)
+        blocks = sum(len(r["Blocks"]) for r in fixture["textract"])
+        for stage, fn in bench.stages(fixture):
+            results.append(dict(measure(fn, repeat), pages=pages, stage=stage,
+                                fixture=fixture["source"], blocks=blocks))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Stages slower or bigger than the baseline by more than tolerance (a fraction) and MIN_DELTA."""
+    previous = {(r["pages"], r["stage"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        before = previous.get((r["pages"], r["stage"]))
+        if not before:
+            continue
+        for metric in ("medianMs", "peakKB"):
+            if r[metric] > before[metric] * (1 + tolerance) and r[metric] - before[metric] > MIN_DELTA[metric]:
+                regressions.append({"pages": r["pages"], "stage": r["stage"], "metric": metric,
+                                    "baseline": before[metric], "current": r[metric]})
+    return regressions
+
+
+def format_results(results, regressions=()):
+    flagged = {(r["pages"], r["stage"], r["metric"]) for r in regressions}
+    lines = [f"{'pages':>5} {'stage':<16} {'median ms':>10} {'min ms':>9} {'peak KB':>10}  fixture"]
+    for r in results:
+        marks = "".join(" !" + m for p, s, m in flagged if (p, s) == (r["pages"], r["stage"]))
+        lines.append(f"{r['pages']:>5} {r['stage']:<16} {r['medianMs']:>10.2f} {r['minMs']:>9.2f} "
+                     f"{r['peakKB']:>10.1f}  {r['fixture']} ({r['blocks']} blocks){marks}")
+    for r in regressions:
+        lines.append(f"REGRESSION {r['pages']}p {r['stage']} {r['metric']}: {r['baseline']} → {r['current']}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Offline per-stage benchmark with replayed fixtures")
+    parser.add_argument("--pages", type=int, nargs="+", default=list(DEFAULT_PAGES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--invoices", type=int, default=1000, help="Existing invoices for invoice_number")
+    parser.add_argument("--save", metavar="BASELINE", help="Write the results as the new baseline")
+    parser.add_argument("--compare", metavar="BASELINE", help="Fail on regressions against a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown/growth (fraction)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.pages, args.repeat, args.invoices)
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"repeat": args.repeat, "invoices": args.invoices, "results": results}, f, indent=2)
+            f.write("\n")
+
+    if args.json:
+        print(json.dumps({"results": results, "regressions": regressions}, indent=2))
+    else:
+        print(format_results(results, regressions))
+    sys.exit(1 if regressions else 0)
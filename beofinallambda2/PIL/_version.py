@@ -1,4 +0,0 @@
-# Master version for Pillow
-from __future__ import annotations
-
-__version__ = "11.0.0"
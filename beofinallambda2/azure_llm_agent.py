@@ -1,10 +1,13 @@
 import json
 import re
 import time
-import httpx
-from openai import AzureOpenAI, RateLimitError
+import random
+import threading
 import os
 from dotenv import load_dotenv
+from errors import RetryableError, record_throttle
+from llm_usage import record_usage
+import log
 load_dotenv()
 
 AZURE_OPENAI_API_KEY = os.getenv("AZURE_OPENAI_API_KEY")
@@ -12,21 +15,66 @@ AZURE_OPENAI_ENDPOINT = os.getenv("AZURE_OPENAI_ENDPOINT")
 AZURE_OPENAI_API_VERSION = os.getenv("AZURE_OPENAI_API_VERSION")
 AZURE_OPENAI_DEPLOYMENT = os.getenv("AZURE_OPENAI_DEPLOYMENT")
 
+# 429s are retried here a few times; after that the Step Functions Retry takes over
+LLM_RATE_LIMIT_RETRIES = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "3"))
+LLM_RETRY_BASE_SECONDS = float(os.getenv("LLM_RETRY_BASE_SECONDS", "2"))
+LLM_RETRY_MAX_SECONDS = float(os.getenv("LLM_RETRY_MAX_SECONDS", "20"))
+# Connection pool of the shared agent (batch mode runs several files at once)
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "10"))
+
+
+def _retry_after_seconds(error):
+    """Retry-After header of a 429 response, if the service sent one."""
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
 
 class AzureLLMAgent:
     def __init__(self):
-        self.client = AzureOpenAI(
+        # openai (with pydantic and httpx) is the slowest import of this Lambda; it is
+        # loaded with the first agent so paths without an LLM call never pay for it
+        import httpx
+        import openai
+
+        self.client = openai.AzureOpenAI(
             api_key=AZURE_OPENAI_API_KEY,
             azure_endpoint=AZURE_OPENAI_ENDPOINT,
             api_version=AZURE_OPENAI_API_VERSION,
-            http_client=httpx.Client(),
+            http_client=httpx.Client(limits=httpx.Limits(max_connections=LLM_MAX_CONNECTIONS)),
         )
         self.model = AZURE_OPENAI_DEPLOYMENT
-        self.RateLimitError = RateLimitError
+        self.RateLimitError = openai.RateLimitError
+        self.UnavailableErrors = (openai.APIConnectionError, openai.InternalServerError)
+
+    def _create(self, call, **kwargs):
+        """
+        chat.completions.create with a bounded, jittered retry on rate limits.
+        Raises RetryableError when the limit persists or Azure is unavailable.
+        Token usage is recorded per call (see llm_usage.py).
+        """
+        for attempt in range(LLM_RATE_LIMIT_RETRIES + 1):
+            try:
+                resp = self.client.chat.completions.create(**kwargs)
+                record_usage(call, getattr(resp, "usage", None), getattr(resp, "model", None) or self.model)
+                return resp
+            except self.RateLimitError as e:
+                record_throttle("azure_openai")
+                if attempt == LLM_RATE_LIMIT_RETRIES:
+                    raise RetryableError(f"Azure OpenAI rate limit: {e}") from e
+                cap = min(LLM_RETRY_MAX_SECONDS, LLM_RETRY_BASE_SECONDS * 2 ** attempt)
+                delay = _retry_after_seconds(e) or random.uniform(0, cap)
+                log.warning("llm_rate_limited", delaySeconds=round(delay, 1), attempt=attempt + 1,
+                            maxRetries=LLM_RATE_LIMIT_RETRIES)
+                time.sleep(delay)
+            except self.UnavailableErrors as e:
+                raise RetryableError(f"Azure OpenAI unavailable: {e}") from e
 
     def complete(self, prompt: str) -> str:
         try:
-            resp = self.client.chat.completions.create(
+            resp = self._create(
+                "structured",
                 model=self.model,
                 messages=[
                     {
@@ -42,14 +90,13 @@ class AzureLLMAgent:
                 temperature=0.1,
             )
             content = resp.choices[0].message.content
-            print(f"[LLM COMPLETE] prompt_len={len(prompt)} → resp_len={len(content)}")
+            log.debug("llm_complete", promptChars=len(prompt), responseChars=len(content))
+            log.payload("llm_response", content)
             return content.strip()
-        except self.RateLimitError:
-            print("⚠️ Rate limit hit. Retrying after 5 seconds…")
-            time.sleep(5)
-            return self.complete(prompt)
+        except RetryableError:
+            raise
         except Exception as e:
-            print(f"❌ LLM Error: {e}")
+            log.error("llm_failed", error=f"{type(e).__name__}: {e}")
             return "{}"
 
     def _parse_code_desc(self, text: str, fallback_code: str = None, fallback_desc: str = None):
@@ -198,7 +245,8 @@ class AzureLLMAgent:
         ---
         """
         try:
-            resp = self.client.chat.completions.create(
+            resp = self._create(
+                "canonical",
                 model=self.model,
                 messages=[{"role": "system", "content": prompt}],
                 temperature=0,
@@ -213,7 +261,25 @@ class AzureLLMAgent:
                     data = json.loads(match.group(0))
                 else:
                     data = {"beoNumber": None, "itemDescriptions": []}
+        except RetryableError:
+            raise
         except Exception as e:
-            print(f"⚠️ LLM parsing error: {e}")
+            log.warning("llm_parse_failed", error=str(e))
             data = {"beoNumber": None, "itemDescriptions": []}
         return data
+
+
+_agent = None
+_agent_lock = threading.Lock()
+
+
+def get_agent():
+    """
+    Process-wide AzureLLMAgent, so warm invocations and batch workers reuse
+    one client and its keep-alive connections instead of a new TLS setup per file.
+    """
+    global _agent
+    with _agent_lock:
+        if _agent is None:
+            _agent = AzureLLMAgent()
+        return _agent
@@ -0,0 +1,79 @@
+import os
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from errors import is_retryable
+import log
+
+
+# ======================================================
+# 📦 Batch mode
+# ======================================================
+#
+# Shared by OCR_lambda1 and beofinallambda2 (keep both copies identical).
+# With "batching" enabled, ScheduleFiles groups small files into one Map item
+# {"batchId": "...", "files": [...]} (see stepfunction_builder.py). A handler
+# receiving such an event runs its per-file function for every file on a
+# thread pool, sharing the module-level Mongo/boto3/LLM clients, and returns
+# one result per file so a failing file does not fail the rest of the batch.
+#
+# Step Functions can only retry a batch as a whole, which would redo the
+# files that already succeeded. Transient per-file errors are retried here
+# instead; the last attempt runs with no retries remaining (retryCount ==
+# maxRetries), so the handler takes its terminal path (e.g. credit rollback).
+
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "4"))
+BATCH_FILE_ATTEMPTS = int(os.getenv("BATCH_FILE_ATTEMPTS", "3"))
+BATCH_RETRY_BASE_SECONDS = float(os.getenv("BATCH_RETRY_BASE_SECONDS", "2"))
+BATCH_RETRY_MAX_SECONDS = float(os.getenv("BATCH_RETRY_MAX_SECONDS", "20"))
+
+# Copied from each file event onto its result, so the next task gets them back
+CARRIED_FIELDS = ("fileId", "userId", "clusterId", "creditId", "debug", "profile")
+
+
+def is_batch(event) -> bool:
+    return isinstance(event.get("files"), list)
+
+
+def file_events(event):
+    """One event per file: the file's fields plus the batch-level ones (executionId, attempt, ...)."""
+    shared = {k: v for k, v in event.items() if k not in ("files", "batchId", "retryCount", "maxRetries")}
+    return [dict(shared, **f) for f in event["files"]]
+
+
+def run_file(process, event):
+    """Run process(event), retrying transient errors in place; never raises."""
+    last_attempt = BATCH_FILE_ATTEMPTS - 1
+    for attempt in range(BATCH_FILE_ATTEMPTS):
+        try:
+            return process(dict(event, retryCount=attempt, maxRetries=last_attempt))
+        except Exception as e:
+            if attempt < last_attempt and is_retryable(e):
+                cap = min(BATCH_RETRY_MAX_SECONDS, BATCH_RETRY_BASE_SECONDS * 2 ** attempt)
+                delay = random.uniform(0, cap)
+                log.warning("batch_file_retry", fileId=event.get("fileId"), error=str(e),
+                            delaySeconds=round(delay, 1), attempt=attempt + 1, maxRetries=last_attempt)
+                time.sleep(delay)
+                continue
+            log.error("batch_file_failed", fileId=event.get("fileId"), error=f"{type(e).__name__}: {e}")
+            return {"status": "failed", "error": f"{type(e).__name__}: {e}"}
+
+
+def run_batch(process, event):
+    """
+    Process every file of a batch event concurrently.
+    Returns {"batchId", "files": [result per file, in input order, with its IDs]}.
+    """
+    events = file_events(event)
+    workers = max(1, min(BATCH_CONCURRENCY, len(events)))
+    log.info("batch_started", batchId=event.get("batchId"), files=len(events), workers=workers)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda e: run_file(process, e), events))
+
+    files = [
+        dict({k: e.get(k) for k in CARRIED_FIELDS}, **(result or {}))
+        for e, result in zip(events, results)
+    ]
+    return {"batchId": event.get("batchId"), "files": files}
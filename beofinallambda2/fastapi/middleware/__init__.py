@@ -1 +0,0 @@
-from starlette.middleware import Middleware as Middleware
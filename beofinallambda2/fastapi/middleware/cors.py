@@ -1 +0,0 @@
-from starlette.middleware.cors import CORSMiddleware as CORSMiddleware  # noqa
@@ -1,3 +0,0 @@
-from starlette.middleware.httpsredirect import (  # noqa
-    HTTPSRedirectMiddleware as HTTPSRedirectMiddleware,
-)
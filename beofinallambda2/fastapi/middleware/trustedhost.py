@@ -1,3 +0,0 @@
-from starlette.middleware.trustedhost import (  # noqa
-    TrustedHostMiddleware as TrustedHostMiddleware,
-)
@@ -1,2 +0,0 @@
-from starlette.requests import HTTPConnection as HTTPConnection  # noqa: F401
-from starlette.requests import Request as Request  # noqa: F401
@@ -1,10 +0,0 @@
-from typing import Optional, Tuple
-
-
-def get_authorization_scheme_param(
-    authorization_header_value: Optional[str],
-) -> Tuple[str, str]:
-    if not authorization_header_value:
-        return "", ""
-    scheme, _, param = authorization_header_value.partition(" ")
-    return scheme, param
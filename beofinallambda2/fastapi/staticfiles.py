@@ -1 +0,0 @@
-from starlette.staticfiles import StaticFiles as StaticFiles  # noqa
@@ -1 +0,0 @@
-from starlette.templating import Jinja2Templates as Jinja2Templates  # noqa
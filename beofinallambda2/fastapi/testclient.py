@@ -1 +0,0 @@
-from starlette.testclient import TestClient as TestClient  # noqa
@@ -1,3 +0,0 @@
-from starlette.websockets import WebSocket as WebSocket  # noqa
-from starlette.websockets import WebSocketDisconnect as WebSocketDisconnect  # noqa
-from starlette.websockets import WebSocketState as WebSocketState  # noqa
@@ -1,2 +0,0 @@
-class FastAPICLIException(Exception):
-    pass
@@ -1,13 +0,0 @@
-# This file MUST NOT contain anything but the __version__ assignment.
-#
-# When making a release, change the value of __version__
-# to an appropriate value, and open a pull request against
-# the correct branch (master if making a new feature release).
-# The commit message MUST contain a properly formatted release
-# log, and the commit must be signed.
-#
-# The release automation will: build and test the packages for the
-# supported platforms, publish the packages on PyPI, merge the PR
-# to the target branch, create a Git tag pointing to the commit.
-
-__version__ = '0.6.4'
@@ -1,5 +0,0 @@
-from .parser import *  # NoQA
-from .errors import *  # NoQA
-from .url_parser import *  # NoQA
-
-__all__ = parser.__all__ + errors.__all__ + url_parser.__all__  # NoQA
@@ -1,34 +1,25 @@
-
-import os
-import re
-import time
 import json
-import traceback
-from uuid import uuid4
 from datetime import datetime, timezone
-import boto3
-import httpx
-from pymongo import MongoClient
 from bson import ObjectId
-from dotenv import load_dotenv
-from datetime import datetime, timezone
-from utils import utc_now_iso, detect_currency, update_job_status, jobs
-import re
-from azure_llm_agent import AzureLLMAgent
-
+from pymongo import ReturnDocument
+from utils import detect_currency
+from azure_llm_agent import get_agent
+from tracing import span
+import log
 
-
-invoice_number_var = None
+# One sequence document per user: {"_id": userId, "seq": <last issued number>}
+INVOICE_COUNTERS = "tb_invoice_counters"
 
 
 def itemdescription_function(extracted_text: str):
-    global invoice_number_var
-    agent = AzureLLMAgent()
+    agent = get_agent()
 
     prompt = agent.build_prompt(extracted_text)
-    structured_json_text = agent.complete(prompt)
+    with span("llm_structured", promptChars=len(prompt)):
+        structured_json_text = agent.complete(prompt)
 
-    canon = agent.extract_invoice_and_items(extracted_text)
+    with span("llm_canonical"):
+        canon = agent.extract_invoice_and_items(extracted_text)
     canon_beo_no = canon.get("beoNumber") or canon.get("invoiceNumber")
     canon_items = canon.get("itemDescriptions", []) or []
 
@@ -96,9 +87,6 @@ def itemdescription_function(extracted_text: str):
 
             parsed["items"] = normalized_items
 
-        # Store global variable
-        invoice_number_var = parsed.get("beoNumber")
-
         # Defaults for eventName and billTo
         if not parsed.get("eventName"):
             parsed["eventName"] = "London Business School Event"
@@ -110,19 +98,18 @@ def itemdescription_function(extracted_text: str):
                 "PO Box 506630, Dubai, UAE"
             )
 
-        print(
-            f"[STRUCTURED] Event={parsed.get('eventName')} "
-            f"BEO={parsed.get('beoNumber')} "
-            f"EventDate={parsed.get('eventDate')} "
-            f"InvoiceDate={parsed.get('invoiceDate')} "
-            f"BillTo={parsed.get('billTo')} "
-            f"Items={len(parsed.get('items', []))}"
+        log.info(
+            "structured_parsed",
+            beoNumber=parsed.get("beoNumber"),
+            eventDate=parsed.get("eventDate"),
+            invoiceDate=parsed.get("invoiceDate"),
+            items=len(parsed.get("items", [])),
         )
 
         return parsed
 
     except Exception as e:
-        print(f"⚠️ Could not parse BEO JSON: {e}")
+        log.warning("structured_parse_failed", error=str(e))
         return {
             "rawStructured": structured_json_text,
             "eventName": "London Business School Event",
@@ -184,22 +171,11 @@ def itemdescription_function(extracted_text: str):
 #     return f"{PREFIX}-{year_code}-{seq_str}"
 
 
-def generate_invoice_number(db, invoice_date: str, user_id: str):
-
-    PREFIX = "PFI"
-    BASE = 173
-
-    # --- Build Year Code ---
-    try:
-        year = int(invoice_date.split("-")[0])
-        year_code = f"E{str(year)[-2:]}"
-    except:
-        raise Exception("Invalid invoiceDate format; expected YYYY-MM-DD")
-
-    # --- Fetch all invoiceNos for this user ---
+def _highest_invoice_number(db, user_oid):
+    """Highest sequence among the user's existing invoiceNos (0 if none); seeds the counter."""
     cursor = db["tb_file_details"].find(
         {
-            "userId": ObjectId(user_id),
+            "userId": user_oid,
             "status": "1",
             "updatedExtractedValues.invoiceNo": {"$exists": True}
         },
@@ -212,26 +188,56 @@ def generate_invoice_number(db, invoice_date: str, user_id: str):
         invoice_no = doc["updatedExtractedValues"]["invoiceNo"]
 
         # Expected format: PFI-E25-0172
-        parts = invoice_no.split("-")
+        parts = str(invoice_no).split("-")
         if len(parts) != 3:
             continue
 
         try:
             num = int(parts[2])
-            # print(num)  # 🔥 NO DIGIT LIMIT
             max_number = max(max_number, num)
-            print(max_number)
         except ValueError:
             continue
 
-    # --- Decide next sequence ---
-    next_seq = BASE if max_number == 0 else max_number + 1
+    return max_number
+
+
+def generate_invoice_number(db, invoice_date: str, user_id: str):
+    """
+    Next invoice number for a user, e.g. PFI-E25-0173. The sequence is an
+    atomic $inc on the user's tb_invoice_counters document, so concurrent
+    files (Map iterations, or the files of one batch) never share a number.
+    """
+
+    PREFIX = "PFI"
+    BASE = 173
+
+    # --- Build Year Code ---
+    try:
+        year = int(invoice_date.split("-")[0])
+        year_code = f"E{str(year)[-2:]}"
+    except:
+        raise Exception("Invalid invoiceDate format; expected YYYY-MM-DD")
+
+    user_oid = ObjectId(user_id)
+    counters = db[INVOICE_COUNTERS]
+
+    # --- Take the next sequence atomically ---
+    counter = counters.find_one_and_update(
+        {"_id": user_oid}, {"$inc": {"seq": 1}}, return_document=ReturnDocument.AFTER
+    )
+    if counter is None:
+        # First number for this user since the counter was introduced: start after
+        # the invoiceNos already issued ($max keeps concurrent seeds from going back)
+        max_number = _highest_invoice_number(db, user_oid)
+        counters.update_one({"_id": user_oid}, {"$max": {"seq": max_number or BASE - 1}}, upsert=True)
+        counter = counters.find_one_and_update(
+            {"_id": user_oid}, {"$inc": {"seq": 1}}, return_document=ReturnDocument.AFTER
+        )
 
-    seq_str = str(next_seq).zfill(4)
+    seq_str = str(counter["seq"]).zfill(4)
 
     invoice_no = f"{PREFIX}-{year_code}-{seq_str}"
 
-    print(f"[DEBUG] max_number found: {max_number}")
-    print(f"[DEBUG] Generated invoiceNo: {invoice_no}")
+    log.debug("invoice_number", seq=counter["seq"], invoiceNo=invoice_no)
 
     return invoice_no
\ No newline at end of file
@@ -1,13 +1,18 @@
-import json
 import os
-import boto3
 from datetime import datetime, timezone
 from pymongo import MongoClient
 from bson import ObjectId
 
 from itemdescription import itemdescription_function,generate_invoice_number
-from update_credits import update_debit_credit, delete_credit_record
-from utils import update_job_status
+from update_credits import settle_or_defer, CREDIT_SETTLEMENT_MODE
+from job_status import JOB_STATUS_COLLECTION, JobStatusRecorder, ensure_indexes
+from payload_store import resolve_text
+from errors import RetryableError, TerminalError, is_retryable, retries_remaining, surface_retryable
+from batch import is_batch, run_batch
+from llm_usage import LLM_USAGE, drain_usage, write_usage
+from tracing import span, trace_context
+from sampler import sampled
+import log
 
 # --- ENV ---
 MONGO_URI = os.getenv("PROD_MONGO_URI")
@@ -16,148 +21,228 @@ MONGO_DB = os.getenv("MONGO_DATABASE")
 mongo_client = MongoClient(MONGO_URI)
 db = mongo_client[MONGO_DB]
 col_files = db["tb_file_details"]
+col_job_status = db[JOB_STATUS_COLLECTION]
+ensure_indexes(db)
+col_llm_usage = db[LLM_USAGE]
 
 
+@surface_retryable
 def lambda_handler(event, context):
-    print("Incoming Event:", event)
+    # Batch of small files (see batch.py): per-file results, failures isolated
+    if is_batch(event):
+        return run_batch(process_batch_file, event)
+    return process_file(event)
+
+
+def process_batch_file(event):
+    """Files whose OCR already failed in the batch only have their credit released."""
+    if not event.get("error"):
+        return process_file(event)
+
+    with trace_context(fileId=event.get("fileId"), executionId=event.get("executionId")), \
+            log.request(event), span("structured", ocrFailed=True):
+        return _release_failed_ocr(event)
+
+
+def _release_failed_ocr(event):
+    deferred = event.get("settlementMode", CREDIT_SETTLEMENT_MODE) == "deferred"
+    settlement = None
+    if event.get("creditId"):
+        settlement = settle_or_defer("rollback", ObjectId(event["creditId"]), ObjectId(event["fileId"]),
+                                     event.get("attempt", 0), deferred)
+
+    job_status = JobStatusRecorder(
+        col_job_status, event["fileId"], "structured",
+        fileId=ObjectId(event["fileId"]), executionId=event.get("executionId")
+    )
+    with job_status:
+        job_status.record("failed", f"OCR failed: {event['error']}")
+
+    return {
+        "status": "failed",
+        "pagesCount": 0,
+        "summary": {},
+        "error": event["error"],
+        "settlement": settlement if deferred else None
+    }
+
+
+def process_file(event):
+    with trace_context(fileId=event.get("fileId"), executionId=event.get("executionId")), \
+            log.request(event), span("structured"), sampled(event):
+        drain_usage()  # drop calls left on this thread by an earlier file
+        try:
+            return _process_file(event)
+        finally:
+            # Tokens are spent whatever the outcome, so failed and retried files are counted too
+            write_usage(
+                col_llm_usage, event.get("fileId"), drain_usage(),
+                userId=_object_id(event.get("userId")), clusterId=_object_id(event.get("clusterId")),
+                pages=event.get("pages"), executionId=event.get("executionId"),
+            )
+
+
+def _object_id(value):
+    return ObjectId(value) if value and ObjectId.is_valid(value) else None
+
+
+def _process_file(event):
+    log.payload("structured_event", event)
 
     try:
         fileId = event["fileId"]
         userId = event["userId"]
         clusterId = event["clusterId"]
         creditId = event.get("creditId")
-        text_content = event["text_content"]
+        with span("s3_read", inline=event.get("text_ref") is None):
+            text_content = resolve_text(event.get("text_content"), event.get("text_ref"))
         pages = event.get("pages", 1)
+        attempt = event.get("attempt", 0)
+        deferred = event.get("settlementMode", CREDIT_SETTLEMENT_MODE) == "deferred"
+        source_etag = event.get("sourceETag")
 
-    except Exception as e:
-        return {"error": f"Missing required fields: {e}"}
+    except KeyError as e:
+        # Raised, not returned: the Catch sends the file to FailLambda and its credit is released
+        raise TerminalError(f"Missing required fields: {e}") from e
 
     file_oid = ObjectId(fileId)
     user_oid = ObjectId(userId)
     cluster_oid = ObjectId(clusterId)
     credit_oid = ObjectId(creditId) if creditId else None
 
-    job_id = ObjectId()
+    # --- Job status is buffered and written once when the block exits ---
+    job_status = JobStatusRecorder(
+        col_job_status, fileId, "structured",
+        fileId=file_oid, userId=user_oid, clusterId=cluster_oid, pages=pages,
+        executionId=event.get("executionId")
+    )
 
-    # --- Update job: started ---
-    update_job_status(job_id, "processing", "Starting invoice extraction")
+    with job_status:
+        job_status.record("started", "Starting invoice extraction")
 
-    structured = {}
-    summary = {}
+        structured = {}
+        summary = {}
+        settlement = None
 
-    try:
+        try:
         
-        # --- Fetch existing invoiceNo before extraction ---
-        existing_invoice_no = None
-
-        existing_doc = col_files.find_one(
-            {"_id": file_oid},
-            {"updatedExtractedValues.invoiceNo": 1}
-        )
-
-        if existing_doc:
-            existing_invoice_no = existing_doc.get("updatedExtractedValues", {}).get("invoiceNo")
-
-        print("[DEBUG] Existing invoiceNo:", existing_invoice_no)
+            # --- Fetch existing invoiceNo before extraction ---
+            existing_invoice_no = None
+
+            with span("mongo_read", collection="tb_file_details"):
+                existing_doc = col_files.find_one(
+                    {"_id": file_oid},
+                    {"updatedExtractedValues.invoiceNo": 1}
+                )
+
+            if existing_doc:
+                existing_invoice_no = existing_doc.get("updatedExtractedValues", {}).get("invoiceNo")
+
+            log.debug("existing_invoice_number", invoiceNo=existing_invoice_no)
+
+            # --- Extract structured invoice items from text ---
+            structured = itemdescription_function(text_content)
+            log.payload("structured_items", structured)
+
+            if not structured or not structured.get("items"):
+                if credit_oid:
+                    settlement = settle_or_defer("rollback", credit_oid, file_oid, attempt, deferred)
+                job_status.record("no-items", "No items extracted")
+                return {
+                    "pagesCount": pages,
+                    "summary": summary,
+                    "status": "no-items",
+                    "settlement": settlement if deferred else None
+                }
+
+            invoice_doc_update = {
+                "extractedText": text_content,
+                "extractedValues": structured,
+                "updatedExtractedValues": structured,
+                "rawStructured": structured,
+                "updatedAt": datetime.now(timezone.utc),
+            }
+            if source_etag:
+                # Lets the precheck skip this file when the same content is submitted again
+                invoice_doc_update["sourceETag"] = source_etag
+
+            # --- Update MongoDB with extracted invoice data ---
+            with span("mongo_write", collection="tb_file_details"):
+                update_res = col_files.update_one(
+                    {"_id": file_oid, "clusterId": cluster_oid, "userId": user_oid},
+                    {"$set": invoice_doc_update},
+                    upsert=False
+                )
+
+            if update_res.modified_count == 0:
+                raise Exception("Mongo update failed — file not found OR no changes")
+
+            # --- Final invoiceNo decision ---
+            if existing_invoice_no:
+                # Preserve existing invoice number
+                structured["invoiceNo"] = existing_invoice_no
+                log.info("invoice_number_reused", invoiceNo=existing_invoice_no)
+
+                with span("mongo_write", collection="tb_file_details", field="invoiceNo"):
+                    col_files.update_one(
+                        {"_id": file_oid},
+                        {"$set": {
+                            "extractedValues.invoiceNo": existing_invoice_no,
+                            "updatedExtractedValues.invoiceNo": existing_invoice_no
+                        }}
+                    )
+
+            else:
+                # Generate only if NOT existing
+                with span("invoice_number"):
+                    invoice_no = generate_invoice_number(
+                        db,
+                        structured.get("invoiceDate"),
+                        userId)
+
+                structured["invoiceNo"] = invoice_no
+                log.info("invoice_number_generated", invoiceNo=invoice_no)
+
+                with span("mongo_write", collection="tb_file_details", field="invoiceNo"):
+                    col_files.update_one(
+                        {"_id": file_oid},
+                        {"$set": {
+                            "extractedValues.invoiceNo": invoice_no,
+                            "updatedExtractedValues.invoiceNo": invoice_no
+                        }}
+                    )
+
+            # --- Deduct Credits (last, so nothing after it can fail the file) ---
+            settlement = settle_or_defer("debit", credit_oid, file_oid, attempt, deferred)
+
+        except Exception as e:
+            log.error("structured_failed", error=f"{type(e).__name__}: {e}")
+
+            # Transient (LLM 429, Mongo failover): keep the credit reserved and let
+            # Step Functions retry the task; the debit is idempotent per attempt
+            if is_retryable(e) and retries_remaining(event):
+                raise RetryableError(str(e)) from e
+
+            # Rollback credit record if update fails
+            if credit_oid:
+                settlement = settle_or_defer("rollback", credit_oid, file_oid, attempt, deferred)
 
-        # --- Extract structured invoice items from text ---
-        structured = itemdescription_function(text_content)
-        print('*********')
-        print("STRUCTURED ITEMS:", structured)
-        print('*********')
+            job_status.record("failed", str(e))
 
-        if not structured or not structured.get("items"):
-            if credit_oid:
-                print(f"Deleting credit record due to failure: {credit_oid}")
-                delete_credit_record(credit_oid,file_oid)
             return {
+                "status": "failed",
                 "pagesCount": pages,
                 "summary": summary,
-                "status": "no-items"
+                "error": str(e),
+                "settlement": settlement if deferred else None
             }
 
-        invoice_doc_update = {
-            "extractedText": text_content,
-            "extractedValues": structured,
-            "updatedExtractedValues": structured,
-            "rawStructured": structured,
-            "updatedAt": datetime.now(timezone.utc),
-        }
-
-        # --- Update MongoDB with extracted invoice data ---
-        update_res = col_files.update_one(
-            {"_id": file_oid, "clusterId": cluster_oid, "userId": user_oid},
-            {"$set": invoice_doc_update},
-            upsert=False
-        )
-
-        if update_res.modified_count == 0:
-            raise Exception("Mongo update failed — file not found OR no changes")
-
-        print("[STRUCTURED] Stored structured_json in Mongo")
-
-        # --- Deduct Credits ---
-        credits_to_deduct = pages
-        credit_result = update_debit_credit(
-            user_oid, cluster_oid, file_oid, credits_to_deduct, job_id, credit_oid
-        )
-        print(f"[CREDITS] {credit_result}")
-        
-        # --- Final invoiceNo decision ---
-        if existing_invoice_no:
-            # Preserve existing invoice number
-            structured["invoiceNo"] = existing_invoice_no
-            print("[INFO] Reusing existing invoiceNo:", existing_invoice_no)
-
-            col_files.update_one(
-                {"_id": file_oid},
-                {"$set": {
-                    "extractedValues.invoiceNo": existing_invoice_no,
-                    "updatedExtractedValues.invoiceNo": existing_invoice_no
-                }}
-            )
-
-        else:
-            # Generate only if NOT existing
-            invoice_no = generate_invoice_number(
-                db,
-                structured.get("invoiceDate"),
-                userId)
-
-            structured["invoiceNo"] = invoice_no
-            print("[INFO] Generated new invoiceNo:", invoice_no)
-
-            col_files.update_one(
-                {"_id": file_oid},
-                {"$set": {
-                    "extractedValues.invoiceNo": invoice_no,
-                    "updatedExtractedValues.invoiceNo": invoice_no
-                }}
-            )
-
-
-    except Exception as e:
-        print(f"[ERROR] {e}")
-
-        # Rollback credit record if update fails
-        if credit_oid:
-            print(f"Deleting credit record due to failure: {credit_oid}")
-            delete_credit_record(credit_oid,file_oid)
-
-        update_job_status(job_id, "failed", str(e))
+        # --- Success ---
+        job_status.record("completed", "Invoice processed successfully")
 
         return {
-            "status": "failed",
+            "status": "success",
             "pagesCount": pages,
-            "summary": summary,
-            "error": str(e)
+            "summary": structured,
+            "settlement": settlement if deferred else None
         }
-
-    # --- Success ---
-    update_job_status(job_id, "completed", "Invoice processed successfully")
-
-    return {
-        "status": "success",
-        "pagesCount": pages,
-        "summary": structured
-    }
@@ -0,0 +1,178 @@
+import os
+import argparse
+import threading
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from pymongo.errors import PyMongoError
+
+import log
+
+
+# ======================================================
+# 🪙 LLM token accounting
+# ======================================================
+#
+# AzureLLMAgent records the usage block of every chat completion here,
+# thread-local like errors.record_throttle, so batch workers count their own
+# file. After each file the structured Lambda adds the counts to the file's
+# document in tb_llm_usage (next to tb_credits):
+#
+# { "_id": ObjectId(fileId), "userId": ..., "clusterId": ..., "pages": 3,
+#   "model": "...", "calls": 2, "invocations": 1,
+#   "promptTokens": 5210, "completionTokens": 812, "cachedTokens": 1024,
+#   "maxPromptTokens": 4900,
+#   "byCall": {"structured": {"calls": 1, "promptTokens": ...}, "canonical": {...}},
+#   "firstAt": ..., "lastAt": ..., "executionId": "..." }
+#
+# Retries and reprocessing add to the same document, so it holds what the
+# file has cost so far. usage_report() aggregates per user/cluster, with
+# tokens per page and a cost estimate from LLM_PRICE_*_PER_M (per 1M tokens;
+# cached tokens are part of promptTokens and priced separately).
+
+LLM_USAGE = os.getenv("LLM_USAGE", "tb_llm_usage")
+LLM_PRICE_PROMPT_PER_M = float(os.getenv("LLM_PRICE_PROMPT_PER_M", "0"))
+LLM_PRICE_CACHED_PER_M = float(os.getenv("LLM_PRICE_CACHED_PER_M", "0"))
+LLM_PRICE_COMPLETION_PER_M = float(os.getenv("LLM_PRICE_COMPLETION_PER_M", "0"))
+
+TOKEN_FIELDS = ("promptTokens", "completionTokens", "cachedTokens")
+
+_usage = threading.local()
+
+
+def _field(obj, name):
+    if obj is None:
+        return None
+    return obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+
+
+def token_counts(usage) -> dict:
+    """Token counts of an OpenAI usage object (or dict); missing fields count as 0."""
+    details = _field(usage, "prompt_tokens_details")
+    return {
+        "promptTokens": int(_field(usage, "prompt_tokens") or 0),
+        "completionTokens": int(_field(usage, "completion_tokens") or 0),
+        "cachedTokens": int(_field(details, "cached_tokens") or 0),
+    }
+
+
+def record_usage(call: str, usage, model: str = None) -> dict:
+    """Count one completion (call = "structured", "canonical", ...) on this thread."""
+    counts = token_counts(usage)
+    calls = getattr(_usage, "calls", None)
+    if calls is None:
+        calls = _usage.calls = []
+    calls.append(dict(counts, call=call, model=model))
+    log.debug("llm_usage", call=call, model=model, **counts)
+    return counts
+
+
+def drain_usage() -> list:
+    """Return and reset the completions recorded on this thread."""
+    calls = getattr(_usage, "calls", None) or []
+    _usage.calls = []
+    return calls
+
+
+def build_usage_update(calls, **attributes) -> dict:
+    """$inc/$max upsert adding one invocation's calls to a file's usage document."""
+    inc = {"calls": len(calls), "invocations": 1}
+    for c in calls:
+        prefix = f"byCall.{c['call']}"
+        inc[f"{prefix}.calls"] = inc.get(f"{prefix}.calls", 0) + 1
+        for field in TOKEN_FIELDS:
+            inc[field] = inc.get(field, 0) + c[field]
+            inc[f"{prefix}.{field}"] = inc.get(f"{prefix}.{field}", 0) + c[field]
+
+    now = datetime.now(timezone.utc)
+    to_set = {k: v for k, v in attributes.items() if v is not None}
+    to_set["lastAt"] = now
+    models = [c["model"] for c in calls if c.get("model")]
+    if models:
+        to_set["model"] = models[-1]
+
+    return {
+        "$inc": inc,
+        "$max": {"maxPromptTokens": max(c["promptTokens"] for c in calls)},
+        "$set": to_set,
+        "$setOnInsert": {"firstAt": now},
+    }
+
+
+def write_usage(collection, file_id, calls, **attributes):
+    """Add a file's completions to tb_llm_usage; never raises (accounting must not fail the file)."""
+    if not calls:
+        return None
+    try:
+        return collection.update_one(
+            {"_id": ObjectId(file_id)}, build_usage_update(calls, **attributes), upsert=True
+        )
+    except (PyMongoError, TypeError, ValueError) as e:
+        log.warning("llm_usage_write_failed", error=str(e))
+        return None
+
+
+# ======================================================
+# Reporting
+# ======================================================
+
+def estimated_cost(row) -> float:
+    uncached = row.get("promptTokens", 0) - row.get("cachedTokens", 0)
+    return round((
+        uncached * LLM_PRICE_PROMPT_PER_M
+        + row.get("cachedTokens", 0) * LLM_PRICE_CACHED_PER_M
+        + row.get("completionTokens", 0) * LLM_PRICE_COMPLETION_PER_M
+    ) / 1_000_000, 4)
+
+
+def usage_report(db, group_by=("userId",), since=None, top=10):
+    """
+    Per-group totals (files, pages, tokens, tokens per page, cost estimate)
+    and the files with the largest single prompts.
+    """
+    col = db[LLM_USAGE]
+    match = {"lastAt": {"$gte": since}} if since else {}
+    group = {"_id": {key: f"${key}" for key in group_by}, "files": {"$sum": 1},
+             "pages": {"$sum": "$pages"}, "calls": {"$sum": "$calls"},
+             "maxPromptTokens": {"$max": "$maxPromptTokens"}}
+    for field in TOKEN_FIELDS:
+        group[field] = {"$sum": f"${field}"}
+
+    groups = list(col.aggregate([{"$match": match}, {"$group": group}, {"$sort": {"promptTokens": -1}}]))
+    for row in groups:
+        tokens = row["promptTokens"] + row["completionTokens"]
+        row["tokensPerPage"] = round(tokens / row["pages"], 1) if row["pages"] else None
+        row["cacheHitRate"] = round(row["cachedTokens"] / row["promptTokens"], 3) if row["promptTokens"] else 0.0
+        row["estimatedCost"] = estimated_cost(row)
+        if row["pages"]:
+            row["estimatedCostPerPage"] = round(row["estimatedCost"] / row["pages"], 6)
+
+    largest = list(
+        col.find(match, {"userId": 1, "clusterId": 1, "pages": 1, "maxPromptTokens": 1, "invocations": 1})
+        .sort("maxPromptTokens", -1)
+        .limit(top)
+    )
+    return {"groups": groups, "largestPrompts": largest}
+
+
+def ensure_indexes(db):
+    db[LLM_USAGE].create_index([("userId", 1), ("lastAt", -1)])
+    db[LLM_USAGE].create_index([("maxPromptTokens", -1)])
+
+
+if __name__ == "__main__":
+    import json
+    from pymongo import MongoClient
+
+    parser = argparse.ArgumentParser(description="LLM token usage per user/cluster from tb_llm_usage")
+    parser.add_argument("--by", nargs="+", default=["userId"], choices=["userId", "clusterId", "model"])
+    parser.add_argument("--since", help="ISO date, e.g. 2026-10-01")
+    parser.add_argument("--top", type=int, default=10, help="Files listed by largest prompt")
+    parser.add_argument("--create-indexes", action="store_true")
+    args = parser.parse_args()
+
+    db = MongoClient(os.getenv("PROD_MONGO_URI"))[os.getenv("MONGO_DATABASE", "yc-invoice")]
+    if args.create_indexes:
+        ensure_indexes(db)
+    since = datetime.fromisoformat(args.since).replace(tzinfo=timezone.utc) if args.since else None
+    print(json.dumps(usage_report(db, tuple(args.by), since, args.top), indent=2, default=str))
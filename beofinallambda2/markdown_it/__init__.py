@@ -1,6 +0,0 @@
-"""A Python port of Markdown-It"""
-
-__all__ = ("MarkdownIt",)
-__version__ = "4.0.0"
-
-from .main import MarkdownIt
@@ -1,8 +0,0 @@
-def _escape_inner(s: str, /) -> str:
-    return (
-        s.replace("&", "&amp;")
-        .replace(">", "&gt;")
-        .replace("<", "&lt;")
-        .replace("'", "&#39;")
-        .replace('"', "&#34;")
-    )
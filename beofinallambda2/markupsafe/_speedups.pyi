@@ -1 +0,0 @@
-def _escape_inner(s: str, /) -> str: ...
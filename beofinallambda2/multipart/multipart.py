@@ -1 +0,0 @@
-from python_multipart.multipart import *
@@ -1,8 +0,0 @@
-"""
-    __init__ of the pdf2image module
-"""
-
-from .pdf2image import convert_from_bytes as convert_from_bytes
-from .pdf2image import convert_from_path as convert_from_path
-from .pdf2image import pdfinfo_from_bytes as pdfinfo_from_bytes
-from .pdf2image import pdfinfo_from_path as pdfinfo_from_path
@@ -0,0 +1,168 @@
+import os
+from datetime import datetime, timezone
+
+import boto3
+from botocore.exceptions import ClientError
+from pymongo import MongoClient
+from bson import ObjectId
+
+from update_credits import settle_or_defer, CREDIT_SETTLEMENT_MODE
+from job_status import JOB_STATUS_COLLECTION, JobStatusRecorder, ensure_indexes
+from errors import surface_retryable, is_retryable
+from batch import is_batch, run_batch
+from tracing import span, trace_context
+import log
+
+# --- ENV ---
+MONGO_URI = os.getenv("PROD_MONGO_URI")
+MONGO_DB = os.getenv("MONGO_DATABASE")
+S3_BUCKET_NAME = os.getenv("S3_BUCKET_NAME")
+RUN_STATS = os.getenv("RUN_STATS", "tb_run_stats")
+
+mongo_client = MongoClient(MONGO_URI)
+db = mongo_client[MONGO_DB]
+col_files = db["tb_file_details"]
+col_job_status = db[JOB_STATUS_COLLECTION]
+ensure_indexes(db)
+col_run_stats = db[RUN_STATS]
+
+s3 = boto3.client("s3")
+
+
+# ======================================================
+# ⏭️ Precheck: skip files that were already processed
+# ======================================================
+#
+# First state of the Map iteration. A file is skipped (no Textract, no LLM)
+# when tb_file_details already has it Completed with extractedValues and the
+# raw object's S3 ETag matches the sourceETag stored by the structured Lambda
+# (files processed before sourceETag was recorded are compared by status only).
+# A re-uploaded file with different content is processed again, and
+# "forceReprocess" (execution input or manifest entry) disables skipping.
+# The state only exists in environments that set precheck.enabled
+# (stepfunction_builder.py); it is off by default.
+#
+# The skipped file's reserved credit is released without touching the file.
+# Counts per run go to tb_run_stats, keyed by the execution Id:
+# { "_id": "<executionId>", "checked": 40, "skipped": 12, "processed": 28,
+#   "reasons": {"unchanged": 12, "new": 25, "changed": 1, "forced": 2} }
+
+
+def raw_key(event, file_doc):
+    original = (file_doc or {}).get("originalS3File") or event.get("originalS3File")
+    if not original:
+        return None
+    return f"{event['userId']}/{event['clusterId']}/raw/{original}"
+
+
+def current_etag(key):
+    """ETag of the raw upload (an MD5 of the content for single-part uploads), or None."""
+    if not key:
+        return None
+    try:
+        return s3.head_object(Bucket=S3_BUCKET_NAME, Key=key)["ETag"].strip('"')
+    except ClientError as e:
+        if is_retryable(e):
+            raise
+        log.warning("etag_unavailable", bucket=S3_BUCKET_NAME, key=key, error=str(e))
+        return None
+
+
+def decide(file_doc, etag, force):
+    """Return (skip, reason)."""
+    if force:
+        return False, "forced"
+    if not file_doc or file_doc.get("processingStatus") != "Completed" or not file_doc.get("extractedValues"):
+        return False, "new"
+    stored = file_doc.get("sourceETag")
+    if stored and etag and stored != etag:
+        return False, "changed"
+    return True, "unchanged" if stored else "completed"
+
+
+def check_file(event):
+    """Decide one file; releases its reserved credit when it is skipped."""
+    with trace_context(fileId=event.get("fileId"), executionId=event.get("executionId")), \
+            log.request(event), span("precheck") as trace:
+        decision = _check_file(event)
+        trace["skip"] = decision["skip"]
+        return decision
+
+
+def _check_file(event):
+    file_oid = ObjectId(event["fileId"])
+    with span("mongo_read", collection="tb_file_details"):
+        file_doc = col_files.find_one(
+            {"_id": file_oid, "userId": ObjectId(event["userId"]), "clusterId": ObjectId(event["clusterId"])},
+            {"processingStatus": 1, "sourceETag": 1, "originalS3File": 1, "extractedValues.invoiceNo": 1},
+        )
+    with span("s3_head"):
+        etag = current_etag(raw_key(event, file_doc))
+    skip, reason = decide(file_doc, etag, bool(event.get("forceReprocess")))
+    log.info("precheck", skip=skip, reason=reason)
+
+    settlement = None
+    if skip:
+        deferred = event.get("settlementMode", CREDIT_SETTLEMENT_MODE) == "deferred"
+        if event.get("creditId"):
+            settlement = settle_or_defer("release", ObjectId(event["creditId"]), file_oid,
+                                         event.get("attempt", 0), deferred)
+        job_status = JobStatusRecorder(
+            col_job_status, event["fileId"], "precheck",
+            fileId=file_oid, executionId=event.get("executionId")
+        )
+        job_status.record("skipped", f"Already processed ({reason})")
+        job_status.flush()
+        if not deferred:
+            settlement = None
+
+    return {"skip": skip, "reason": reason, "sourceETag": etag, "settlement": settlement}
+
+
+def record_run_stats(execution_id, decisions):
+    """One $inc per invocation into the run's tb_run_stats document."""
+    if not execution_id or not decisions:
+        return
+    inc = {"checked": len(decisions)}
+    for d in decisions:
+        key = "skipped" if d.get("skip") else "processed"
+        inc[key] = inc.get(key, 0) + 1
+        reason = f"reasons.{d.get('reason') or 'error'}"
+        inc[reason] = inc.get(reason, 0) + 1
+    col_run_stats.update_one(
+        {"_id": execution_id},
+        {"$inc": inc, "$set": {"updatedAt": datetime.now(timezone.utc)}},
+        upsert=True,
+    )
+
+
+@surface_retryable
+def lambda_handler(event, context):
+    """
+    Single file: {"fileId", "userId", "clusterId", "creditId", "originalS3File",
+    "forceReprocess", "executionId"} → {"skip", "reason", "sourceETag", "settlement"}
+
+    Batch ({"batchId", "files": [...]}): → {"batchId", "skip", "files": [files
+    to process, with sourceETag], "skipped", "settlements"}; "skip" is true
+    when nothing is left to process.
+    """
+    if not is_batch(event):
+        decision = check_file(event)
+        record_run_stats(event.get("executionId"), [decision])
+        return decision
+
+    decisions = run_batch(check_file, event)["files"]
+    record_run_stats(event.get("executionId"), decisions)
+
+    remaining = [
+        dict(f, sourceETag=d.get("sourceETag"))
+        for f, d in zip(event["files"], decisions)
+        if not d.get("skip")
+    ]
+    return {
+        "batchId": event.get("batchId"),
+        "skip": not remaining,
+        "files": remaining,
+        "skipped": len(decisions) - len(remaining),
+        "settlements": [d["settlement"] for d in decisions if d.get("settlement")],
+    }
@@ -1,52 +0,0 @@
-"""
-    pygments.styles.bw
-    ~~~~~~~~~~~~~~~~~~
-
-    Simple black/white only style.
-
-    :copyright: Copyright 2006-2025 by the Pygments team, see AUTHORS.
-    :license: BSD, see LICENSE for details.
-"""
-
-from pygments.style import Style
-from pygments.token import Keyword, Name, Comment, String, Error, \
-     Operator, Generic
-
-
-__all__ = ['BlackWhiteStyle']
-
-
-class BlackWhiteStyle(Style):
-    name = 'bw'
-
-    background_color = "#ffffff"
-
-    styles = {
-        Comment:                   "italic",
-        Comment.Preproc:           "noitalic",
-
-        Keyword:                   "bold",
-        Keyword.Pseudo:            "nobold",
-        Keyword.Type:              "nobold",
-
-        Operator.Word:             "bold",
-
-        Name.Class:                "bold",
-        Name.Namespace:            "bold",
-        Name.Exception:            "bold",
-        Name.Entity:               "bold",
-        Name.Tag:                  "bold",
-
-        String:                    "italic",
-        String.Interpol:           "bold",
-        String.Escape:             "bold",
-
-        Generic.Heading:           "bold",
-        Generic.Subheading:        "bold",
-        Generic.Emph:              "italic",
-        Generic.Strong:            "bold",
-        Generic.EmphStrong:        "bold italic",
-        Generic.Prompt:            "bold",
-
-        Error:                     "border:#FF0000"
-    }
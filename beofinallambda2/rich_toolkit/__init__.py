@@ -1,3 +0,0 @@
-from .toolkit import RichToolkit, RichToolkitTheme
-
-__all__ = ["RichToolkit", "RichToolkitTheme"]
@@ -1,5 +0,0 @@
-from .base import BaseStyle
-
-
-class MinimalStyle(BaseStyle):
-    pass
@@ -0,0 +1,72 @@
+from update_credits import bulk_settle_credits, build_settlement_outcome
+from errors import surface_retryable
+import log
+
+
+def _iteration_results(results):
+    """Map results, flattened: with map.max_items_per_batch each child execution returns a list."""
+    for item in results or []:
+        if isinstance(item, list):
+            yield from _iteration_results(item)
+        elif isinstance(item, dict):
+            yield item
+
+
+def collect_outcomes(results, attempt=0):
+    """
+    Pull the settlement outcome out of every Map iteration result (trimmed
+    by the FileResult/FailedFileResult/SkipFile states of stepfunction_builder.py).
+
+    - RunSecondLambda in deferred mode returns it, kept as 'settlement'.
+    - Iterations that were caught into FailLambda carry an 'error' and are rolled
+      back under `attempt` (the execution's RedriveCount, like the per-file debits).
+    - Batch items ({"batchId", ...}) carry one 'settlements' entry per file,
+      or the batch's 'files' and an 'error' if the batch failed.
+    - Files skipped by PrecheckFile carry a 'release' outcome in precheck.
+    """
+    outcomes = []
+
+    for item in _iteration_results(results):
+        precheck = item.get("precheck") or {}
+        if precheck.get("settlement"):
+            outcomes.append(precheck["settlement"])
+        outcomes.extend(precheck.get("settlements") or [])
+
+        if item.get("error") and isinstance(item.get("files"), list):
+            # Only the files the precheck let through still hold a reserved credit
+            outcomes.extend(
+                build_settlement_outcome("rollback", f["creditId"], f.get("fileId"), attempt)
+                for f in precheck.get("files", item["files"]) if f.get("creditId")
+            )
+        elif item.get("error") and item.get("creditId"):
+            outcomes.append(build_settlement_outcome(
+                "rollback", item["creditId"], item.get("fileId"), attempt
+            ))
+        else:
+            if item.get("settlement"):
+                outcomes.append(item["settlement"])
+            outcomes.extend(s for s in item.get("settlements") or [] if s)
+
+    return outcomes
+
+
+@surface_retryable
+def lambda_handler(event, context):
+    """
+    Final state of a deferred-settlement run: one bulk write for the whole batch.
+
+    Expected event format (the Map output):
+    {
+        "results": [ { "fileId": "...", "creditId": "...", "settlement": {...} }, ... ],
+        "attempt": 0
+    }
+
+    stepfunction_builder.py adds this state (SettleCredits, after
+    ProcessFiles) when settlement.mode is "deferred", and passes
+    "settlementMode": "deferred" to the per-file tasks. "attempt" is the
+    execution's RedriveCount, which the per-file tasks receive too.
+    """
+    outcomes = collect_outcomes(event.get("results"), event.get("attempt", 0))
+    log.info("settle_credits", outcomes=len(outcomes), results=len(event.get("results") or []))
+
+    return bulk_settle_credits(outcomes)
@@ -1,3 +0,0 @@
-import collections
-
-Process = collections.namedtuple("Process", "args pid ppid")
@@ -1 +0,0 @@
-__version__ = "0.37.2"
@@ -1,39 +0,0 @@
-"""Typer, build great CLIs. Easy to code. Based on Python type hints."""
-
-__version__ = "0.16.1"
-
-from shutil import get_terminal_size as get_terminal_size
-
-from click.exceptions import Abort as Abort
-from click.exceptions import BadParameter as BadParameter
-from click.exceptions import Exit as Exit
-from click.termui import clear as clear
-from click.termui import confirm as confirm
-from click.termui import echo_via_pager as echo_via_pager
-from click.termui import edit as edit
-from click.termui import getchar as getchar
-from click.termui import pause as pause
-from click.termui import progressbar as progressbar
-from click.termui import prompt as prompt
-from click.termui import secho as secho
-from click.termui import style as style
-from click.termui import unstyle as unstyle
-from click.utils import echo as echo
-from click.utils import format_filename as format_filename
-from click.utils import get_app_dir as get_app_dir
-from click.utils import get_binary_stream as get_binary_stream
-from click.utils import get_text_stream as get_text_stream
-from click.utils import open_file as open_file
-
-from . import colors as colors
-from .main import Typer as Typer
-from .main import launch as launch
-from .main import run as run
-from .models import CallbackParam as CallbackParam
-from .models import Context as Context
-from .models import FileBinaryRead as FileBinaryRead
-from .models import FileBinaryWrite as FileBinaryWrite
-from .models import FileText as FileText
-from .models import FileTextWrite as FileTextWrite
-from .params import Argument as Argument
-from .params import Option as Option
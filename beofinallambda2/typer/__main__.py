@@ -1,3 +0,0 @@
-from .cli import main
-
-main()
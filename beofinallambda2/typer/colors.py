@@ -1,20 +0,0 @@
-# Variable names to colors, just for completion
-BLACK = "black"
-RED = "red"
-GREEN = "green"
-YELLOW = "yellow"
-BLUE = "blue"
-MAGENTA = "magenta"
-CYAN = "cyan"
-WHITE = "white"
-
-RESET = "reset"
-
-BRIGHT_BLACK = "bright_black"
-BRIGHT_RED = "bright_red"
-BRIGHT_GREEN = "bright_green"
-BRIGHT_YELLOW = "bright_yellow"
-BRIGHT_BLUE = "bright_blue"
-BRIGHT_MAGENTA = "bright_magenta"
-BRIGHT_CYAN = "bright_cyan"
-BRIGHT_WHITE = "bright_white"
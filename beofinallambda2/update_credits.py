@@ -1,12 +1,16 @@
 import os
-import traceback
-from uuid import uuid4
+import time
 from datetime import datetime, timezone
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne, DeleteOne, InsertOne
+from pymongo.read_concern import ReadConcern
+from pymongo.write_concern import WriteConcern
 from bson import ObjectId
 from dotenv import load_dotenv
 
+from tracing import span
+import log
+
 load_dotenv()
 
 PROD_MONGO_URI = os.getenv("PROD_MONGO_URI")
@@ -15,6 +19,10 @@ if not PROD_MONGO_URI:
 
 mongo_client = MongoClient(PROD_MONGO_URI)
 mongo_database = os.getenv("MONGO_DATABASE")
+
+# "immediate" settles each file in its own transaction; "deferred" returns the
+# outcome to the state machine and a final SettleCredits state bulk-writes them
+CREDIT_SETTLEMENT_MODE = os.getenv("CREDIT_SETTLEMENT_MODE", "immediate")
 db = mongo_client[mongo_database]
 
 # Direct collection access (no helper function)
@@ -22,6 +30,113 @@ tb_credits = db["tb_credits"]
 
 tb_file_details=db["tb_file_details"]
 
+# One ledger entry per settled (fileId, creditId, attempt, operation); _id is the idempotency key
+tb_credit_ledger = db["tb_credit_ledger"]
+
+SETTLEMENT_OPERATIONS = ("debit", "rollback", "release")
+
+
+def releasable_filter(credit_oid):
+    """Filter for a credit that 'release' may delete (anything not yet debited)."""
+    return {"_id": credit_oid, "type": {"$ne": "debited"}}
+
+
+# ---------------------------------------------------------
+# 0️⃣ CREDIT LEDGER (idempotent, transactional settlement)
+# ---------------------------------------------------------
+
+def build_idempotency_key(file_id, credit_id, attempt=0, operation="debit"):
+    """Idempotency key for one settlement operation of a credit against a file."""
+    return f"{file_id}:{credit_id}:{int(attempt or 0)}:{operation}"
+
+
+def settle_credit(operation, credit_id, file_id=None, attempt=0, message="Success"):
+    """
+    Apply a credit settlement ('debit', 'rollback' or 'release') exactly once.
+
+    The credit write, the file-details write and the ledger entry are
+    committed in a single multi-document transaction. A retry of the same
+    operation for the same (fileId, creditId, attempt) returns the recorded
+    outcome instead of re-applying it. The operation is part of the key, so
+    a rollback after a debit in the same attempt (the file failed after its
+    credit was debited) is applied as the debit's compensation.
+
+    'release' deletes the reserved credit like 'rollback' but leaves the file
+    untouched; it is used for files the precheck skips (already processed).
+    A credit that is already debited (the manifest reused the creditId of
+    the run that processed the file) is kept.
+    """
+
+    if operation not in SETTLEMENT_OPERATIONS:
+        raise ValueError(f"Unknown credit operation: {operation}")
+
+    key = build_idempotency_key(file_id, credit_id, attempt, operation)
+    credit_oid = ObjectId(credit_id)
+    file_oid = ObjectId(file_id) if file_id else None
+
+    def _apply(session):
+        entry = tb_credit_ledger.find_one({"_id": key}, session=session)
+        if entry:
+            return dict(entry["result"], replayed=True)
+
+        now = datetime.now(timezone.utc)
+
+        if operation == "debit":
+            result = tb_credits.update_one(
+                {"_id": credit_oid},
+                {"$set": {"updatedAt": now, "type": "debited"}},
+                session=session,
+            )
+            if result.matched_count == 0:
+                raise LookupError(f"No credit record found for creditId={credit_id}")
+            file_set = {
+                "processingStatus": "Completed",
+                "successMessage": message,
+                "updatedAt": datetime.utcnow().isoformat() + "Z",
+            }
+        elif operation == "release":
+            tb_credits.delete_one(releasable_filter(credit_oid), session=session)
+            file_set = None
+        else:
+            result = tb_credits.delete_one({"_id": credit_oid}, session=session)
+            if result.deleted_count == 0:
+                raise LookupError(f"No credit record found for creditId={credit_id}")
+            file_set = {
+                "processingStatus": "Failed",
+                "updatedAt": datetime.utcnow().isoformat() + "Z",
+            }
+
+        if file_oid and file_set:
+            tb_file_details.update_one({"_id": file_oid}, {"$set": file_set}, session=session)
+
+        outcome = {
+            "status": "success",
+            "operation": operation,
+            "creditId": str(credit_id),
+            "fileId": str(file_id) if file_id else None,
+            "idempotencyKey": key,
+        }
+        tb_credit_ledger.insert_one(
+            {
+                "_id": key,
+                "operation": operation,
+                "creditId": credit_oid,
+                "fileId": file_oid,
+                "attempt": int(attempt or 0),
+                "result": outcome,
+                "createdAt": now,
+            },
+            session=session,
+        )
+        return dict(outcome, replayed=False)
+
+    with mongo_client.start_session() as session:
+        return session.with_transaction(
+            _apply,
+            read_concern=ReadConcern("snapshot"),
+            write_concern=WriteConcern("majority"),
+        )
+
 
 # ---------------------------------------------------------
 # 1️⃣ UPDATE CREDIT RECORD (Replace old insert_debit_credit)
@@ -34,109 +149,247 @@ def update_debit_credit(
     credits_to_deduct, 
     job_id, 
     credit_id,
-    message="Success"     # <-- added optional parameter for successMessage
+    message="Success",    # <-- added optional parameter for successMessage
+    attempt=0
 ):
     """
-    Updates the credit record ('type' and 'updatedAt') using creditId.
-    Also updates file details after successful debit update.
+    Marks the credit record as debited and the file as Completed in one
+    transaction, keyed by (fileId, creditId, attempt, operation) so retries are no-ops.
     """
 
     if not credit_id:
         raise ValueError("creditId is required but missing")
 
     try:
-        # ---------------- OLD LOGIC (unchanged) ----------------
-        result = tb_credits.update_one(
-            {"_id": ObjectId(credit_id)},
-            {
-                "$set": {
-                    "updatedAt": datetime.now(timezone.utc),
-                    "type": "debited"
-                }
-            }
-        )
-
-        if result.matched_count == 0:
-            raise LookupError(f"No credit record found for creditId={credit_id}")
-
-        print(f"✅ Updated credit record {credit_id}")
-
-        # ---------------- NEW FILE DETAILS UPDATE ----------------
-        if file_id:
-            file_update_result = tb_file_details.update_one(
-                {"_id": ObjectId(file_id)},
-                {
-                    "$set": {
-                        "processingStatus": "Completed",
-                        "successMessage": message,
-                        "updatedAt": datetime.utcnow().isoformat() + "Z"
-                    }
-                }
-            )
-
-            print(f"✅ Marked SUCCESS for file {file_id}, modified: {file_update_result.modified_count}")
-        else:
-            print("⚠️ file_id is missing, skipping file details update.")
+        result = settle_credit("debit", credit_id, file_id, attempt, message)
+    except LookupError as e:
+        log.error("credit_settle_failed", creditId=credit_id, operation="debit", error=str(e))
+        return {"status": "error", "message": str(e)}
 
-        return {
-            "status": "success",
-            "creditId": credit_id,
-            "fileId": file_id
-        }
+    if result["replayed"]:
+        log.info("credit_replayed", creditId=credit_id, operation=result["operation"], attempt=attempt)
+    else:
+        log.info("credit_settled", creditId=credit_id, operation="debit")
 
-    except Exception as e:
-        print(f"❌ Error updating creditId={credit_id}: {e}")
-        traceback.print_exc()
-        return {"status": "error", "message": str(e)}
+    return result
 
 
 # ---------------------------------------------------------
 # 2️⃣ DELETE CREDIT RECORD
 # ---------------------------------------------------------
 
-def delete_credit_record(credit_id, file_id=None):
+def delete_credit_record(credit_id, file_id=None, attempt=0):
     """
-    Deletes a credit record by creditId.
-    Also updates file details status to 'Failed' if file_id is provided.
-    Raises errors when creditId missing or not found.
+    Deletes a credit record and marks the file as Failed in one transaction,
+    keyed by (fileId, creditId, attempt, operation) so retries are no-ops.
     """
 
     if not credit_id:
         raise ValueError("creditId is required but missing")
 
     try:
-        # ---------- OLD LOGIC (unchanged) ----------
-        result = tb_credits.delete_one({"_id": ObjectId(credit_id)})
-
-        if result.deleted_count == 0:
-            raise LookupError(f"No credit record found for creditId={credit_id}")
-
-        print(f"🗑️ Deleted credit record {credit_id}")
-
-        # ---------- NEW FILE-DETAILS UPDATE ----------
-        if file_id:
-            file_update_result = tb_file_details.update_one(
-                {"_id": ObjectId(file_id)},
-                {
-                    "$set": {
-                        "processingStatus": "Failed",
-                        "updatedAt": datetime.utcnow().isoformat() + "Z"
-                    }
-                }
-            )
+        result = settle_credit("rollback", credit_id, file_id, attempt)
+    except LookupError as e:
+        log.error("credit_settle_failed", creditId=credit_id, operation="rollback", error=str(e))
+        return {"status": 'error', "message": str(e)}
 
-            print(f"⚠️ Marked FAILED for file {file_id}, modified: {file_update_result.modified_count}")
-        else:
-            print("⚠️ file_id not provided, skipping file update.")
+    if result["replayed"]:
+        log.info("credit_replayed", creditId=credit_id, operation=result["operation"], attempt=attempt)
+    else:
+        log.info("credit_settled", creditId=credit_id, operation="rollback")
 
-        return {
-            "status": "success",
-            "creditId": credit_id,
-            "fileId": file_id
-        }
+    return result
 
-    except Exception as e:
-        print(f"❌ Error deleting creditId={credit_id}: {e}")
-        traceback.print_exc()
+
+def release_credit_record(credit_id, file_id=None, attempt=0):
+    """
+    Deletes a reserved credit without changing the file's status (the file
+    was skipped as already processed), keyed like the other settlements.
+    """
+
+    if not credit_id:
+        raise ValueError("creditId is required but missing")
+
+    try:
+        result = settle_credit("release", credit_id, file_id, attempt)
+    except LookupError as e:
+        log.error("credit_settle_failed", creditId=credit_id, operation="release", error=str(e))
         return {"status": 'error', "message": str(e)}
 
+    if result["replayed"]:
+        log.info("credit_replayed", creditId=credit_id, operation=result["operation"], attempt=attempt)
+    else:
+        log.info("credit_settled", creditId=credit_id, operation="release")
+
+    return result
+
+
+# ---------------------------------------------------------
+# 3️⃣ DEFERRED (BULK) SETTLEMENT
+# ---------------------------------------------------------
+
+def build_settlement_outcome(operation, credit_id, file_id=None, attempt=0, message="Success"):
+    """Describe a settlement so a later bulk_settle_credits call can apply it."""
+    if not credit_id:
+        raise ValueError("creditId is required but missing")
+    if operation not in SETTLEMENT_OPERATIONS:
+        raise ValueError(f"Unknown credit operation: {operation}")
+
+    return {
+        "operation": operation,
+        "creditId": str(credit_id),
+        "fileId": str(file_id) if file_id else None,
+        "attempt": int(attempt or 0),
+        "message": message,
+    }
+
+
+def settle_or_defer(operation, credit_id, file_id=None, attempt=0, deferred=False, message="Success"):
+    """Settle now, or return the outcome for the end-of-run bulk settlement."""
+    if deferred:
+        outcome = build_settlement_outcome(operation, credit_id, file_id, attempt, message)
+        log.debug("credit_deferred", creditId=credit_id, operation=operation)
+        return outcome
+
+    with span("credit_settle", operation=operation):
+        if operation == "debit":
+            return update_debit_credit(None, None, file_id, None, None, credit_id, message, attempt=attempt)
+        if operation == "release":
+            return release_credit_record(credit_id, file_id, attempt=attempt)
+        return delete_credit_record(credit_id, file_id, attempt=attempt)
+
+
+def bulk_settle_credits(outcomes):
+    """
+    Apply a whole run's settlement outcomes with one bulk_write per collection
+    (tb_credits, tb_file_details, tb_credit_ledger) inside a single transaction.
+
+    Outcomes already present in the ledger are skipped, so re-running the
+    settlement state is safe. Like settle_credit, a debit or rollback whose
+    credit does not exist is not applied: it is reported under "failures"
+    and left out of the ledger. Returns batch size, counts and latency.
+    """
+
+    started = time.perf_counter()
+
+    # Last outcome wins for a repeated (fileId, creditId, attempt) within the batch
+    latest = {}
+    for outcome in outcomes:
+        if not outcome or not outcome.get("creditId"):
+            continue
+        latest[(outcome.get("fileId"), outcome["creditId"], outcome.get("attempt", 0))] = outcome
+    by_key = {
+        build_idempotency_key(file_id, credit_id, attempt, outcome["operation"]): outcome
+        for (file_id, credit_id, attempt), outcome in latest.items()
+    }
+
+    report = {
+        "batchSize": len(by_key),
+        "debited": 0,
+        "rolledBack": 0,
+        "released": 0,
+        "replayed": 0,
+        "failed": 0,
+        "failures": [],
+        "creditsMatched": 0,
+        "filesModified": 0,
+        "latencyMs": 0.0,
+    }
+
+    if not by_key:
+        log.info("credit_bulk_empty")
+        return report
+
+    def _apply(session):
+        settled = {
+            doc["_id"]
+            for doc in tb_credit_ledger.find({"_id": {"$in": list(by_key)}}, {"_id": 1}, session=session)
+        }
+
+        # Debits and rollbacks need their credit (settle_credit raises LookupError otherwise)
+        needed = [ObjectId(o["creditId"]) for k, o in by_key.items() if k not in settled and o["operation"] != "release"]
+        existing = {
+            doc["_id"]
+            for doc in tb_credits.find({"_id": {"$in": needed}}, {"_id": 1}, session=session)
+        } if needed else set()
+
+        now = datetime.now(timezone.utc)
+        now_iso = datetime.utcnow().isoformat() + "Z"
+        credit_ops, file_ops, ledger_ops, failures = [], [], [], []
+        counts = {"debited": 0, "rolledBack": 0, "released": 0, "replayed": len(settled)}
+
+        for key, outcome in by_key.items():
+            if key in settled:
+                continue
+
+            credit_oid = ObjectId(outcome["creditId"])
+            file_oid = ObjectId(outcome["fileId"]) if outcome.get("fileId") else None
+
+            if outcome["operation"] != "release" and credit_oid not in existing:
+                failures.append({
+                    "operation": outcome["operation"],
+                    "creditId": outcome["creditId"],
+                    "fileId": outcome.get("fileId"),
+                    "message": f"No credit record found for creditId={outcome['creditId']}",
+                })
+                continue
+
+            if outcome["operation"] == "debit":
+                credit_ops.append(UpdateOne(
+                    {"_id": credit_oid},
+                    {"$set": {"updatedAt": now, "type": "debited"}},
+                ))
+                file_set = {
+                    "processingStatus": "Completed",
+                    "successMessage": outcome.get("message", "Success"),
+                    "updatedAt": now_iso,
+                }
+                counts["debited"] += 1
+            elif outcome["operation"] == "release":
+                credit_ops.append(DeleteOne(releasable_filter(credit_oid)))
+                file_set = None
+                counts["released"] += 1
+            else:
+                credit_ops.append(DeleteOne({"_id": credit_oid}))
+                file_set = {"processingStatus": "Failed", "updatedAt": now_iso}
+                counts["rolledBack"] += 1
+
+            if file_oid and file_set:
+                file_ops.append(UpdateOne({"_id": file_oid}, {"$set": file_set}))
+
+            ledger_ops.append(InsertOne({
+                "_id": key,
+                "operation": outcome["operation"],
+                "creditId": credit_oid,
+                "fileId": file_oid,
+                "attempt": outcome.get("attempt", 0),
+                "result": dict(outcome, status="success", idempotencyKey=key),
+                "createdAt": now,
+            }))
+
+        credits_matched = files_modified = 0
+        if credit_ops:
+            res = tb_credits.bulk_write(credit_ops, ordered=False, session=session)
+            credits_matched = res.matched_count + res.deleted_count
+        if file_ops:
+            files_modified = tb_file_details.bulk_write(file_ops, ordered=False, session=session).modified_count
+        if ledger_ops:
+            tb_credit_ledger.bulk_write(ledger_ops, ordered=False, session=session)
+
+        return dict(counts, failed=len(failures), failures=failures,
+                    creditsMatched=credits_matched, filesModified=files_modified)
+
+    with span("credit_settle", operation="bulk", batchSize=len(by_key)), mongo_client.start_session() as session:
+        counts = session.with_transaction(
+            _apply,
+            read_concern=ReadConcern("snapshot"),
+            write_concern=WriteConcern("majority"),
+        )
+
+    report.update(counts)
+    report["latencyMs"] = round((time.perf_counter() - started) * 1000, 2)
+    for failure in report["failures"]:
+        log.error("credit_settle_failed", creditId=failure["creditId"], operation=failure["operation"],
+                  error=failure["message"])
+    log.info("credit_bulk_settled", **{k: v for k, v in report.items() if k != "failures"})
+    return report
@@ -0,0 +1,293 @@
+"""
+Adaptive Map concurrency for the BEO pipeline.
+
+The Lambdas write one "invocations" entry per run to job_status, holding
+durationMs and the Textract/S3/Azure throttles they hit (see job_status.py
+and errors.record_throttle). This module turns those into per-execution
+signals (throttle rate, p95 latency per stage) and moves the Map
+concurrency AIMD-style: +increase_step while the downstream services have
+headroom, x decrease_factor when they throttle or p95 exceeds its target.
+
+The current value lives in tb_concurrency_state. The "prod-adaptive"
+definition reads it from the execution input (MaxConcurrencyPath
+"$.maxConcurrency"). It is updated between runs, or between waves when
+run_in_waves() splits one large manifest.
+
+    python concurrency_controller.py --show
+    python concurrency_controller.py --signals <execution arn>
+    python concurrency_controller.py --update <execution arn>
+    python concurrency_controller.py --input s3://bucket/manifest.json
+    python concurrency_controller.py --create-indexes --show
+"""
+import argparse
+import json
+import math
+import os
+import sys
+from datetime import datetime, timezone
+
+# log.py ships inside the Lambda directories; run from the repo root, use the loader's copy
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "BEO_S3_File_read"))
+import log  # noqa: E402
+
+DEFAULT_CONTROLLER = "beo-pipeline"
+STATE_COLLECTION = "tb_concurrency_state"
+JOB_STATUS_COLLECTION = "job_status"
+HISTORY_LENGTH = 50
+
+
+# ============================================================
+# Signals
+# ============================================================
+
+def percentile(values, pct):
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(math.ceil(pct / 100.0 * len(ordered))) - 1, 0)
+    return ordered[rank]
+
+
+def summarize_invocations(invocations, execution_id=None):
+    """Aggregate invocation entries into throttle and latency signals."""
+    throttles = {}
+    durations = {}
+    retries = 0
+    for inv in invocations:
+        for source, count in (inv.get("throttles") or {}).items():
+            throttles[source] = throttles.get(source, 0) + count
+        if inv.get("durationMs") is not None:
+            durations.setdefault(inv.get("stage"), []).append(inv["durationMs"])
+        if inv.get("status") == "retrying":
+            retries += 1
+
+    total = len(invocations)
+    throttle_count = sum(throttles.values())
+    return {
+        "executionId": execution_id,
+        "invocations": total,
+        "retries": retries,
+        "throttles": throttles,
+        "throttleCount": throttle_count,
+        "throttleRate": round(throttle_count / total, 4) if total else 0.0,
+        "stages": {
+            stage: {
+                "count": len(values),
+                "p50Ms": percentile(values, 50),
+                "p95Ms": percentile(values, 95),
+            }
+            for stage, values in durations.items()
+        },
+    }
+
+
+def ensure_indexes(db):
+    """Multikey indexes for collect_signals' two queries on job_status.invocations."""
+    db[JOB_STATUS_COLLECTION].create_index([("invocations.executionId", 1)])
+    db[JOB_STATUS_COLLECTION].create_index([("invocations.startedAt", 1)])
+
+
+def collect_signals(db, execution_id=None, since=None):
+    """
+    Signals for one execution (execution_id) or for every invocation that
+    started after `since`, read from job_status.invocations.
+    """
+    if execution_id is None and since is None:
+        raise ValueError("collect_signals needs execution_id or since")
+
+    query = {"invocations.executionId": execution_id} if execution_id else {"invocations.startedAt": {"$gte": since}}
+    invocations = []
+    for doc in db[JOB_STATUS_COLLECTION].find(query, {"invocations": 1}):
+        for inv in doc.get("invocations") or []:
+            if execution_id and inv.get("executionId") != execution_id:
+                continue
+            if since and (inv.get("startedAt") is None or inv["startedAt"] < since):
+                continue
+            invocations.append(inv)
+
+    return summarize_invocations(invocations, execution_id)
+
+
+# ============================================================
+# Controller
+# ============================================================
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease on Map concurrency.
+
+    - Decrease when throttleRate > max_throttle_rate or a stage p95 is over
+      its target in p95_targets_ms.
+    - Increase when nothing throttled and every p95 is under
+      headroom * target.
+    - Otherwise (or with fewer than min_samples invocations) hold.
+    """
+
+    def __init__(self, min_concurrency=1, max_concurrency=40, initial_concurrency=5,
+                 increase_step=2, decrease_factor=0.5, max_throttle_rate=0.05,
+                 p95_targets_ms=None, headroom=0.8, min_samples=5):
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.initial_concurrency = initial_concurrency
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.max_throttle_rate = max_throttle_rate
+        self.p95_targets_ms = p95_targets_ms if p95_targets_ms is not None else {"ocr": 180000, "structured": 90000}
+        self.headroom = headroom
+        self.min_samples = min_samples
+
+    def _clamp(self, value):
+        return max(self.min_concurrency, min(self.max_concurrency, int(value)))
+
+    def decide(self, current, signals):
+        """Return (new_concurrency, reason) for the observed signals."""
+        current = self._clamp(current)
+        if signals["invocations"] < self.min_samples:
+            return current, f"hold: only {signals['invocations']} invocations observed"
+
+        if signals["throttleRate"] > self.max_throttle_rate:
+            return (
+                self._clamp(math.floor(current * self.decrease_factor)),
+                f"decrease: throttle rate {signals['throttleRate']:.2%} > {self.max_throttle_rate:.2%}",
+            )
+
+        slow = [
+            f"{stage} p95 {stats['p95Ms']:.0f}ms > {self.p95_targets_ms[stage]}ms"
+            for stage, stats in signals["stages"].items()
+            if stage in self.p95_targets_ms and stats["p95Ms"] > self.p95_targets_ms[stage]
+        ]
+        if slow:
+            return self._clamp(math.floor(current * self.decrease_factor)), "decrease: " + ", ".join(slow)
+
+        near_target = any(
+            stats["p95Ms"] > self.headroom * self.p95_targets_ms[stage]
+            for stage, stats in signals["stages"].items()
+            if stage in self.p95_targets_ms
+        )
+        if signals["throttleCount"] == 0 and not near_target:
+            return self._clamp(current + self.increase_step), "increase: no throttles, p95 within targets"
+
+        return current, "hold: near limits"
+
+
+# ============================================================
+# State (tb_concurrency_state)
+# ============================================================
+
+def get_state(db, name=DEFAULT_CONTROLLER):
+    return db[STATE_COLLECTION].find_one({"_id": name})
+
+
+def current_concurrency(db, controller=None, name=DEFAULT_CONTROLLER):
+    """The concurrency the next run should use."""
+    controller = controller or AIMDController()
+    state = get_state(db, name)
+    return state["concurrency"] if state else controller.initial_concurrency
+
+
+def update_concurrency(db, signals, controller=None, name=DEFAULT_CONTROLLER):
+    """Apply the controller to signals and persist the new concurrency; returns the state."""
+    controller = controller or AIMDController()
+    previous = current_concurrency(db, controller, name)
+    concurrency, reason = controller.decide(previous, signals)
+    now = datetime.now(timezone.utc)
+
+    entry = {
+        "at": now,
+        "previous": previous,
+        "concurrency": concurrency,
+        "reason": reason,
+        "executionId": signals.get("executionId"),
+        "throttles": signals["throttles"],
+        "throttleRate": signals["throttleRate"],
+        "p95Ms": {stage: stats["p95Ms"] for stage, stats in signals["stages"].items()},
+    }
+    db[STATE_COLLECTION].update_one(
+        {"_id": name},
+        {
+            "$set": {"concurrency": concurrency, "reason": reason, "signals": signals, "updatedAt": now},
+            "$setOnInsert": {"createdAt": now},
+            "$push": {"history": {"$each": [entry], "$slice": -HISTORY_LENGTH}},
+        },
+        upsert=True,
+    )
+    log.info("concurrency_update", controller=name, previous=previous, concurrency=concurrency, reason=reason)
+    return get_state(db, name)
+
+
+def execution_input(db, s3_uri, controller=None, name=DEFAULT_CONTROLLER):
+    """Execution input for the prod-adaptive definition."""
+    return {"s3Uri": s3_uri, "maxConcurrency": current_concurrency(db, controller, name)}
+
+
+# ============================================================
+# Waves
+# ============================================================
+
+def plan_waves(items, wave_size):
+    """Split manifest items into consecutive waves of at most wave_size."""
+    if wave_size <= 0:
+        raise ValueError("wave_size must be positive")
+    return [items[i:i + wave_size] for i in range(0, len(items), wave_size)]
+
+
+def run_in_waves(db, items, wave_size, run_wave, controller=None, name=DEFAULT_CONTROLLER):
+    """
+    Process items wave by wave. run_wave(items, concurrency) runs one
+    execution and returns its execution Id; the signals of each wave set the
+    concurrency of the next. Returns one report per wave.
+    """
+    controller = controller or AIMDController()
+    ensure_indexes(db)  # collect_signals runs after every wave
+    reports = []
+    for index, wave in enumerate(plan_waves(items, wave_size)):
+        concurrency = current_concurrency(db, controller, name)
+        execution_id = run_wave(wave, concurrency)
+        signals = collect_signals(db, execution_id=execution_id)
+        state = update_concurrency(db, signals, controller, name)
+        reports.append({
+            "wave": index,
+            "files": len(wave),
+            "concurrency": concurrency,
+            "nextConcurrency": state["concurrency"],
+            "reason": state["reason"],
+            "throttles": signals["throttles"],
+            "throttleRate": signals["throttleRate"],
+            "p95Ms": {stage: stats["p95Ms"] for stage, stats in signals["stages"].items()},
+        })
+    return reports
+
+
+if __name__ == "__main__":
+    from pymongo import MongoClient
+
+    parser = argparse.ArgumentParser(description="Adaptive Map concurrency for the BEO pipeline")
+    parser.add_argument("--name", default=DEFAULT_CONTROLLER)
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--show", action="store_true", help="Print the current concurrency and recent decisions")
+    group.add_argument("--signals", metavar="EXECUTION_ID", help="Print the signals of one execution")
+    group.add_argument("--update", metavar="EXECUTION_ID", help="Adjust the concurrency from one execution")
+    group.add_argument("--input", metavar="S3_URI", help="Print the execution input for a manifest")
+    parser.add_argument("--create-indexes", action="store_true")
+    args = parser.parse_args()
+
+    db = MongoClient(os.getenv("PROD_MONGO_URI"))[os.getenv("MONGO_DATABASE", "yc-invoice")]
+    if args.create_indexes:
+        ensure_indexes(db)
+
+    if args.show:
+        state = get_state(db, args.name) or {}
+        print(json.dumps({
+            "concurrency": current_concurrency(db, name=args.name),
+            "reason": state.get("reason"),
+            "updatedAt": state.get("updatedAt"),
+            "history": state.get("history", [])[-10:],
+        }, indent=2, default=str))
+    elif args.signals:
+        print(json.dumps(collect_signals(db, execution_id=args.signals), indent=2, default=str))
+    elif args.update:
+        state = update_concurrency(db, collect_signals(db, execution_id=args.update), name=args.name)
+        print(json.dumps({"concurrency": state["concurrency"], "reason": state["reason"]}, indent=2))
+    else:
+        print(json.dumps(execution_input(db, args.input, name=args.name)))
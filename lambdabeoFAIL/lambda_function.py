@@ -5,6 +5,9 @@ from bson import ObjectId
 from datetime import datetime
 from dotenv import load_dotenv
 
+from tracing import span, trace_context
+import log
+
 load_dotenv()
 
 # --- MongoDB Connection ---
@@ -21,27 +24,36 @@ def lambda_handler(event, context):
         "fileId": "68e62784866151ede43ab136",
         "message": "Processing completed successfully"
     }
+    or, for a batch of small files, {"files": [{"fileId": ...}, ...], "message": ...}
     """
     try:
         file_id = event.get("fileId")
         message = event.get("message", "Processing completed successfully")
 
-        if not file_id:
+        if isinstance(event.get("files"), list):
+            file_ids = [f["fileId"] for f in event["files"] if f.get("fileId")]
+            file_filter = {"_id": {"$in": [ObjectId(f) for f in file_ids]}}
+            file_id = ",".join(file_ids)
+        elif file_id:
+            file_filter = {"_id": ObjectId(file_id)}
+        else:
             raise ValueError("Missing 'fileId' in event")
 
         # --- Update MongoDB ---
-        result = col_files.update_one(
-            {"_id": ObjectId(file_id)},
-            {
-                "$set": {
-                    "processingStatus": "Completed",
-                    "successMessage": message,
-                    "updatedAt": datetime.utcnow().isoformat() + "Z"
+        with trace_context(fileId=file_id, executionId=event.get("executionId")), \
+                span("fail"), span("mongo_write", collection="tb_file_details"):
+            result = col_files.update_many(
+                file_filter,
+                {
+                    "$set": {
+                        "processingStatus": "Completed",
+                        "successMessage": message,
+                        "updatedAt": datetime.utcnow().isoformat() + "Z"
+                    }
                 }
-            }
-        )
+            )
 
-        print(f"✅ Marked SUCCESS for file {file_id}, modified: {result.modified_count}")
+        log.info("fail_marked", fileId=file_id, modified=result.modified_count)
         return {
             "status": "Completed",
             "fileId": file_id,
@@ -49,7 +61,7 @@ def lambda_handler(event, context):
         }
 
     except Exception as e:
-        print(f"🔥 Error in mark_success_lambda: {e}")
+        log.error("fail_lambda_failed", fileId=event.get("fileId"), error=str(e))
         return {
             "status": "failed",
             "error": str(e)
@@ -0,0 +1,743 @@
+"""
+In-memory stand-ins for S3, Textract, MongoDB and Azure OpenAI.
+
+Used by local_runner.py to run the whole pipeline in one process. Only the
+API surface the Lambdas actually call is implemented. The lambda
+directories must be on sys.path before this module is imported, because the
+fakes raise the vendored pymongo/botocore exception types.
+"""
+import io
+import json
+import random
+import re
+import threading
+import time
+import types
+from datetime import datetime
+from uuid import uuid4
+
+from bson import ObjectId
+from botocore.exceptions import ClientError
+from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+
+# ============================================================
+# Clock
+# ============================================================
+
+class ScaledClock:
+    """
+    Drop-in for the `time` module inside the Lambdas: sleep() is multiplied
+    by `scale`, so the fixed 5s Textract polling does not dominate local runs.
+    """
+
+    def __init__(self, scale=0.01):
+        self.scale = scale
+
+    def sleep(self, seconds):
+        time.sleep(max(seconds, 0) * self.scale)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+# ============================================================
+# MongoDB
+# ============================================================
+
+_MISSING = object()
+
+
+def _get_path(doc, path):
+    value = doc
+    parts = path.split(".")
+    for index, part in enumerate(parts):
+        if isinstance(value, dict) and part in value:
+            value = value[part]
+        elif isinstance(value, list) and part.isdigit() and int(part) < len(value):
+            value = value[int(part)]
+        elif isinstance(value, list):
+            # "invocations.executionId": the values of that field across the array
+            rest = ".".join(parts[index:])
+            found = [_get_path(item, rest) for item in value if isinstance(item, dict)]
+            found = [v for v in found if v is not _MISSING]
+            return found if found else _MISSING
+        else:
+            return _MISSING
+    return value
+
+
+def _set_path(doc, path, value):
+    parts = path.split(".")
+    target = doc
+    for part in parts[:-1]:
+        if not isinstance(target.get(part), dict):
+            target[part] = {}
+        target = target[part]
+    target[parts[-1]] = value
+
+
+def _unset_path(doc, path):
+    parts = path.split(".")
+    target = doc
+    for part in parts[:-1]:
+        target = target.get(part)
+        if not isinstance(target, dict):
+            return
+    target.pop(parts[-1], None)
+
+
+def _compare(value, op, expected):
+    if op == "$eq":
+        return value == expected or (isinstance(value, list) and expected in value)
+    if op == "$ne":
+        return not _compare(value, "$eq", expected)
+    if op == "$in":
+        return any(_compare(value, "$eq", e) for e in expected)
+    if op == "$nin":
+        return not _compare(value, "$in", expected)
+    if op == "$exists":
+        return (value is not _MISSING) == bool(expected)
+    if value is _MISSING or value is None:
+        return False
+    if isinstance(value, list):
+        return any(_compare(v, op, expected) for v in value)
+    try:
+        if op == "$lt":
+            return value < expected
+        if op == "$lte":
+            return value <= expected
+        if op == "$gt":
+            return value > expected
+        if op == "$gte":
+            return value >= expected
+    except TypeError:
+        return False
+    if op == "$regex":
+        return isinstance(value, str) and re.search(expected, value) is not None
+    raise NotImplementedError(f"Fake Mongo does not support {op}")
+
+
+def _copy(value):
+    """
+    Deep copy of stored data: dicts and lists are copied, everything else in
+    a BSON document is immutable and shared, as copy.deepcopy would. The
+    copies are allocated in this file, so memprofile's MEMORY_PROFILE_EXCLUDE
+    can tell them from the function's own memory (see benchmarks/memory.py).
+    """
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy(v) for v in value]
+    return value
+
+
+def matches(doc, query):
+    """Subset of the MongoDB query language used by the Lambdas."""
+    for key, condition in (query or {}).items():
+        if key == "$or":
+            if not any(matches(doc, q) for q in condition):
+                return False
+            continue
+        if key == "$and":
+            if not all(matches(doc, q) for q in condition):
+                return False
+            continue
+
+        value = _get_path(doc, key)
+        if isinstance(condition, dict) and condition and all(k.startswith("$") for k in condition):
+            if not all(_compare(value, op, expected) for op, expected in condition.items()):
+                return False
+        elif not _compare(value, "$eq", condition):
+            return False
+    return True
+
+
+def apply_update(doc, update, inserting=False):
+    for op, fields in update.items():
+        if op == "$set":
+            for path, value in fields.items():
+                _set_path(doc, path, _copy(value))
+        elif op == "$setOnInsert":
+            if inserting:
+                for path, value in fields.items():
+                    _set_path(doc, path, _copy(value))
+        elif op == "$unset":
+            for path in fields:
+                _unset_path(doc, path)
+        elif op == "$inc":
+            for path, amount in fields.items():
+                current = _get_path(doc, path)
+                _set_path(doc, path, (0 if current is _MISSING else current) + amount)
+        elif op == "$max":
+            for path, value in fields.items():
+                current = _get_path(doc, path)
+                if current is _MISSING or value > current:
+                    _set_path(doc, path, value)
+        elif op == "$push":
+            for path, value in fields.items():
+                current = _get_path(doc, path)
+                items = value["$each"] if isinstance(value, dict) and "$each" in value else [value]
+                merged = (list(current) if current is not _MISSING else []) + _copy(items)
+                if isinstance(value, dict) and "$slice" in value:
+                    limit = value["$slice"]
+                    merged = merged[limit:] if limit < 0 else merged[:limit]
+                _set_path(doc, path, merged)
+        else:
+            raise NotImplementedError(f"Fake Mongo does not support {op}")
+
+
+def _updated_copy(doc, update):
+    """
+    Copy-on-write update: returns (new doc, modified). Only the top-level
+    fields the update touches are copied, and stored documents are replaced,
+    never mutated, so transaction snapshots can share them without copying.
+    """
+    touched = {path.split(".")[0] for fields in update.values() for path in fields}
+    new = dict(doc)
+    for field in touched & new.keys():
+        new[field] = _copy(new[field])
+    apply_update(new, update)
+    return new, any(doc.get(f, _MISSING) != new.get(f, _MISSING) for f in touched)
+
+
+def project(doc, projection):
+    """Copy of doc with only the projected fields (inclusion or top-level exclusion)."""
+    if not projection:
+        return _copy(doc)
+    fields = projection if isinstance(projection, dict) else {path: 1 for path in projection}
+    if any(include for path, include in fields.items() if path != "_id"):
+        out = {"_id": doc["_id"]} if fields.get("_id", 1) and "_id" in doc else {}
+        for path, include in fields.items():
+            value = _get_path(doc, path) if include and path != "_id" else _MISSING
+            if value is not _MISSING:
+                _set_path(out, path, _copy(value))
+        return out
+    return {k: _copy(v) for k, v in doc.items() if fields.get(k, 1)}
+
+
+def _seed_from_query(query):
+    doc = {}
+    for key, value in (query or {}).items():
+        if not key.startswith("$") and not (isinstance(value, dict) and any(k.startswith("$") for k in value)):
+            _set_path(doc, key, _copy(value))
+    return doc
+
+
+class _Result(types.SimpleNamespace):
+    pass
+
+
+class FakeCollection:
+    def __init__(self, client, name):
+        self._client = client
+        self.name = name
+        self._docs = {}
+        self._indexes = {}
+
+    @property
+    def _lock(self):
+        return self._client._lock
+
+    def _find(self, query):
+        return [d for d in self._docs.values() if matches(d, query)]
+
+    # --- reads ---
+    def find_one(self, query=None, projection=None, session=None, **kwargs):
+        with self._lock:
+            found = self._find(query)
+            return project(found[0], projection) if found else None
+
+    def find(self, query=None, projection=None, session=None, **kwargs):
+        with self._lock:
+            return iter([project(d, projection) for d in self._find(query)])
+
+    def count_documents(self, query, session=None, **kwargs):
+        with self._lock:
+            return len(self._find(query))
+
+    # --- writes ---
+    def insert_one(self, doc, session=None, **kwargs):
+        with self._lock:
+            doc = _copy(doc)
+            doc.setdefault("_id", ObjectId())
+            if doc["_id"] in self._docs:
+                raise DuplicateKeyError(f"E11000 duplicate key error collection: {self.name} _id: {doc['_id']}")
+            self._docs[doc["_id"]] = doc
+            return _Result(inserted_id=doc["_id"], acknowledged=True)
+
+    def insert_many(self, docs, session=None, **kwargs):
+        return _Result(inserted_ids=[self.insert_one(d).inserted_id for d in docs], acknowledged=True)
+
+    def update_one(self, query, update, upsert=False, session=None, **kwargs):
+        with self._lock:
+            found = self._find(query)
+            if found:
+                doc, modified = _updated_copy(found[0], update)
+                self._docs[doc["_id"]] = doc
+                return _Result(matched_count=1, modified_count=int(modified), upserted_id=None)
+            if not upsert:
+                return _Result(matched_count=0, modified_count=0, upserted_id=None)
+            doc = _seed_from_query(query)
+            apply_update(doc, update, inserting=True)
+            doc.setdefault("_id", ObjectId())
+            self._docs[doc["_id"]] = doc
+            return _Result(matched_count=0, modified_count=0, upserted_id=doc["_id"])
+
+    def update_many(self, query, update, upsert=False, session=None, **kwargs):
+        with self._lock:
+            found = self._find(query)
+            if not found and upsert:
+                return self.update_one(query, update, upsert=True)
+            modified = 0
+            for doc in found:
+                doc, changed = _updated_copy(doc, update)
+                self._docs[doc["_id"]] = doc
+                modified += int(changed)
+            return _Result(matched_count=len(found), modified_count=modified, upserted_id=None)
+
+    def find_one_and_update(self, query, update, projection=None, return_document=ReturnDocument.BEFORE,
+                            upsert=False, session=None, **kwargs):
+        with self._lock:
+            found = self._find(query)
+            if not found:
+                if not upsert:
+                    return None
+                result = self.update_one(query, update, upsert=True)
+                return (project(self._docs[result.upserted_id], projection)
+                        if return_document == ReturnDocument.AFTER else None)
+            before = found[0]
+            doc, _ = _updated_copy(before, update)
+            self._docs[doc["_id"]] = doc
+            return project(doc if return_document == ReturnDocument.AFTER else before, projection)
+
+    def delete_one(self, query, session=None, **kwargs):
+        with self._lock:
+            found = self._find(query)
+            if found:
+                del self._docs[found[0]["_id"]]
+            return _Result(deleted_count=len(found[:1]))
+
+    def bulk_write(self, requests, ordered=True, session=None, **kwargs):
+        counts = {"inserted_count": 0, "matched_count": 0, "modified_count": 0,
+                  "deleted_count": 0, "upserted_count": 0}
+        with self._lock:
+            for op in requests:
+                kind = type(op).__name__
+                if kind == "InsertOne":
+                    self.insert_one(op._doc)
+                    counts["inserted_count"] += 1
+                elif kind == "UpdateOne":
+                    r = self.update_one(op._filter, op._doc, upsert=bool(op._upsert))
+                    counts["matched_count"] += r.matched_count
+                    counts["modified_count"] += r.modified_count
+                    counts["upserted_count"] += int(r.upserted_id is not None)
+                elif kind == "DeleteOne":
+                    counts["deleted_count"] += self.delete_one(op._filter).deleted_count
+                else:
+                    raise NotImplementedError(f"Fake Mongo bulk_write does not support {kind}")
+        return _Result(acknowledged=True, **counts)
+
+    def create_index(self, keys, **kwargs):
+        # Recorded for index_information(), not enforced
+        keys = [(k, 1) if isinstance(k, str) else tuple(k) for k in (keys if isinstance(keys, list) else [keys])]
+        name = kwargs.get("name") or "_".join(f"{k}_{d}" for k, d in keys)
+        with self._lock:
+            self._indexes[name] = {"key": keys, **{k: v for k, v in kwargs.items() if k != "name"}}
+        return name
+
+    def index_information(self):
+        with self._lock:
+            return {"_id_": {"key": [("_id", 1)]}, **_copy(self._indexes)}
+
+    def watch(self, *args, **kwargs):
+        # Like a standalone mongod: callers fall back to polling
+        raise OperationFailure("The $changeStream stage is only supported on replica sets", code=40573)
+
+
+class FakeDatabase:
+    def __init__(self, client, name):
+        self._client = client
+        self.name = name
+        self._collections = {}
+
+    def __getitem__(self, name):
+        with self._client._lock:
+            if name not in self._collections:
+                self._collections[name] = FakeCollection(self._client, name)
+            return self._collections[name]
+
+
+class FakeSession:
+    """Transactions run under the store lock and roll back on error."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def with_transaction(self, callback, **kwargs):
+        with self._client._lock:
+            snapshot = self._client._snapshot()
+            try:
+                return callback(self)
+            except Exception:
+                self._client._restore(snapshot)
+                raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeMongoClient:
+    """
+    Replaces pymongo.MongoClient. Every instance shares one store, so the
+    four Lambdas see the same data, as they would against one cluster.
+    """
+
+    _lock = threading.RLock()
+    _databases = {}
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getitem__(self, name):
+        with self._lock:
+            if name not in self._databases:
+                self._databases[name] = FakeDatabase(self, name)
+            return self._databases[name]
+
+    def start_session(self, **kwargs):
+        return FakeSession(self)
+
+    def close(self):
+        pass
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._databases.clear()
+
+    def _snapshot(self):
+        # Stored documents are never mutated in place (see _updated_copy)
+        return {
+            (db_name, col_name): dict(col._docs)
+            for db_name, db in self._databases.items()
+            for col_name, col in db._collections.items()
+        }
+
+    def _restore(self, snapshot):
+        for db_name, db in self._databases.items():
+            for col_name, col in db._collections.items():
+                col._docs = snapshot.get((db_name, col_name), {})
+
+
+# ============================================================
+# S3
+# ============================================================
+
+class _Body(io.BytesIO):
+    def iter_lines(self, chunk_size=1024, keepends=False):
+        for line in self.read().splitlines(keepends):
+            yield line
+
+    def iter_chunks(self, chunk_size=1024):
+        while True:
+            chunk = self.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+class FakeS3:
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.objects = {}
+        self._lock = threading.Lock()
+
+    def _wait(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _no_such_key(self, bucket, key, op):
+        return ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": f"s3://{bucket}/{key}"}}, op
+        )
+
+    def put_object(self, Bucket, Key, Body=b"", **kwargs):
+        self._wait()
+        if isinstance(Body, str):
+            Body = Body.encode("utf-8")
+        with self._lock:
+            self.objects[(Bucket, Key)] = bytes(Body)
+        return {"ETag": f'"{abs(hash(Body)):x}"'}
+
+    def get_object(self, Bucket, Key, **kwargs):
+        self._wait()
+        with self._lock:
+            if (Bucket, Key) not in self.objects:
+                raise self._no_such_key(Bucket, Key, "GetObject")
+            body = self.objects[(Bucket, Key)]
+        return {"Body": _Body(body), "ContentLength": len(body)}
+
+    def head_object(self, Bucket, Key, **kwargs):
+        with self._lock:
+            if (Bucket, Key) not in self.objects:
+                raise self._no_such_key(Bucket, Key, "HeadObject")
+            body = self.objects[(Bucket, Key)]
+        return {"ContentLength": len(body), "ETag": f'"{abs(hash(body)):x}"'}
+
+    def copy_object(self, Bucket, CopySource, Key, **kwargs):
+        self._wait()
+        with self._lock:
+            source = (CopySource["Bucket"], CopySource["Key"])
+            if source not in self.objects:
+                raise self._no_such_key(*source, "CopyObject")
+            self.objects[(Bucket, Key)] = self.objects[source]
+        return {}
+
+    def delete_object(self, Bucket, Key, **kwargs):
+        with self._lock:
+            self.objects.pop((Bucket, Key), None)
+        return {}
+
+
+# ============================================================
+# Textract
+# ============================================================
+
+def _geometry(top=0.0):
+    return {
+        "BoundingBox": {"Width": 0.5, "Height": 0.02, "Left": 0.1, "Top": top},
+        "Polygon": [{"X": 0.1, "Y": top}, {"X": 0.6, "Y": top},
+                    {"X": 0.6, "Y": top + 0.02}, {"X": 0.1, "Y": top + 0.02}],
+    }
+
+
+def _block(block_type, text=None, top=0.0, **fields):
+    block = {"BlockType": block_type, "Id": uuid4().hex, "Confidence": 99.0, "Geometry": _geometry(top)}
+    if text is not None:
+        block["Text"] = text
+    block.update(fields)
+    return block
+
+
+def make_textract_blocks(pages, rows_per_page=12, lines_per_page=25):
+    """Synthetic GetDocumentAnalysis blocks (PAGE/LINE/WORD/TABLE/CELL) that trp can parse."""
+    blocks = []
+    for page_no in range(1, pages + 1):
+        page = _block("PAGE", Page=page_no, Relationships=[{"Type": "CHILD", "Ids": []}])
+        children = page["Relationships"][0]["Ids"]
+        blocks.append(page)
+
+        for i in range(lines_per_page):
+            text = f"BEO line {page_no}-{i} Food PACKAGE {i} 100 140.00 14000.00"
+            words = [_block("WORD", w, top=i / lines_per_page, Page=page_no) for w in text.split()]
+            line = _block("LINE", text, top=i / lines_per_page, Page=page_no,
+                          Relationships=[{"Type": "CHILD", "Ids": [w["Id"] for w in words]}])
+            children.append(line["Id"])
+            blocks.append(line)
+            blocks.extend(words)
+
+        cells = []
+        for r in range(1, rows_per_page + 1):
+            for c, text in enumerate([f"Item {page_no}.{r}", str(r * 10), "140.00", f"{r * 1400}.00"], start=1):
+                word = _block("WORD", text, Page=page_no)
+                blocks.append(word)
+                cells.append(_block("CELL", RowIndex=r, ColumnIndex=c, RowSpan=1, ColumnSpan=1, Page=page_no,
+                                    Relationships=[{"Type": "CHILD", "Ids": [word["Id"]]}]))
+        table = _block("TABLE", Page=page_no, Relationships=[{"Type": "CHILD", "Ids": [c["Id"] for c in cells]}])
+        children.append(table["Id"])
+        blocks.append(table)
+        blocks.extend(cells)
+    return blocks
+
+
+def synthetic_document(pages):
+    """Bytes stored as the 'PDF' in fake S3; FakeTextract reads the page count back."""
+    return json.dumps({"syntheticPages": pages}).encode("utf-8")
+
+
+class FakeTextract:
+    """
+    Async document analysis: a job stays IN_PROGRESS for
+    base_seconds + per_page_seconds * pages, then pages out its blocks
+    page_size blocks at a time (like NextToken pagination).
+    throttle_rate is the fraction of calls rejected with a throttling error;
+    max_active_jobs rejects new jobs with LimitExceededException while that
+    many are still running (Textract's concurrent async job quota).
+    """
+
+    def __init__(self, s3, base_seconds=0.05, per_page_seconds=0.01, page_size=1000, throttle_rate=0.0,
+                 max_active_jobs=None):
+        self.s3 = s3
+        self.base_seconds = base_seconds
+        self.per_page_seconds = per_page_seconds
+        self.page_size = page_size
+        self.throttle_rate = throttle_rate
+        self.max_active_jobs = max_active_jobs
+        self.jobs = {}
+        self.calls = {"start_document_analysis": 0, "get_document_analysis": 0, "throttled": 0}
+        self._lock = threading.Lock()
+
+    def _maybe_throttle(self, operation):
+        if self.throttle_rate and random.random() < self.throttle_rate:
+            with self._lock:
+                self.calls["throttled"] += 1
+            raise ClientError(
+                {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "Rate exceeded"},
+                 "ResponseMetadata": {"HTTPStatusCode": 400}},
+                operation,
+            )
+
+    def start_document_analysis(self, DocumentLocation, FeatureTypes=None, **kwargs):
+        self._maybe_throttle("StartDocumentAnalysis")
+        obj = DocumentLocation["S3Object"]
+        body = self.s3.get_object(Bucket=obj["Bucket"], Key=obj["Name"])["Body"].read()
+        pages = json.loads(body).get("syntheticPages", 1)
+        job_id = uuid4().hex
+        with self._lock:
+            self.calls["start_document_analysis"] += 1
+            if self.max_active_jobs is not None:
+                now = time.monotonic()
+                active = sum(1 for job in self.jobs.values() if job["ready_at"] > now)
+                if active >= self.max_active_jobs:
+                    self.calls["throttled"] += 1
+                    raise ClientError(
+                        {"Error": {"Code": "LimitExceededException", "Message": "Open jobs exceed maximum concurrent job limit"},
+                         "ResponseMetadata": {"HTTPStatusCode": 400}},
+                        "StartDocumentAnalysis",
+                    )
+            self.jobs[job_id] = {
+                "pages": pages,
+                "ready_at": time.monotonic() + self.base_seconds + self.per_page_seconds * pages,
+                "blocks": None,
+            }
+        return {"JobId": job_id}
+
+    def get_document_analysis(self, JobId, NextToken=None, **kwargs):
+        self._maybe_throttle("GetDocumentAnalysis")
+        with self._lock:
+            self.calls["get_document_analysis"] += 1
+            job = self.jobs.get(JobId)
+        if not job:
+            raise ClientError({"Error": {"Code": "InvalidJobIdException", "Message": JobId}}, "GetDocumentAnalysis")
+        if time.monotonic() < job["ready_at"]:
+            return {"JobStatus": "IN_PROGRESS"}
+
+        if job["blocks"] is None:
+            job["blocks"] = make_textract_blocks(job["pages"])
+        start = int(NextToken or 0)
+        end = start + self.page_size
+        resp = {
+            "JobStatus": "SUCCEEDED",
+            "Blocks": job["blocks"][start:end],
+            "DocumentMetadata": {"Pages": job["pages"]},
+        }
+        if end < len(job["blocks"]):
+            resp["NextToken"] = str(end)
+        return resp
+
+
+class FakeBoto3:
+    """Replaces boto3.client(): every Lambda gets the same fake S3/Textract."""
+
+    def __init__(self, s3, textract):
+        self._clients = {"s3": s3, "textract": textract}
+
+    def client(self, service_name, *args, **kwargs):
+        if service_name not in self._clients:
+            raise NotImplementedError(f"No fake for boto3 client '{service_name}'")
+        return self._clients[service_name]
+
+
+# ============================================================
+# Azure OpenAI
+# ============================================================
+
+class FakeLLMAgent:
+    """
+    Same interface as azure_llm_agent.AzureLLMAgent. Turns the table rows in
+    the OCR text into invoice items after a simulated completion latency.
+    throttle_rate is the fraction of calls that fail the way the real agent
+    does once its own 429 retries are exhausted (RetryableError).
+    set_capacity(n) lets at most n completions run at once, across all agents;
+    the rest queue, like requests waiting out a deployment's rate limit.
+    """
+
+    latency = 0.05
+    latency_per_kchar = 0.0
+    throttle_rate = 0.0
+    _slots = None
+
+    def __init__(self):
+        self.model = "fake-deployment"
+
+    @classmethod
+    def set_capacity(cls, max_concurrent=None):
+        cls._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+
+    def _sleep(self, prompt):
+        slots = self._slots
+        if slots is not None:
+            slots.acquire()
+        try:
+            time.sleep(self.latency + self.latency_per_kchar * len(prompt) / 1000)
+        finally:
+            if slots is not None:
+                slots.release()
+        if self.throttle_rate and random.random() < self.throttle_rate:
+            from errors import RetryableError, record_throttle
+            record_throttle("azure_openai")
+            raise RetryableError("Azure OpenAI rate limit (simulated)")
+
+    def build_prompt(self, extracted_text: str) -> str:
+        return extracted_text
+
+    @staticmethod
+    def _record_usage(call, prompt, answer):
+        # Roughly 4 characters per token, like the real models on English text
+        from llm_usage import record_usage
+        record_usage(call, {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(answer) // 4},
+                     "fake-deployment")
+
+    def complete(self, prompt: str) -> str:
+        self._sleep(prompt)
+        items = []
+        for row in re.findall(r"^(Item [\d.]+)\s*\|\s*(\d+)\s*\|\s*([\d.]+)\s*\|\s*([\d.]+)", prompt, re.MULTILINE):
+            items.append({
+                "tableType": "Food",
+                "itemDescription": row[0],
+                "quantity": float(row[1]),
+                "unitPrice": float(row[2]),
+                "totalAmount": float(row[3]),
+                "currency": "AED",
+                "matchConfidence": 1.0,
+            })
+        answer = json.dumps({
+            "eventName": "Local Run Event",
+            "billTo": "Local Run Client",
+            "beoNumber": "BEO-LOCAL",
+            "eventDate": datetime.utcnow().strftime("%Y-%m-%d"),
+            "attentionTo": "Test User",
+            "items": items,
+        })
+        self._record_usage("structured", prompt, answer)
+        return answer
+
+    def extract_invoice_and_items(self, ocr_text: str) -> dict:
+        self._sleep(ocr_text)
+        answer = {"beoNumber": "BEO-LOCAL", "itemDescriptions": re.findall(r"^(Item [\d.]+)", ocr_text, re.MULTILINE)}
+        self._record_usage("canonical", ocr_text, json.dumps(answer))
+        return answer
+
+
+def fake_azure_module():
+    """Module object to install as sys.modules['azure_llm_agent']."""
+    module = types.ModuleType("azure_llm_agent")
+    module.AzureLLMAgent = FakeLLMAgent
+    shared = FakeLLMAgent()
+    module.get_agent = lambda: shared
+    return module
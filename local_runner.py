@@ -0,0 +1,772 @@
+"""
+Run the BEO state machine locally, in-process.
+
+Interprets the definition produced by stepfunction_builder.py and invokes
+the four lambda_handlers directly. S3, Textract, MongoDB and Azure OpenAI
+are replaced with the in-memory fakes from local_fakes.py. Map states run
+their items on a thread pool sized by MaxConcurrency. Processes are not
+used because the fakes live in this process's memory.
+
+    python local_runner.py --files 20 --pages 3 --concurrency 5
+    python local_runner.py --env prod-distributed --files 200 --json
+    python local_runner.py --adaptive --files 200 --wave-size 40 --textract-throttle 0.05
+    python local_runner.py --files 50 --trace /tmp/spans.jsonl && python trace_report.py /tmp/spans.jsonl
+    python local_runner.py --files 20 --pages 30 --profile /tmp/run.folded && flamegraph.pl /tmp/run.folded > run.svg
+
+Supported ASL subset: Task, Map (INLINE/DISTRIBUTED, ItemsPath, ItemReader,
+ItemSelector, ItemBatcher, MaxConcurrency[Path], ToleratedFailure*), Pass, Choice, Succeed, Fail,
+Parameters/ResultSelector/ResultPath/OutputPath (paths may use [*]), Retry
+(backoff, MaxDelaySeconds, JitterStrategy) and Catch. TimeoutSeconds is not enforced.
+"""
+import argparse
+import copy
+import importlib.util
+import json
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from uuid import uuid4
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+LAMBDA_DIRS = {
+    "structured": "beofinallambda2",
+    "ocr": "OCR_lambda1",
+    "fail": "lambdabeoFAIL",
+    "load": "BEO_S3_File_read",
+}
+
+LOCAL_ENV = {
+    "PROD_MONGO_URI": "mongodb://local-runner",
+    "MONGO_DATABASE": "yc-invoice",
+    "FILE_DETAILS": "tb_file_details",
+    "CREDIT": "tb_credits",
+    "S3_BUCKET_NAME": "local-beo-bucket",
+    "AWS_DEFAULT_REGION": "ap-south-1",
+}
+
+
+# ============================================================
+# Errors
+# ============================================================
+
+class StatesError(Exception):
+    """An ASL error (Error/Cause) raised by a state."""
+
+    def __init__(self, error, cause=""):
+        super().__init__(f"{error}: {cause}")
+        self.error = error
+        self.cause = cause
+
+
+# ============================================================
+# JSONPath (the subset ASL paths use)
+# ============================================================
+
+def _split_path(path):
+    parts = []
+    for token in path[1:].replace("[", ".[").split("."):
+        if not token:
+            continue
+        if token == "[*]":
+            parts.append("*")
+        else:
+            parts.append(int(token[1:-1]) if token.startswith("[") else token)
+    return parts
+
+
+def get_path(data, path):
+    if path is None:
+        return None
+    return _get_parts(data, _split_path(path), path)
+
+
+def _get_parts(value, parts, path):
+    for index, part in enumerate(parts):
+        if part == "*":
+            # [*] collects the rest of the path from each element; elements without it are left out
+            if not isinstance(value, list):
+                raise StatesError("States.Runtime", f"Invalid path '{path}': '[*]' on a non-list")
+            found = []
+            for element in value:
+                try:
+                    found.append(_get_parts(element, parts[index + 1:], path))
+                except StatesError:
+                    pass
+            return found
+        try:
+            value = value[part]
+        except (KeyError, IndexError, TypeError):
+            raise StatesError("States.Runtime", f"Invalid path '{path}': could not find '{part}'")
+    return value
+
+
+def set_path(data, path, value):
+    """ResultPath semantics: null discards, '$' replaces, '$.a.b' merges into a copy."""
+    if path is None:
+        return data
+    parts = _split_path(path)
+    if not parts:
+        return value
+    result = copy.deepcopy(data) if isinstance(data, dict) else {}
+    target = result
+    for part in parts[:-1]:
+        if not isinstance(target.get(part), dict):
+            target[part] = {}
+        target = target[part]
+    target[parts[-1]] = value
+    return result
+
+
+def resolve_parameters(template, data, context):
+    """Evaluate a Parameters/ItemSelector template against input and context."""
+    if isinstance(template, dict):
+        resolved = {}
+        for key, value in template.items():
+            if key.endswith(".$"):
+                if value.startswith("$$"):
+                    resolved[key[:-2]] = get_path(context, value[1:])
+                elif value.startswith("$"):
+                    resolved[key[:-2]] = get_path(data, value)
+                else:
+                    raise StatesError("States.Runtime", f"Intrinsic functions are not supported: {value}")
+            else:
+                resolved[key] = resolve_parameters(value, data, context)
+        return resolved
+    if isinstance(template, list):
+        return [resolve_parameters(v, data, context) for v in template]
+    return template
+
+
+# ============================================================
+# Choice rules
+# ============================================================
+
+_COMPARATORS = {
+    "StringEquals": lambda a, b: a == b,
+    "NumericEquals": lambda a, b: a == b,
+    "NumericGreaterThan": lambda a, b: a > b,
+    "NumericGreaterThanEquals": lambda a, b: a >= b,
+    "NumericLessThan": lambda a, b: a < b,
+    "NumericLessThanEquals": lambda a, b: a <= b,
+    "BooleanEquals": lambda a, b: a is b,
+}
+
+
+def evaluate_choice_rule(rule, data):
+    if "And" in rule:
+        return all(evaluate_choice_rule(r, data) for r in rule["And"])
+    if "Or" in rule:
+        return any(evaluate_choice_rule(r, data) for r in rule["Or"])
+    if "Not" in rule:
+        return not evaluate_choice_rule(rule["Not"], data)
+
+    try:
+        value = get_path(data, rule["Variable"])
+        present = True
+    except StatesError:
+        value, present = None, False
+
+    if "IsPresent" in rule:
+        return present == rule["IsPresent"]
+    if "IsNull" in rule:
+        return present and (value is None) == rule["IsNull"]
+    if not present:
+        return False
+    for name, compare in _COMPARATORS.items():
+        if name in rule:
+            return compare(value, rule[name])
+    raise StatesError("States.Runtime", f"Unsupported Choice rule: {sorted(rule)}")
+
+
+# ============================================================
+# Interpreter
+# ============================================================
+
+class _LambdaContext:
+    def __init__(self, function_name, timeout_seconds=900):
+        self.function_name = function_name
+        self.aws_request_id = uuid4().hex
+        self._deadline = time.monotonic() + timeout_seconds
+
+    def get_remaining_time_in_millis(self):
+        return int(max(self._deadline - time.monotonic(), 0) * 1000)
+
+
+class LocalStateMachine:
+    """
+    Executes a state machine definition against local handlers.
+
+    handlers maps Lambda function names (the last segment of the Resource
+    ARN) to callables taking (event, context). s3 is used by ItemReader and
+    ResultWriter. retry_time_scale shrinks Retry intervals.
+    """
+
+    def __init__(self, definition, handlers, s3=None, retry_time_scale=0.01):
+        self.definition = definition
+        self.handlers = handlers
+        self.s3 = s3
+        self.retry_time_scale = retry_time_scale
+        self.spans = []
+        self._lock = threading.Lock()
+
+    # --- bookkeeping ---
+    def _record(self, state, kind, started, ok, error=None):
+        with self._lock:
+            self.spans.append({
+                "state": state,
+                "type": kind,
+                "seconds": time.perf_counter() - started,
+                "ok": ok,
+                "error": error,
+            })
+
+    @staticmethod
+    def execution_id(name):
+        return f"local:{name}"
+
+    def execute(self, execution_input, name=None):
+        name = name or uuid4().hex
+        context = {
+            "Execution": {
+                "Id": self.execution_id(name),
+                "Name": name,
+                "Input": execution_input,
+                "RedriveCount": 0,
+                "StartTime": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            },
+            "StateMachine": {"Id": "local"},
+        }
+        return self._run_states(self.definition, execution_input, context)
+
+    # --- state graph ---
+    def _run_states(self, machine, data, context):
+        states = machine["States"]
+        name = machine["StartAt"]
+        while True:
+            state = states[name]
+            context = dict(context, State={"Name": name, "EnteredTime": time.time(), "RetryCount": 0})
+            try:
+                data, next_name = self._run_state(name, state, data, context)
+            except StatesError as e:
+                catcher = self._find_catcher(state, e)
+                if not catcher:
+                    raise
+                error_output = {"Error": e.error, "Cause": e.cause}
+                data = set_path(data, catcher.get("ResultPath", "$"), error_output)
+                next_name = catcher["Next"]
+
+            if next_name is None:
+                return data
+            name = next_name
+
+    @staticmethod
+    def _matches(error_equals, error):
+        for name in error_equals:
+            if name == "States.ALL" or name == error.error:
+                return True
+            if name == "States.TaskFailed" and not error.error.startswith("States."):
+                return True
+        return False
+
+    def _find_catcher(self, state, error):
+        for catcher in state.get("Catch", []):
+            if self._matches(catcher["ErrorEquals"], error):
+                return catcher
+        return None
+
+    def _run_state(self, name, state, data, context):
+        kind = state["Type"]
+        effective = get_path(data, state.get("InputPath", "$"))
+
+        if kind == "Task":
+            result = self._run_task(name, state, effective, context)
+        elif kind == "Map":
+            result = self._run_map(name, state, effective, context)
+        elif kind == "Pass":
+            if "Parameters" in state:
+                result = resolve_parameters(state["Parameters"], effective, context)
+            else:
+                result = state.get("Result", effective)
+        elif kind == "Choice":
+            for rule in state["Choices"]:
+                if evaluate_choice_rule(rule, effective):
+                    return data, rule["Next"]
+            if "Default" not in state:
+                raise StatesError("States.NoChoiceMatched", name)
+            return data, state["Default"]
+        elif kind == "Succeed":
+            return data, None
+        elif kind == "Fail":
+            raise StatesError(state.get("Error", "States.Fail"), state.get("Cause", ""))
+        else:
+            raise StatesError("States.Runtime", f"Unsupported state type {kind}")
+
+        if "ResultSelector" in state:
+            result = resolve_parameters(state["ResultSelector"], result, context)
+        output = set_path(data, state.get("ResultPath", "$"), result)
+        output = get_path(output, state.get("OutputPath", "$"))
+        return output, (None if state.get("End") else state["Next"])
+
+    # --- Task ---
+    def _run_task(self, name, state, data, context):
+        function_name = state["Resource"].rsplit(":", 1)[-1]
+        handler = self.handlers.get(function_name)
+        if handler is None:
+            raise StatesError("States.Runtime", f"No local handler for {function_name}")
+
+        retry_counts = {}
+        while True:
+            event = resolve_parameters(state["Parameters"], data, context) if "Parameters" in state else data
+            started = time.perf_counter()
+            try:
+                result = handler(copy.deepcopy(event), _LambdaContext(function_name, state.get("TimeoutSeconds", 900)))
+                # Lambda results go through JSON on the way back to Step Functions
+                result = json.loads(json.dumps(result, default=str))
+                self._record(name, "Task", started, True)
+                return result
+            except StatesError:
+                raise
+            except Exception as e:
+                error = StatesError(type(e).__name__, str(e))
+                self._record(name, "Task", started, False, error.error)
+
+                retrier = next((r for r in state.get("Retry", []) if self._matches(r["ErrorEquals"], error)), None)
+                if retrier is None:
+                    raise error
+                index = state["Retry"].index(retrier)
+                attempt = retry_counts.get(index, 0)
+                if attempt >= retrier.get("MaxAttempts", 3):
+                    raise error
+                retry_counts[index] = attempt + 1
+
+                delay = retrier.get("IntervalSeconds", 1) * retrier.get("BackoffRate", 2.0) ** attempt
+                if retrier.get("MaxDelaySeconds"):
+                    delay = min(delay, retrier["MaxDelaySeconds"])
+                if retrier.get("JitterStrategy") == "FULL":
+                    delay = random.uniform(0, delay)
+                time.sleep(delay * self.retry_time_scale)
+                context = dict(context, State=dict(context["State"], RetryCount=sum(retry_counts.values())))
+
+    # --- Map ---
+    def _read_items(self, state, data, context):
+        reader = state.get("ItemReader")
+        if not reader:
+            return get_path(data, state.get("ItemsPath", "$"))
+
+        params = resolve_parameters(reader["Parameters"], data, context)
+        body = self.s3.get_object(Bucket=params["Bucket"], Key=params["Key"])["Body"].read().decode("utf-8")
+        config = reader.get("ReaderConfig", {})
+        if config.get("InputType") == "JSONL":
+            items = [json.loads(line) for line in body.splitlines() if line.strip()]
+        else:
+            items = json.loads(body)
+            pointer = config.get("ItemsPointer")
+            if pointer:
+                for part in pointer.strip("/").split("/"):
+                    items = items[int(part)] if isinstance(items, list) else items[part]
+        if config.get("MaxItems"):
+            items = items[: config["MaxItems"]]
+        return items
+
+    def _run_map(self, name, state, data, context):
+        started = time.perf_counter()
+        items = self._read_items(state, data, context)
+        if not isinstance(items, list):
+            raise StatesError("States.Runtime", f"Map items at {name} are not a list")
+
+        selector = state.get("ItemSelector") or state.get("Parameters")
+        work = []
+        for index, item in enumerate(items):
+            item_context = dict(context, Map={"Item": {"Index": index, "Value": item}})
+            work.append(resolve_parameters(selector, data, item_context) if selector else item)
+
+        batcher = state.get("ItemBatcher")
+        if batcher:
+            size = batcher.get("MaxItemsPerBatch") or len(work) or 1
+            batch_input = batcher.get("BatchInput", {})
+            work = [dict(Items=work[i:i + size], BatchInput=batch_input) for i in range(0, len(work), size)]
+
+        processor = state.get("ItemProcessor") or state["Iterator"]
+        if "MaxConcurrencyPath" in state:
+            limit = int(get_path(data, state["MaxConcurrencyPath"])) or len(work) or 1
+        else:
+            limit = state.get("MaxConcurrency", 0) or len(work) or 1
+        distributed = processor.get("ProcessorConfig", {}).get("Mode") == "DISTRIBUTED"
+
+        def run_item(item):
+            try:
+                return True, self._run_states(processor, item, context)
+            except StatesError as e:
+                return False, e
+
+        with ThreadPoolExecutor(max_workers=min(limit, max(len(work), 1))) as pool:
+            outcomes = list(pool.map(run_item, work))
+
+        failures = [o for ok, o in outcomes if not ok]
+        results = [o if ok else {"Error": o.error, "Cause": o.cause} for ok, o in outcomes]
+
+        if failures:
+            tolerated = distributed and (
+                len(failures) <= state.get("ToleratedFailureCount", -1)
+                or 100.0 * len(failures) / len(work) <= state.get("ToleratedFailurePercentage", -1)
+            )
+            if not tolerated:
+                self._record(name, "Map", started, False, failures[0].error)
+                if distributed:
+                    raise StatesError("States.ExceedToleratedFailureThreshold",
+                                      f"{len(failures)} of {len(work)} items failed")
+                raise failures[0]
+
+        self._record(name, "Map", started, True)
+
+        writer = state.get("ResultWriter")
+        if writer:
+            params = resolve_parameters(writer["Parameters"], data, context)
+            key = f"{params.get('Prefix', '')}/{context['Execution']['Name']}/SUCCEEDED_0.json"
+            self.s3.put_object(Bucket=params["Bucket"], Key=key, Body=json.dumps(results, default=str))
+            return {"ResultWriterDetails": {"Bucket": params["Bucket"], "Key": key}}
+        return results
+
+
+# ============================================================
+# Loading the Lambdas with fakes
+# ============================================================
+
+class LocalPipeline:
+    """The four Lambdas wired to shared in-memory fakes."""
+
+    def __init__(self, time_scale=0.01, textract_kwargs=None, s3_latency=0.0, llm_latency=0.05, textract=None):
+        for key, value in LOCAL_ENV.items():
+            os.environ.setdefault(key, value)
+        for directory in reversed(list(LAMBDA_DIRS.values())):
+            path = os.path.join(ROOT, directory)
+            if path not in sys.path:
+                sys.path.insert(0, path)
+
+        import boto3
+        import pymongo
+        import local_fakes
+
+        self.fakes = local_fakes
+        local_fakes.FakeMongoClient.reset()
+        self.s3 = local_fakes.FakeS3(latency=s3_latency)
+        # textract: any object with the FakeTextract API (benchmarks/ replays recorded responses)
+        self.textract = textract or local_fakes.FakeTextract(self.s3, **(textract_kwargs or {}))
+        self.mongo = local_fakes.FakeMongoClient()
+        self.db = self.mongo[os.environ["MONGO_DATABASE"]]
+        local_fakes.FakeLLMAgent.latency = llm_latency
+
+        fake_boto3 = local_fakes.FakeBoto3(self.s3, self.textract)
+        clock = local_fakes.ScaledClock(time_scale)
+
+        # Module-level clients are created at import time, so patch before importing
+        boto3.client = fake_boto3.client
+        pymongo.MongoClient = local_fakes.FakeMongoClient
+        sys.modules["azure_llm_agent"] = local_fakes.fake_azure_module()
+
+        self.modules = {}
+        for key, directory in LAMBDA_DIRS.items():
+            self.modules[key] = self._load(f"{key}_lambda_function", os.path.join(ROOT, directory, "lambda_function.py"))
+        self.modules["settle"] = self._load("settle_credits", os.path.join(ROOT, LAMBDA_DIRS["structured"], "settle_credits.py"))
+        self.modules["schedule"] = self._load("schedule_files", os.path.join(ROOT, LAMBDA_DIRS["load"], "schedule_files.py"))
+        self.modules["precheck"] = self._load("precheck", os.path.join(ROOT, LAMBDA_DIRS["structured"], "precheck.py"))
+
+        # Scale the fixed polling/backoff sleeps inside the Lambdas
+        for module_name in ("extract_text", "mongo", "update_credits", "batch"):
+            module = sys.modules.get(module_name)
+            if module is not None and isinstance(getattr(module, "time", None), types.ModuleType):
+                module.time = clock
+
+    @staticmethod
+    def _load(alias, path):
+        if alias in sys.modules:
+            return sys.modules[alias]
+        spec = importlib.util.spec_from_file_location(alias, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[alias] = module
+        spec.loader.exec_module(module)
+        return module
+
+    def handlers(self, functions):
+        """Map configured function names to the local lambda_handlers."""
+        return {
+            functions[key]: module.lambda_handler
+            for key, module in self.modules.items()
+            if key in functions
+        }
+
+    # --- synthetic workload ---
+    def seed(self, page_counts, users=1, clusters_per_user=1, bucket="local-manifests", manifest_format="JSON"):
+        """Create users' files, credits, raw documents and a manifest; return the manifest s3Uri."""
+        from bson import ObjectId
+
+        tenants = [
+            (ObjectId(), ObjectId())
+            for _ in range(users)
+            for _ in range(clusters_per_user)
+        ]
+        entries = []
+        for index, pages in enumerate(page_counts):
+            user_oid, cluster_oid = tenants[index % len(tenants)]
+            file_oid, credit_oid = ObjectId(), ObjectId()
+            name = f"beo_{index:05d}.pdf"
+            self.db["tb_file_details"].insert_one({
+                "_id": file_oid, "userId": user_oid, "clusterId": cluster_oid,
+                "originalS3File": name, "processingStatus": "Processing", "status": "1",
+            })
+            self.db["tb_credits"].insert_one({"_id": credit_oid, "userId": user_oid, "type": "reserved", "credits": pages})
+            self.s3.put_object(
+                Bucket=os.environ["S3_BUCKET_NAME"],
+                Key=f"{user_oid}/{cluster_oid}/raw/{name}",
+                Body=self.fakes.synthetic_document(pages),
+            )
+            entries.append({
+                "fileId": str(file_oid), "userId": str(user_oid),
+                "clusterId": str(cluster_oid), "creditId": str(credit_oid),
+                "pageCount": pages,
+            })
+
+        key = f"manifests/{uuid4().hex}.{'jsonl' if manifest_format == 'JSONL' else 'json'}"
+        if manifest_format == "JSONL":
+            body = "\n".join(json.dumps(e) for e in entries)
+        else:
+            body = json.dumps({"files": entries})
+        self.s3.put_object(Bucket=bucket, Key=key, Body=body)
+        return f"s3://{bucket}/{key}"
+
+
+# ============================================================
+# Reporting
+# ============================================================
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(int(round(pct / 100.0 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def summarize(spans, wall_seconds, file_count):
+    by_state = {}
+    for span in spans:
+        by_state.setdefault(span["state"], []).append(span)
+
+    states = {}
+    for state, items in by_state.items():
+        seconds = [s["seconds"] for s in items]
+        states[state] = {
+            "count": len(items),
+            "errors": sum(1 for s in items if not s["ok"]),
+            "p50_ms": round(percentile(seconds, 50) * 1000, 2),
+            "p95_ms": round(percentile(seconds, 95) * 1000, 2),
+            "mean_ms": round(statistics.mean(seconds) * 1000, 2),
+        }
+
+    return {
+        "files": file_count,
+        "wall_seconds": round(wall_seconds, 3),
+        "files_per_second": round(file_count / wall_seconds, 2) if wall_seconds else 0.0,
+        "states": states,
+    }
+
+
+def format_summary(summary):
+    lines = [
+        f"files={summary['files']} wall={summary['wall_seconds']}s "
+        f"throughput={summary['files_per_second']} files/s",
+        f"{'state':<18} {'count':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9}",
+    ]
+    for state, s in summary["states"].items():
+        lines.append(f"{state:<18} {s['count']:>6} {s['errors']:>6} {s['p50_ms']:>9} {s['p95_ms']:>9} {s['mean_ms']:>9}")
+    if summary.get("precheck"):
+        p = summary["precheck"]
+        lines.append(f"precheck: checked={p.get('checked', 0)} skipped={p.get('skipped', 0)} "
+                     f"processed={p.get('processed', 0)} reasons={p.get('reasons', {})}")
+    if summary.get("textract_calls"):
+        t = summary["textract_calls"]
+        lines.append(f"textract: jobs={t['jobs']} start={t['start']} poll={t['poll']} page={t['page']} "
+                     f"retries={t['retries']} throttled={t['throttled']} wasted={t['wasted']}")
+    if summary.get("profileSamples") is not None:
+        lines.append(f"profile: {summary['profileSamples']} samples")
+    if summary.get("llm_usage"):
+        u = summary["llm_usage"]
+        lines.append(f"llm: calls={u['calls']} prompt={u['promptTokens']} completion={u['completionTokens']} "
+                     f"cached={u['cachedTokens']} tokens/page={u['tokensPerPage']}")
+    return "\n".join(lines)
+
+
+def run_local(config, page_counts, time_scale=0.01, pipeline=None, s3_uri=None, force_reprocess=False,
+              debug=False, profile=False, **seed_kwargs):
+    """
+    Build the definition from config, seed a workload and execute it; returns (output, summary).
+    Pass the s3_uri of an earlier run to submit the same manifest again.
+    """
+    from stepfunction_builder import build_definition
+
+    pipeline = pipeline or LocalPipeline(time_scale=time_scale)
+    definition = build_definition(config)
+    if s3_uri is None:
+        s3_uri = pipeline.seed(page_counts, manifest_format=config["map"]["manifest_format"], **seed_kwargs)
+
+    machine = LocalStateMachine(definition, pipeline.handlers(config["functions"]), s3=pipeline.s3,
+                                retry_time_scale=time_scale)
+    execution_input = {"s3Uri": s3_uri}
+    if config["map"].get("max_concurrency_path"):
+        execution_input["maxConcurrency"] = config["map"]["max_concurrency"]
+    if force_reprocess:
+        execution_input["forceReprocess"] = True
+    if debug:
+        execution_input["debug"] = True
+    if profile:
+        execution_input["profile"] = True
+    name = uuid4().hex
+    started = time.perf_counter()
+    output = machine.execute(execution_input, name=name)
+    summary = summarize(machine.spans, time.perf_counter() - started, len(page_counts))
+    summary["s3Uri"] = s3_uri
+    summary["precheck"] = pipeline.db["tb_run_stats"].find_one({"_id": machine.execution_id(name)}, {"_id": 0})
+    summary["llm_usage"] = llm_usage_totals(pipeline.db, machine.execution_id(name))
+    summary["textract_calls"] = textract_call_totals(pipeline.db)
+    return output, summary
+
+
+def textract_call_totals(db):
+    """Textract API calls recorded on tb_textract_jobs (see OCR_lambda1/textract_calls.py)."""
+    from textract_calls import wasted_calls
+
+    totals = {"jobs": 0, "start": 0, "poll": 0, "page": 0, "retries": 0, "throttled": 0, "wasted": 0}
+    for record in db["tb_textract_jobs"].find({"apiCalls": {"$exists": True}}, {"apiCalls": 1}):
+        totals["jobs"] += 1
+        for key in ("start", "poll", "page", "retries", "throttled"):
+            totals[key] += record["apiCalls"].get(key, 0)
+        totals["wasted"] += wasted_calls(record["apiCalls"])
+    return totals if totals["jobs"] else None
+
+
+def merge_profiles(s3, path, prefix="profiles/"):
+    """Sum the collapsed stacks the Lambdas wrote to fake S3 (see sampler.py) into one file."""
+    counts = {}
+    for (_, key), body in list(s3.objects.items()):
+        if not key.startswith(prefix):
+            continue
+        for line in body.decode("utf-8").splitlines():
+            stack, _, count = line.rpartition(" ")
+            counts[stack] = counts.get(stack, 0) + int(count)
+    with open(path, "w") as f:
+        for stack, count in sorted(counts.items(), key=lambda kv: kv[1], reverse=True):
+            f.write(f"{stack} {count}\n")
+    return sum(counts.values())
+
+
+def llm_usage_totals(db, execution_id):
+    """Token totals of the files this execution structured (tb_llm_usage; see llm_usage.py)."""
+    docs = db[os.getenv("LLM_USAGE", "tb_llm_usage")].find({"executionId": execution_id})
+    totals = {"calls": 0, "promptTokens": 0, "completionTokens": 0, "cachedTokens": 0, "pages": 0}
+    for doc in docs:
+        for key in totals:
+            totals[key] += doc.get(key) or 0
+    if not totals["calls"]:
+        return None
+    tokens = totals["promptTokens"] + totals["completionTokens"]
+    totals["tokensPerPage"] = round(tokens / totals["pages"], 1) if totals["pages"] else None
+    return totals
+
+
+def run_adaptive(config, page_counts, wave_size, controller=None, time_scale=0.01, pipeline=None, **seed_kwargs):
+    """
+    Run the workload in waves, letting concurrency_controller pick each
+    wave's MaxConcurrency from the previous wave's throttles and p95.
+    Returns (wave reports, summary).
+    """
+    from concurrency_controller import run_in_waves
+    from stepfunction_builder import build_definition, merge_config
+
+    config = merge_config(config, {"map": {"max_concurrency_path": "$.maxConcurrency"}})
+    pipeline = pipeline or LocalPipeline(time_scale=time_scale)
+    machine = LocalStateMachine(build_definition(config), pipeline.handlers(config["functions"]),
+                                s3=pipeline.s3, retry_time_scale=time_scale)
+
+    def run_wave(wave, concurrency):
+        s3_uri = pipeline.seed(wave, manifest_format=config["map"]["manifest_format"], **seed_kwargs)
+        name = uuid4().hex
+        machine.execute({"s3Uri": s3_uri, "maxConcurrency": concurrency}, name=name)
+        return machine.execution_id(name)
+
+    started = time.perf_counter()
+    reports = run_in_waves(pipeline.db, list(page_counts), wave_size, run_wave, controller)
+    summary = summarize(machine.spans, time.perf_counter() - started, len(page_counts))
+    return reports, summary
+
+
+if __name__ == "__main__":
+    from stepfunction_builder import ENVIRONMENTS, load_config, merge_config
+
+    parser = argparse.ArgumentParser(description="Run the BEO pipeline locally against in-memory fakes")
+    parser.add_argument("--env", choices=sorted(ENVIRONMENTS), default="prod")
+    parser.add_argument("--config", help="JSON file with config overrides")
+    parser.add_argument("--files", type=int, default=10)
+    parser.add_argument("--pages", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, help="Override Map MaxConcurrency")
+    parser.add_argument("--time-scale", type=float, default=0.01, help="Multiplier for sleeps inside the Lambdas")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON")
+    parser.add_argument("--quiet", action="store_true", help="Silence Lambda print() output")
+    parser.add_argument("--adaptive", action="store_true", help="Run in waves with concurrency_controller")
+    parser.add_argument("--wave-size", type=int, default=20)
+    parser.add_argument("--textract-throttle", type=float, default=0.0, help="Fraction of Textract calls throttled")
+    parser.add_argument("--llm-throttle", type=float, default=0.0, help="Fraction of LLM calls rate limited")
+    parser.add_argument("--textract-max-jobs", type=int, help="Concurrent Textract job limit")
+    parser.add_argument("--resubmit", action="store_true",
+                        help="Run the same manifest a second time (exercises PrecheckFile)")
+    parser.add_argument("--force", action="store_true", help="Set forceReprocess on the resubmitted run")
+    parser.add_argument("--debug", action="store_true", help="Set debug in the execution input (payload logs)")
+    parser.add_argument("--trace", metavar="FILE", help="Append tracing spans to FILE (see trace_report.py)")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="Sample every file (profile flag) and write the merged collapsed stacks to FILE")
+    args = parser.parse_args()
+
+    config = load_config(args.env, args.config)
+    if args.concurrency:
+        config = merge_config(config, {"map": {"max_concurrency": args.concurrency}})
+
+    # tracing.py reads TRACE_FILE when the Lambdas are imported
+    if args.trace:
+        os.environ["TRACE_FILE"] = args.trace
+
+    stdout = sys.stdout
+    if args.quiet:
+        sys.stdout = open(os.devnull, "w")
+    try:
+        pipeline = LocalPipeline(time_scale=args.time_scale, textract_kwargs={
+            "throttle_rate": args.textract_throttle,
+            "max_active_jobs": args.textract_max_jobs,
+        })
+        pipeline.fakes.FakeLLMAgent.throttle_rate = args.llm_throttle
+        page_counts = [args.pages] * args.files
+        if args.adaptive:
+            reports, summary = run_adaptive(config, page_counts, args.wave_size, pipeline=pipeline)
+        else:
+            reports, (_, summary) = None, run_local(config, page_counts, pipeline=pipeline, debug=args.debug,
+                                                           profile=bool(args.profile))
+            if args.resubmit:
+                _, summary = run_local(config, page_counts, pipeline=pipeline, s3_uri=summary["s3Uri"],
+                                       force_reprocess=args.force)
+    finally:
+        sys.stdout = stdout
+
+    if args.profile:
+        summary["profileSamples"] = merge_profiles(pipeline.s3, args.profile)
+
+    if args.json:
+        print(json.dumps({"summary": summary, "waves": reports}, indent=2, default=str))
+    else:
+        print(format_summary(summary))
+        for report in reports or []:
+            print(f"wave {report['wave']}: concurrency={report['concurrency']} → {report['nextConcurrency']} "
+                  f"throttles={report['throttles']} p95={report['p95Ms']} ({report['reason']})")
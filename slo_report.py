@@ -0,0 +1,187 @@
+"""
+SLO report per day and tenant, from job_status and tb_textract_jobs.
+
+One aggregation over job_status (files whose structured stage completed
+in the window) joins each file's tb_textract_jobs record by _id and
+computes, per file:
+
+    queueWaitMs   upload (the fileId's ObjectId time) → first Textract claim (createdAt)
+    ocrMs         first claim → Textract job SUCCEEDED (succeededAt), retries included
+    llmMs         structured stage startedAt → completedAt (last attempt)
+    endToEndMs    upload → structured stage completed
+
+and groups them by day (of completion, in --timezone) and tenant into
+p50/p95/p99, file and page counts, mean Textract attempts and the share
+of files within the end-to-end SLO. Percentiles use $percentile
+(MongoDB 7.0+) and fall back to computing them here from $push-ed values
+on older servers.
+
+    python slo_report.py --create-indexes
+    python slo_report.py --days 7
+    python slo_report.py --since 2026-10-01 --until 2026-10-08 --tenant clusterId --format csv --out slo.csv
+    python slo_report.py --days 30 --all-tenants --slo-ms 300000
+
+The export is compact: one row per day and tenant, flat columns with --format csv.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+from concurrency_controller import JOB_STATUS_COLLECTION, percentile
+
+TEXTRACT_JOBS_COLLECTION = "tb_textract_jobs"
+METRICS = ("queueWaitMs", "ocrMs", "llmMs", "endToEndMs")
+PERCENTILES = (50, 95, 99)
+SLO_END_TO_END_MS = float(os.getenv("SLO_END_TO_END_MS", "600000"))
+
+COMPLETED_AT = "$stages.structured.completedAt"
+
+
+def ensure_indexes(db):
+    """
+    Index for the report's $match (the $lookup joins tb_textract_jobs on its
+    _id), and the unique job_id index the Lambdas' job_status upserts use.
+    """
+    db[JOB_STATUS_COLLECTION].create_index([("stages.structured.completedAt", 1), ("userId", 1)])
+    db[JOB_STATUS_COLLECTION].create_index([("job_id", 1)], unique=True)
+
+
+def _file_metrics_stages(since, until, tz):
+    """$match/$lookup/$project producing one document of metrics per file."""
+    upload = {"$toDate": "$fileOid"}
+    first_claim = {"$ifNull": ["$textract.createdAt", "$stages.ocr.startedAt"]}
+    return [
+        {"$match": {"stages.structured.completedAt": {"$gte": since, "$lt": until}}},
+        {"$addFields": {"fileOid": {"$convert": {"input": "$job_id", "to": "objectId", "onError": None}}}},
+        {"$lookup": {
+            "from": TEXTRACT_JOBS_COLLECTION,
+            "localField": "fileOid",
+            "foreignField": "_id",
+            # Only the timestamps: the record also holds the whole Textract result
+            "pipeline": [{"$project": {"createdAt": 1, "succeededAt": 1, "attempts": 1, "page_count": 1}}],
+            "as": "textract",
+        }},
+        {"$unwind": {"path": "$textract", "preserveNullAndEmptyArrays": True}},
+        {"$project": {
+            "day": {"$dateToString": {"format": "%Y-%m-%d", "date": COMPLETED_AT, "timezone": tz}},
+            "userId": 1,
+            "clusterId": 1,
+            "pages": {"$ifNull": ["$textract.page_count", 0]},
+            "attempts": "$textract.attempts",
+            "queueWaitMs": {"$subtract": [first_claim, upload]},
+            # Records written before succeededAt existed have no ocrMs
+            "ocrMs": {"$subtract": ["$textract.succeededAt", "$textract.createdAt"]},
+            "llmMs": {"$subtract": [COMPLETED_AT, "$stages.structured.startedAt"]},
+            "endToEndMs": {"$subtract": [COMPLETED_AT, upload]},
+        }},
+    ]
+
+
+def _group_stage(keys, slo_ms, server_percentiles):
+    group = {
+        "_id": {key: f"${key}" for key in keys},
+        "files": {"$sum": 1},
+        "pages": {"$sum": "$pages"},
+        "ocrAttempts": {"$avg": "$attempts"},
+        # null sorts below numbers, so check the metric exists before comparing
+        "withinSlo": {"$avg": {"$cond": [
+            {"$and": [{"$isNumber": "$endToEndMs"}, {"$lte": ["$endToEndMs", slo_ms]}]}, 1, 0]}},
+    }
+    for metric in METRICS:
+        if server_percentiles:
+            group[metric] = {"$percentile": {"input": f"${metric}", "p": [p / 100 for p in PERCENTILES],
+                                             "method": "approximate"}}
+        else:
+            group[metric] = {"$push": f"${metric}"}
+    return {"$group": group}
+
+
+def _row(group, server_percentiles):
+    row = dict(group.pop("_id"))
+    row.update(files=group["files"], pages=group["pages"],
+               ocrAttempts=round(group["ocrAttempts"], 2) if group.get("ocrAttempts") is not None else None,
+               withinSlo=round(group["withinSlo"], 4))
+    for metric in METRICS:
+        if server_percentiles:
+            values = group[metric]
+        else:
+            present = [v for v in group[metric] if isinstance(v, (int, float))]
+            values = [percentile(present, p) if present else None for p in PERCENTILES]
+        row[metric] = {f"p{p}": round(v) if v is not None else None for p, v in zip(PERCENTILES, values)}
+    return row
+
+
+def slo_report(db, since, until, tenant="userId", all_tenants=False, slo_ms=SLO_END_TO_END_MS, tz="UTC"):
+    """One row per day (and tenant unless all_tenants), sorted by day then tenant."""
+    from pymongo.errors import OperationFailure
+
+    keys = ["day"] if all_tenants else ["day", tenant]
+    stages = _file_metrics_stages(since, until, tz)
+    sort = {"$sort": {f"_id.{key}": 1 for key in keys}}
+    col = db[JOB_STATUS_COLLECTION]
+    try:
+        groups = list(col.aggregate(stages + [_group_stage(keys, slo_ms, True), sort], allowDiskUse=True))
+        server_percentiles = True
+    except OperationFailure:
+        # $percentile needs MongoDB 7.0
+        groups = list(col.aggregate(stages + [_group_stage(keys, slo_ms, False), sort], allowDiskUse=True))
+        server_percentiles = False
+
+    return {
+        "since": since,
+        "until": until,
+        "timezone": tz,
+        "sloEndToEndMs": slo_ms,
+        "rows": [_row(g, server_percentiles) for g in groups],
+    }
+
+
+def to_csv(report):
+    """Flat columns: day, tenant, files, pages, ocrAttempts, withinSlo, <metric>_p50 ..."""
+    out = io.StringIO()
+    writer = None
+    for row in report["rows"]:
+        flat = {k: v for k, v in row.items() if k not in METRICS}
+        for metric in METRICS:
+            for name, value in row[metric].items():
+                flat[f"{metric}_{name}"] = value
+        if writer is None:
+            writer = csv.DictWriter(out, fieldnames=list(flat))
+            writer.writeheader()
+        writer.writerow(flat)
+    return out.getvalue()
+
+
+if __name__ == "__main__":
+    from pymongo import MongoClient
+
+    parser = argparse.ArgumentParser(description="SLO percentiles per day and tenant")
+    parser.add_argument("--since", help="ISO date (default: --days ago)")
+    parser.add_argument("--until", help="ISO date, exclusive (default: now)")
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--tenant", choices=["userId", "clusterId"], default="userId")
+    parser.add_argument("--all-tenants", action="store_true", help="One row per day across tenants")
+    parser.add_argument("--slo-ms", type=float, default=SLO_END_TO_END_MS, help="End-to-end latency target")
+    parser.add_argument("--timezone", default="UTC", help="Day boundaries, e.g. Asia/Kolkata")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--out", help="Write the export to a file instead of stdout")
+    parser.add_argument("--create-indexes", action="store_true")
+    args = parser.parse_args()
+
+    db = MongoClient(os.getenv("PROD_MONGO_URI"))[os.getenv("MONGO_DATABASE", "yc-invoice")]
+    if args.create_indexes:
+        ensure_indexes(db)
+
+    until = datetime.fromisoformat(args.until) if args.until else datetime.now(timezone.utc)
+    since = datetime.fromisoformat(args.since) if args.since else until - timedelta(days=args.days)
+    report = slo_report(db, since, until, args.tenant, args.all_tenants, args.slo_ms, args.timezone)
+    text = to_csv(report) if args.format == "csv" else json.dumps(report, indent=2, default=str)
+
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(text)
+    else:
+        print(text)
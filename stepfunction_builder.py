@@ -0,0 +1,797 @@
+import argparse
+import json
+import copy
+
+# ============================================================
+# Configuration
+# ============================================================
+#
+# Every deployable knob lives in DEFAULT_CONFIG; ENVIRONMENTS holds the
+# per-environment overrides and --config FILE adds ad-hoc ones on top.
+# stepfunctionjson.py renders the deployed definition from this module.
+
+LAMBDA_SERVICE_ERRORS = [
+    "Lambda.ServiceException",
+    "Lambda.AWSLambdaException",
+    "Lambda.SdkClientException",
+    "Lambda.TooManyRequestsException",
+]
+
+DEFAULT_CONFIG = {
+    "region": "ap-south-1",
+    "account_id": "640168441407",
+    "functions": {
+        "load": "YC_beo_sfn_s3_file_read",
+        "ocr": "ycbeoocrlambda1",
+        "structured": "yc_beo_lambda2_structured",
+        "fail": "yc_beo_fail_lambda",
+        "settle": "yc_beo_settle_credits",
+        "schedule": "yc_beo_schedule_files",
+        "precheck": "yc_beo_precheck",
+    },
+    "map": {
+        "mode": "INLINE",                 # INLINE | DISTRIBUTED
+        "max_concurrency": 5,
+        # e.g. "$.maxConcurrency": read the limit from the execution input
+        # (set by concurrency_controller.py) instead of hard-coding it
+        "max_concurrency_path": None,
+        # DISTRIBUTED only
+        "manifest_format": "JSON",        # JSON | JSONL
+        "items_pointer": "/files",
+        "max_items_per_batch": None,
+        "tolerated_failure_percentage": None,
+        "tolerated_failure_count": None,
+        "execution_type": "STANDARD",     # STANDARD | EXPRESS
+        "result_bucket": None,
+        "result_prefix": "beo-map-results",
+    },
+    # Retry policies are tried in order. "RetryableError" is raised by the
+    # Lambdas for throttling/timeouts (see errors.py); FULL jitter spreads the
+    # retries of a throttled batch instead of retrying them in lockstep.
+    "tasks": {
+        "load": {
+            "timeout_seconds": 60,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+        "schedule": {
+            "timeout_seconds": 120,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+        "precheck": {
+            "timeout_seconds": 60,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": ["RetryableError"], "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 20, "jitter": "FULL"},
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+        "ocr": {
+            "timeout_seconds": 900,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": ["RetryableError"], "interval_seconds": 10, "max_attempts": 4, "backoff_rate": 2.0,
+                 "max_delay_seconds": 120, "jitter": "FULL"},
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+        "structured": {
+            "timeout_seconds": 600,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": ["RetryableError"], "interval_seconds": 15, "max_attempts": 4, "backoff_rate": 2.0,
+                 "max_delay_seconds": 180, "jitter": "FULL"},
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+        "fail": {
+            "timeout_seconds": 60,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+        "settle": {
+            "timeout_seconds": 300,
+            "heartbeat_seconds": None,
+            "retry": [
+                {"error_equals": ["RetryableError"], "interval_seconds": 5, "max_attempts": 5, "backoff_rate": 2.0,
+                 "max_delay_seconds": 60, "jitter": "FULL"},
+                {"error_equals": LAMBDA_SERVICE_ERRORS, "interval_seconds": 2, "max_attempts": 3, "backoff_rate": 2.0,
+                 "max_delay_seconds": 30, "jitter": "FULL"},
+            ],
+        },
+    },
+    # Where per-file task failures are routed
+    "catch": {
+        "error_equals": ["States.ALL"],
+        "result_path": "$.error",
+        "next": "FailLambda",
+    },
+    # "immediate": each file settles its own credit; "deferred": SettleCredits bulk-writes at the end
+    "settlement": {"mode": "immediate"},
+    # ScheduleFiles orders the manifest by priority, per-tenant fair share and
+    # page estimate before the Map (BEO_S3_File_read/schedule_files.py).
+    # Off by default: an environment opts in once yc_beo_schedule_files is deployed
+    "scheduling": {
+        "enabled": False,
+        "tenant_weights": None,           # {"<userId>": 2.0} gives a user a larger share
+    },
+    # ScheduleFiles groups files of up to small_file_pages pages into one Map
+    # item, processed by a single OCR/structured invocation (batch.py); larger
+    # files still get an item each. Needs scheduling.
+    "batching": {
+        "enabled": False,
+        "small_file_pages": 2,
+        "max_files": 10,
+        "max_pages": 10,
+    },
+    # PrecheckFile skips files that are already Completed with the same
+    # content (beofinallambda2/precheck.py); a failing precheck never blocks a file.
+    # Off by default: an environment opts in once yc_beo_precheck is deployed
+    "precheck": {"enabled": False},
+}
+
+ENVIRONMENTS = {
+    "dev": {
+        "map": {"max_concurrency": 2},
+    },
+    "prod": {},
+    "prod-distributed": {
+        "map": {
+            "mode": "DISTRIBUTED",
+            "max_concurrency": 40,
+            "tolerated_failure_percentage": 5,
+        },
+        "settlement": {"mode": "deferred"},
+    },
+    "prod-scheduled": {
+        "scheduling": {"enabled": True},
+        "precheck": {"enabled": True},
+    },
+    "prod-batched": {
+        "scheduling": {"enabled": True},
+        "batching": {"enabled": True},
+        "precheck": {"enabled": True},
+    },
+    "prod-adaptive": {
+        "map": {
+            "mode": "DISTRIBUTED",
+            "max_concurrency_path": "$.maxConcurrency",
+            "tolerated_failure_percentage": 5,
+        },
+        "settlement": {"mode": "deferred"},
+    },
+}
+
+
+def merge_config(base, overrides):
+    """Deep-merge overrides into a copy of base (lists are replaced, not merged)."""
+    merged = copy.deepcopy(base)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = merge_config(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_config(env=None, path=None):
+    """DEFAULT_CONFIG + ENVIRONMENTS[env] + the JSON file at path."""
+    config = DEFAULT_CONFIG
+    if env:
+        if env not in ENVIRONMENTS:
+            raise ValueError(f"Unknown environment: {env}")
+        config = merge_config(config, ENVIRONMENTS[env])
+    if path:
+        with open(path) as f:
+            config = merge_config(config, json.load(f))
+    return config
+
+
+# ============================================================
+# State builders
+# ============================================================
+
+def lambda_arn(config, function_key):
+    name = config["functions"][function_key]
+    return f"arn:aws:lambda:{config['region']}:{config['account_id']}:function:{name}"
+
+
+def build_retry(policies):
+    """Translate retry policies from config into ASL Retriers."""
+    retriers = []
+    for policy in policies or []:
+        retrier = {
+            "ErrorEquals": list(policy["error_equals"]),
+            "IntervalSeconds": policy.get("interval_seconds", 1),
+            "MaxAttempts": policy.get("max_attempts", 3),
+            "BackoffRate": policy.get("backoff_rate", 2.0),
+        }
+        if policy.get("max_delay_seconds") is not None:
+            retrier["MaxDelaySeconds"] = policy["max_delay_seconds"]
+        if policy.get("jitter"):
+            retrier["JitterStrategy"] = policy["jitter"]
+        retriers.append(retrier)
+    return retriers
+
+
+def retryable_attempts(config, function_key):
+    """MaxAttempts of the task's RetryableError policy (0 when it has none)."""
+    for policy in config["tasks"][function_key].get("retry") or []:
+        if "RetryableError" in policy["error_equals"]:
+            return policy.get("max_attempts", 3)
+    return 0
+
+
+def build_task(config, function_key, parameters, **fields):
+    """
+    A Lambda Task with the timeout/heartbeat/retry settings for function_key.
+    Tasks that retry RetryableError also receive retryCount/maxRetries, so the
+    Lambda knows whether a transient failure will be retried or is final.
+    """
+    settings = config["tasks"][function_key]
+    max_retries = retryable_attempts(config, function_key)
+    if max_retries:
+        parameters = dict(parameters, **{"retryCount.$": "$$.State.RetryCount", "maxRetries": max_retries})
+    task = {
+        "Type": "Task",
+        "Resource": lambda_arn(config, function_key),
+        "Parameters": parameters,
+    }
+    task.update(fields)
+    if settings.get("timeout_seconds"):
+        task["TimeoutSeconds"] = settings["timeout_seconds"]
+    if settings.get("heartbeat_seconds"):
+        task["HeartbeatSeconds"] = settings["heartbeat_seconds"]
+    retry = build_retry(settings.get("retry"))
+    if retry:
+        task["Retry"] = retry
+    return task
+
+
+def build_catch(config):
+    catch = config["catch"]
+    return [
+        {
+            "ErrorEquals": list(catch["error_equals"]),
+            "ResultPath": catch["result_path"],
+            "Next": catch["next"],
+        }
+    ]
+
+
+def build_result_states(config):
+    """
+    Pass states that end every file's iteration with a trimmed output.
+
+    The Map collects each iteration's final state into $.results, and it is
+    subject to the 256 KB payload limit (States.DataLimitExceeded fails the
+    run and cannot be caught). So only what SettleCredits reads is kept:
+    fileId, creditId, error, precheck and settlement, plus the OCR page
+    count and text_ref (the S3 pointer, null for inline text), and never
+    the OCR text or the structured summary.
+    """
+    batched = config["batching"]["enabled"]
+    precheck = config["precheck"]["enabled"]
+
+    if batched:
+        ids = {"batchId.$": "$.batchId"}
+        succeeded = dict(ids, **{"settlements.$": "$.secondLambdaResult.files[*].settlement"})
+        # Every file of a failed batch is rolled back (those the precheck let through)
+        failed = dict(ids, **{"files.$": "$.files", "error.$": "$.error"})
+    else:
+        ids = {"fileId.$": "$.fileId", "creditId.$": "$.creditId"}
+        succeeded = dict(ids, **{
+            "pages.$": "$.firstLambdaResult.pages",
+            "text_ref.$": "$.firstLambdaResult.text_ref",
+            "settlement.$": "$.secondLambdaResult.settlement",
+        })
+        failed = dict(ids, **{"error.$": "$.error"})
+    skipped = dict(ids)
+
+    if precheck:
+        for parameters in (succeeded, failed, skipped):
+            parameters["precheck.$"] = "$.precheck"
+
+    states = {
+        "FileResult": {"Type": "Pass", "Parameters": succeeded, "End": True},
+        "FailedFileResult": {"Type": "Pass", "Parameters": failed, "End": True},
+    }
+    if precheck:
+        states["SkipFile"] = {"Type": "Pass", "Parameters": skipped, "End": True}
+    return states
+
+
+def build_file_states(config):
+    """
+    RunFirstLambda → RunSecondLambda, both caught into FailLambda; each path
+    ends in a Pass state that trims the iteration output (build_result_states).
+    With batching, each task gets the batch's files and returns one result per file.
+    """
+    deferred = config["settlement"]["mode"] == "deferred"
+    batched = config["batching"]["enabled"]
+    precheck = config["precheck"]["enabled"]
+
+    if batched:
+        precheck_params = {
+            "batchId.$": "$.batchId",
+            "files.$": "$.files",
+            "attempt.$": "$$.Execution.RedriveCount",
+            "executionId.$": "$.executionId",
+        }
+        # Files the precheck did not skip; passed through unchanged if it failed
+        precheck_fallback = {"skip": False, "reason": "precheck-failed", "files.$": "$.files"}
+        first_params = {
+            "batchId.$": "$.batchId",
+            "files.$": "$.precheck.files" if precheck else "$.files",
+            "executionId.$": "$.executionId",
+        }
+        second_params = {
+            "batchId.$": "$.batchId",
+            "files.$": "$.firstLambdaResult.files",
+            "attempt.$": "$$.Execution.RedriveCount",
+            "executionId.$": "$.executionId",
+        }
+        fail_params = {"status": "failed", "error.$": "$.error", "files.$": "$.files",
+                       "executionId.$": "$.executionId"}
+    else:
+        precheck_params = {
+            "clusterId.$": "$.clusterId",
+            "userId.$": "$.userId",
+            "fileId.$": "$.fileId",
+            "creditId.$": "$.creditId",
+            "originalS3File.$": "$.originalS3File",
+            "forceReprocess.$": "$.forceReprocess",
+            "debug.$": "$.debug",
+            "profile.$": "$.profile",
+            "attempt.$": "$$.Execution.RedriveCount",
+            "executionId.$": "$.executionId",
+        }
+        precheck_fallback = {"skip": False, "reason": "precheck-failed", "sourceETag": None}
+        first_params = {
+            "clusterId.$": "$.clusterId",
+            "userId.$": "$.userId",
+            "fileId.$": "$.fileId",
+            "creditId.$": "$.creditId",
+            "originalS3File.$": "$.originalS3File",
+            "debug.$": "$.debug",
+            "profile.$": "$.profile",
+            "executionId.$": "$.executionId",
+        }
+        if precheck:
+            first_params["sourceETag.$"] = "$.precheck.sourceETag"
+        second_params = {
+            "clusterId.$": "$.clusterId",
+            "userId.$": "$.userId",
+            "fileId.$": "$.fileId",
+            "creditId.$": "$.creditId",
+            "attempt.$": "$$.Execution.RedriveCount",
+            "pages.$": "$.firstLambdaResult.pages",
+            "text_content.$": "$.firstLambdaResult.text_content",
+            "text_ref.$": "$.firstLambdaResult.text_ref",
+            "sourceETag.$": "$.firstLambdaResult.sourceETag",
+            "debug.$": "$.debug",
+            "profile.$": "$.profile",
+            "executionId.$": "$.executionId",
+        }
+        fail_params = {
+            "status": "failed",
+            "error.$": "$.error",
+            "clusterId.$": "$.clusterId",
+            "userId.$": "$.userId",
+            "fileId.$": "$.fileId",
+            "creditId.$": "$.creditId",
+            "executionId.$": "$.executionId",
+        }
+    if deferred:
+        second_params["settlementMode"] = "deferred"
+        precheck_params["settlementMode"] = "deferred"
+
+    states = {}
+    if precheck:
+        states.update({
+            "PrecheckFile": build_task(
+                config, "precheck",
+                precheck_params,
+                ResultPath="$.precheck",
+                Catch=[{"ErrorEquals": ["States.ALL"], "ResultPath": "$.precheckError", "Next": "PrecheckFailed"}],
+                Next="IsAlreadyProcessed",
+            ),
+            "PrecheckFailed": {
+                "Type": "Pass",
+                "Parameters": precheck_fallback,
+                "ResultPath": "$.precheck",
+                "Next": "RunFirstLambda",
+            },
+            "IsAlreadyProcessed": {
+                "Type": "Choice",
+                "Choices": [{"Variable": "$.precheck.skip", "BooleanEquals": True, "Next": "SkipFile"}],
+                "Default": "RunFirstLambda",
+            },
+        })
+
+    first_fields = {}
+    if not batched:
+        # Only what RunSecondLambda reads; the IDs are already in the item
+        first_fields["ResultSelector"] = {
+            "pages.$": "$.pages",
+            "text_content.$": "$.text_content",
+            "text_ref.$": "$.text_ref",
+            "sourceETag.$": "$.sourceETag",
+        }
+
+    states.update({
+        "RunFirstLambda": build_task(
+            config, "ocr",
+            first_params,
+            ResultPath="$.firstLambdaResult",
+            **first_fields,
+            Catch=build_catch(config),
+            Next="RunSecondLambda",
+        ),
+        "RunSecondLambda": build_task(
+            config, "structured",
+            second_params,
+            ResultPath="$.secondLambdaResult",
+            Catch=build_catch(config),
+            Next="FileResult",
+        ),
+        # Keep fileId/creditId/error in the item so SettleCredits can roll it back
+        "FailLambda": build_task(
+            config, "fail",
+            fail_params,
+            ResultPath="$.failLambdaResult",
+            Next="FailedFileResult",
+        ),
+    })
+    states.update(build_result_states(config))
+    return states
+
+
+def file_start(config):
+    return "PrecheckFile" if config["precheck"]["enabled"] else "RunFirstLambda"
+
+
+def build_item_selector(config):
+    """
+    Per-file Map input. Adds the parent execution's Id, which distributed
+    child executions cannot see otherwise; the Lambdas tag their job_status
+    invocations with it (see concurrency_controller.py). originalS3File,
+    debug and profile are set (or null) on every entry by the loader. With batching the
+    item is a whole batch and the files are passed through as they are.
+    """
+    if config["batching"]["enabled"]:
+        return {
+            "batchId.$": "$$.Map.Item.Value.batchId",
+            "files.$": "$$.Map.Item.Value.files",
+            "executionId.$": "$$.Execution.Id",
+        }
+    selector = {
+        "fileId.$": "$$.Map.Item.Value.fileId",
+        "userId.$": "$$.Map.Item.Value.userId",
+        "clusterId.$": "$$.Map.Item.Value.clusterId",
+        "creditId.$": "$$.Map.Item.Value.creditId",
+        "originalS3File.$": "$$.Map.Item.Value.originalS3File",
+        "debug.$": "$$.Map.Item.Value.debug",
+        "profile.$": "$$.Map.Item.Value.profile",
+        "executionId.$": "$$.Execution.Id",
+    }
+    if config["precheck"]["enabled"]:
+        selector["forceReprocess.$"] = "$$.Map.Item.Value.forceReprocess"
+    return selector
+
+
+def build_concurrency(config):
+    """MaxConcurrency, or MaxConcurrencyPath when the limit comes from the execution input."""
+    if config["map"].get("max_concurrency_path"):
+        return {"MaxConcurrencyPath": config["map"]["max_concurrency_path"]}
+    return {"MaxConcurrency": config["map"]["max_concurrency"]}
+
+
+def build_inline_map(config):
+    """INLINE Map: the loader returns every file into the state payload."""
+    return {
+        "Type": "Map",
+        "ItemsPath": "$.fileData.batches" if config["batching"]["enabled"] else "$.fileData.files",
+        **build_concurrency(config),
+        "ItemSelector": build_item_selector(config),
+        "ResultPath": "$.results",
+        "ItemProcessor": {
+            "ProcessorConfig": {"Mode": "INLINE"},
+            "StartAt": file_start(config),
+            "States": build_file_states(config),
+        },
+    }
+
+
+def build_distributed_map(config):
+    """
+    DISTRIBUTED Map that reads items with an S3 ItemReader, so the manifest
+    never passes through the 256 KB state payload.
+
+    - manifest_format: "JSON" (object with an array at items_pointer) or "JSONL".
+    - max_items_per_batch: child executions receive {"Items": [...]} and run an
+      INLINE Map over them (fewer child executions for small files).
+    - tolerated_failure_*: let the run succeed while failures stay under the threshold.
+    - result_bucket: write Map results to S3 instead of the state output.
+    """
+    map_cfg = config["map"]
+    if map_cfg["manifest_format"] not in ("JSON", "JSONL"):
+        raise ValueError(f"Unsupported manifest format: {map_cfg['manifest_format']}")
+
+    reader_config = {"InputType": map_cfg["manifest_format"]}
+    if map_cfg["manifest_format"] == "JSON" and config["batching"]["enabled"]:
+        reader_config["ItemsPointer"] = "/batches"  # written by ScheduleFiles
+    elif map_cfg["manifest_format"] == "JSON" and map_cfg.get("items_pointer"):
+        reader_config["ItemsPointer"] = map_cfg["items_pointer"]
+
+    file_processor = {
+        "StartAt": file_start(config),
+        "States": build_file_states(config),
+    }
+
+    if map_cfg.get("max_items_per_batch"):
+        # Each child execution fans a batch out to the per-file states
+        child = {
+            "StartAt": "ProcessBatch",
+            "States": {
+                "ProcessBatch": {
+                    "Type": "Map",
+                    "ItemsPath": "$.Items",
+                    "ItemProcessor": dict(file_processor, ProcessorConfig={"Mode": "INLINE"}),
+                    "End": True,
+                }
+            },
+        }
+    else:
+        child = file_processor
+
+    process_files = {
+        "Type": "Map",
+        "ItemReader": {
+            "Resource": "arn:aws:states:::s3:getObject",
+            "ReaderConfig": reader_config,
+            "Parameters": {
+                "Bucket.$": "$.fileData.bucket",
+                "Key.$": "$.fileData.key",
+            },
+        },
+        **build_concurrency(config),
+        "ItemSelector": build_item_selector(config),
+        "ItemProcessor": dict(
+            child,
+            ProcessorConfig={"Mode": "DISTRIBUTED", "ExecutionType": map_cfg["execution_type"]},
+        ),
+    }
+
+    if map_cfg.get("max_items_per_batch"):
+        process_files["ItemBatcher"] = {"MaxItemsPerBatch": map_cfg["max_items_per_batch"]}
+    if map_cfg.get("tolerated_failure_percentage") is not None:
+        process_files["ToleratedFailurePercentage"] = map_cfg["tolerated_failure_percentage"]
+    if map_cfg.get("tolerated_failure_count") is not None:
+        process_files["ToleratedFailureCount"] = map_cfg["tolerated_failure_count"]
+    if map_cfg.get("result_bucket"):
+        process_files["ResultWriter"] = {
+            "Resource": "arn:aws:states:::s3:putObject",
+            "Parameters": {"Bucket": map_cfg["result_bucket"], "Prefix": map_cfg["result_prefix"]},
+        }
+    else:
+        process_files["ResultPath"] = "$.results"
+
+    return process_files
+
+
+def build_definition(config=None):
+    """Render the full state machine definition from config and validate it."""
+    config = config or DEFAULT_CONFIG
+    distributed = config["map"]["mode"] == "DISTRIBUTED"
+    deferred = config["settlement"]["mode"] == "deferred"
+
+    # The loader reads run-wide options (forceReprocess, debug, profile) from the execution input
+    load_params = {"s3Uri.$": "$.s3Uri", "executionInput.$": "$$.Execution.Input",
+                   "executionId.$": "$$.Execution.Id"}
+    if distributed:
+        # Distributed Map reads the manifest itself; the loader only validates it
+        load_params["validateOnly"] = True
+
+    scheduling = config["scheduling"]["enabled"]
+    batching = config["batching"]
+    if batching["enabled"] and not scheduling:
+        raise ValueError("Batching needs scheduling (ScheduleFiles builds the batches)")
+    if batching["enabled"] and distributed and config["map"].get("max_items_per_batch"):
+        raise ValueError("Use either batching or map.max_items_per_batch, not both")
+
+    process_files = build_distributed_map(config) if distributed else build_inline_map(config)
+
+    states = {
+        "LoadFilesFromS3": build_task(
+            config, "load", load_params,
+            ResultPath="$.fileData",
+            Next="ScheduleFiles" if scheduling else "ProcessFiles",
+        ),
+    }
+
+    if scheduling:
+        if distributed:
+            # Writes the reordered manifest to S3; fileData then points the ItemReader at it
+            schedule_params = {"bucket.$": "$.fileData.bucket", "key.$": "$.fileData.key"}
+        else:
+            schedule_params = {"files.$": "$.fileData.files"}
+        if config["scheduling"].get("tenant_weights"):
+            schedule_params["tenantWeights"] = config["scheduling"]["tenant_weights"]
+        if batching["enabled"]:
+            schedule_params["batching"] = {
+                "smallFilePages": batching["small_file_pages"],
+                "maxFiles": batching["max_files"],
+                "maxPages": batching["max_pages"],
+            }
+        states["ScheduleFiles"] = build_task(
+            config, "schedule", schedule_params,
+            ResultPath="$.fileData",
+            Next="ProcessFiles",
+        )
+
+    states["ProcessFiles"] = process_files
+
+    if deferred:
+        # The trimmed iteration outputs (build_result_states) are what SettleCredits settles
+        if process_files.get("ResultWriter"):
+            raise ValueError("Deferred settlement needs Map results in the state output (no result_bucket)")
+        process_files["Next"] = "SettleCredits"
+        states["SettleCredits"] = build_task(
+            config, "settle", {"results.$": "$.results", "attempt.$": "$$.Execution.RedriveCount"},
+            ResultPath="$.settlement",
+            End=True,
+        )
+    else:
+        process_files["End"] = True
+
+    definition = {
+        "Comment": "Step Function to process multiple files using 2 lambdas with central fail handler",
+        "StartAt": "LoadFilesFromS3",
+        "States": states,
+    }
+
+    errors = validate_definition(definition)
+    if errors:
+        raise ValueError("Invalid state machine definition:\n- " + "\n- ".join(errors))
+    return definition
+
+
+# ============================================================
+# Validation
+# ============================================================
+
+def _validate_states(scope, states, start_at, errors):
+    if start_at not in states:
+        errors.append(f"{scope}: StartAt '{start_at}' is not a state")
+
+    for name, state in states.items():
+        where = f"{scope}.{name}"
+        state_type = state.get("Type")
+
+        if state_type not in ("Succeed", "Fail", "Choice") and not state.get("End") and not state.get("Next"):
+            errors.append(f"{where}: needs Next or End")
+        if state.get("Next") and state["Next"] not in states:
+            errors.append(f"{where}: Next '{state['Next']}' is not a state")
+
+        if state_type == "Choice":
+            targets = [rule.get("Next") for rule in state.get("Choices", [])] + [state.get("Default")]
+            for target in targets:
+                if target is not None and target not in states:
+                    errors.append(f"{where}: Choice routes to unknown state '{target}'")
+
+        for catcher in state.get("Catch", []):
+            if catcher.get("Next") not in states:
+                errors.append(f"{where}: Catch routes to unknown state '{catcher.get('Next')}'")
+
+        for retrier in state.get("Retry", []):
+            if not retrier.get("ErrorEquals"):
+                errors.append(f"{where}: Retry without ErrorEquals")
+            if retrier.get("MaxAttempts", 0) < 0:
+                errors.append(f"{where}: Retry MaxAttempts must be >= 0")
+            if retrier.get("BackoffRate", 1.0) < 1.0:
+                errors.append(f"{where}: Retry BackoffRate must be >= 1.0")
+            if retrier.get("JitterStrategy") not in (None, "FULL", "NONE"):
+                errors.append(f"{where}: JitterStrategy must be FULL or NONE")
+            if retrier.get("MaxDelaySeconds") is not None and retrier["MaxDelaySeconds"] < retrier.get("IntervalSeconds", 1):
+                errors.append(f"{where}: Retry MaxDelaySeconds must be >= IntervalSeconds")
+
+        timeout = state.get("TimeoutSeconds")
+        heartbeat = state.get("HeartbeatSeconds")
+        if heartbeat and timeout and heartbeat >= timeout:
+            errors.append(f"{where}: HeartbeatSeconds must be lower than TimeoutSeconds")
+
+        if state_type == "Map":
+            if state.get("MaxConcurrency", 0) < 0:
+                errors.append(f"{where}: MaxConcurrency must be >= 0")
+            if "MaxConcurrency" in state and "MaxConcurrencyPath" in state:
+                errors.append(f"{where}: use either MaxConcurrency or MaxConcurrencyPath")
+            processor = state.get("ItemProcessor", {})
+            _validate_states(where, processor.get("States", {}), processor.get("StartAt"), errors)
+
+
+def validate_definition(definition):
+    """Structural checks on a definition; returns a list of error strings."""
+    errors = []
+    _validate_states("States", definition.get("States", {}), definition.get("StartAt"), errors)
+    return errors
+
+
+# ============================================================
+# Local execution plan
+# ============================================================
+
+def _walk_plan(states, start_at, depth, rows, concurrency):
+    seen = set()
+    name = start_at
+    # Follow the happy path, then list the states only reached through Catch
+    order = []
+    while name and name not in seen:
+        seen.add(name)
+        order.append(name)
+        name = states[name].get("Next") or states[name].get("Default")
+    order += [n for n in states if n not in seen]
+
+    for name in order:
+        state = states[name]
+        retry = state.get("Retry", [])
+        rows.append({
+            "state": "  " * depth + name,
+            "type": state.get("Type"),
+            "resource": state.get("Resource", "").rsplit(":", 1)[-1],
+            "concurrency": state.get("MaxConcurrencyPath", state.get("MaxConcurrency", concurrency)),
+            "timeout": state.get("TimeoutSeconds", "-"),
+            "heartbeat": state.get("HeartbeatSeconds", "-"),
+            "retries": ", ".join(
+                f"{r['MaxAttempts']}x{r['IntervalSeconds']}s*{r['BackoffRate']}"
+                + ("+jitter" if r.get("JitterStrategy") == "FULL" else "")
+                for r in retry
+            ) or "-",
+            "catch": ", ".join(c["Next"] for c in state.get("Catch", [])) or "-",
+        })
+        if state.get("Type") == "Map":
+            processor = state["ItemProcessor"]
+            _walk_plan(processor["States"], processor["StartAt"], depth + 1, rows,
+                       state.get("MaxConcurrencyPath", state.get("MaxConcurrency", concurrency)))
+
+
+def render_plan(definition):
+    """Tabular, human-readable plan of how a definition will execute."""
+    rows = []
+    _walk_plan(definition["States"], definition["StartAt"], 0, rows, 1)
+
+    columns = ["state", "type", "resource", "concurrency", "timeout", "heartbeat", "retries", "catch"]
+    widths = {c: max(len(c), *(len(str(r[c])) for r in rows)) for c in columns}
+    lines = [" | ".join(c.ljust(widths[c]) for c in columns)]
+    lines.append("-+-".join("-" * widths[c] for c in columns))
+    for row in rows:
+        lines.append(" | ".join(str(row[c]).ljust(widths[c]) for c in columns))
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the BEO Step Functions definition")
+    parser.add_argument("--env", choices=sorted(ENVIRONMENTS), default="prod")
+    parser.add_argument("--config", help="JSON file with config overrides")
+    parser.add_argument("--plan", action="store_true", help="Print the execution plan instead of JSON")
+    args = parser.parse_args()
+
+    definition = build_definition(load_config(args.env, args.config))
+    if args.plan:
+        print(render_plan(definition))
+    else:
+        print(json.dumps(definition, indent=2))
@@ -1,87 +1,26 @@
-{
-  "Comment": "Step Function to process multiple files using 2 lambdas with central fail handler",
-  "StartAt": "LoadFilesFromS3",
-  "States": {
-    "LoadFilesFromS3": {
-      "Type": "Task",
-      "Resource": "arn:aws:lambda:ap-south-1:640168441407:function:YC_beo_sfn_s3_file_read",
-      "Parameters": {
-        "s3Uri.$": "$.s3Uri"
-      },
-      "ResultPath": "$.fileData",
-      "Next": "ProcessFiles"
-    },
-    "ProcessFiles": {
-      "Type": "Map",
-      "ItemsPath": "$.fileData.files",
-      "MaxConcurrency": 5,
-      "ResultPath": "$.results",
-      "ItemProcessor": {
-        "ProcessorConfig": {
-          "Mode": "INLINE"
-        },
-        "StartAt": "RunFirstLambda",
-        "States": {
-          "RunFirstLambda": {
-            "Type": "Task",
-            "Resource": "arn:aws:lambda:ap-south-1:640168441407:function:ycbeoocrlambda1",
-            "Parameters": {
-              "clusterId.$": "$.clusterId",
-              "userId.$": "$.userId",
-              "fileId.$": "$.fileId",
-              "creditId.$": "$.creditId"
-            },
-            "ResultPath": "$.firstLambdaResult",
-            "Catch": [
-              {
-                "ErrorEquals": [
-                  "States.ALL"
-                ],
-                "ResultPath": "$.error",
-                "Next": "FailLambda"
-              }
-            ],
-            "Next": "RunSecondLambda"
-          },
-          "RunSecondLambda": {
-            "Type": "Task",
-            "Resource": "arn:aws:lambda:ap-south-1:640168441407:function:yc_beo_lambda2_structured",
-            "Parameters": {
-              "clusterId.$": "$.clusterId",
-              "userId.$": "$.userId",
-              "fileId.$": "$.fileId",
-              "creditId.$": "$.creditId",
-              "pages.$": "$.firstLambdaResult.pages",
-              "text_content.$": "$.firstLambdaResult.text_content"
-            },
-            "ResultPath": "$.secondLambdaResult",
-            "Catch": [
-              {
-                "ErrorEquals": [
-                  "States.ALL"
-                ],
-                "ResultPath": "$.error",
-                "Next": "FailLambda"
-              }
-            ],
-            "End": true
-          },
-          "FailLambda": {
-            "Type": "Task",
-            "Resource": "arn:aws:lambda:ap-south-1:640168441407:function:yc_beo_fail_lambda",
-            "Parameters": {
-              "status": "failed",
-              "error.$": "$.error",
-              "clusterId.$": "$.clusterId",
-              "userId.$": "$.userId",
-              "fileId.$": "$.fileId",
-              "creditId.$": "$.creditId"
-            },
-            "End": true
-          }
-        }
-      },
-      "End": true
-    }
-  }
-}
\ No newline at end of file
+"""
+Step Functions definition for the BEO pipeline.
+
+Rendered from stepfunction_builder.py — change DEFAULT_CONFIG / ENVIRONMENTS
+there instead of editing JSON by hand.
+
+    python stepfunctionjson.py                # prod definition (JSON)
+    python stepfunctionjson.py --env dev      # another environment
+    python stepfunctionjson.py --plan         # execution plan for review
+"""
+import json
+import argparse
+
+from stepfunction_builder import ENVIRONMENTS, build_definition, load_config, render_plan
+
+DEFINITION = build_definition(load_config("prod"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the BEO state machine definition")
+    parser.add_argument("--env", choices=sorted(ENVIRONMENTS), default="prod")
+    parser.add_argument("--plan", action="store_true")
+    args = parser.parse_args()
+
+    definition = build_definition(load_config(args.env))
+    print(render_plan(definition) if args.plan else json.dumps(definition, indent=2))
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# The Lambdas read their environment at import time
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("TRACE_EXPORTER", "off")
+
+
+@pytest.fixture(scope="session")
+def pipeline():
+    """The Lambdas loaded once against the local_fakes stand-ins (see local_runner.py)."""
+    from local_runner import LocalPipeline
+
+    return LocalPipeline(time_scale=0, llm_latency=0)
@@ -0,0 +1,12 @@
+from concurrency_controller import AIMDController, collect_signals, run_in_waves
+
+
+def test_waves_index_the_invocations_they_poll(pipeline):
+    reports = run_in_waves(pipeline.db, list(range(4)), 2, lambda wave, concurrency: "local:none",
+                           controller=AIMDController(initial_concurrency=3))
+
+    assert [r["concurrency"] for r in reports] == [3, 3]
+    indexes = pipeline.db["job_status"].index_information()
+    assert indexes["invocations.executionId_1"]["key"] == [("invocations.executionId", 1)]
+    assert indexes["invocations.startedAt_1"]["key"] == [("invocations.startedAt", 1)]
+    assert collect_signals(pipeline.db, execution_id="local:none")["invocations"] == 0
@@ -0,0 +1,66 @@
+import os
+import sys
+
+
+def test_follower_claims_when_the_record_is_deleted(pipeline, monkeypatch):
+    from bson import ObjectId
+
+    extract_text, mongo = sys.modules["extract_text"], sys.modules["mongo"]
+    file_id = ObjectId()
+    bucket, key = os.environ["S3_BUCKET_NAME"], f"raw/{file_id}.pdf"
+    pipeline.s3.put_object(Bucket=bucket, Key=key, Body=pipeline.fakes.synthetic_document(1))
+
+    # Another worker holds a live lease, then its record disappears while we follow it
+    assert mongo.try_claim_processing(file_id, "other")
+
+    def deleted_while_following(file_id, timeout):
+        mongo.get_textract_job_collection().delete_one({"_id": file_id})
+        return None
+
+    monkeypatch.setattr(extract_text, "wait_for_job_result", deleted_while_following)
+    result = extract_text.run_textract(bucket, key, file_id, pipeline.textract, "local-temp", "ap-south-1")
+
+    assert result
+    record = mongo.fetch_job_record(file_id)
+    assert record["status"] == "SUCCEEDED" and record["owner"] != "other"
+
+
+def test_terminal_textract_failure_raises_and_fails_the_job(pipeline):
+    from bson import ObjectId
+
+    extract_text, mongo, errors = sys.modules["extract_text"], sys.modules["mongo"], sys.modules["errors"]
+    file_id = ObjectId()
+
+    # The raw document does not exist: the copy to the temp bucket fails
+    try:
+        extract_text.run_textract(os.environ["S3_BUCKET_NAME"], f"raw/{file_id}.pdf", file_id,
+                                  pipeline.textract, "local-temp", "ap-south-1")
+    except errors.TerminalError:
+        pass
+    else:
+        raise AssertionError("run_textract did not raise TerminalError")
+    assert mongo.fetch_job_record(file_id)["status"] == "FAILED"
+
+
+def test_terminal_ocr_failure_is_caught_into_fail_lambda(pipeline):
+    import copy
+    import json
+
+    from bson import ObjectId
+    from local_runner import run_local
+    from stepfunction_builder import DEFAULT_CONFIG
+
+    s3_uri = pipeline.seed([1, 1])
+    bucket, key = s3_uri[len("s3://"):].split("/", 1)
+    first = json.loads(pipeline.s3.get_object(Bucket=bucket, Key=key)["Body"].read())["files"][0]
+    lost = pipeline.db["tb_file_details"].find_one({"_id": ObjectId(first["fileId"])})
+    pipeline.s3.delete_object(Bucket=os.environ["S3_BUCKET_NAME"],
+                              Key=f"{lost['userId']}/{lost['clusterId']}/raw/beo_00000.pdf")
+
+    output, summary = run_local(copy.deepcopy(DEFAULT_CONFIG), [1, 1], pipeline=pipeline, s3_uri=s3_uri)
+
+    states = summary["states"]
+    assert states["RunFirstLambda"]["errors"] == 1
+    assert states["FailLambda"]["count"] == 1
+    assert states["RunSecondLambda"]["count"] == 1
+    assert pipeline.db["job_status"].find_one({"job_id": str(lost["_id"])})["status"] == "failed"
@@ -0,0 +1,29 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+
+def test_concurrent_files_get_distinct_numbers(pipeline):
+    from bson import ObjectId
+
+    itemdescription = sys.modules["itemdescription"]
+    user_oid = ObjectId()
+    pipeline.db["tb_file_details"].insert_one({
+        "_id": ObjectId(), "userId": user_oid, "status": "1",
+        "updatedExtractedValues": {"invoiceNo": "PFI-E26-0180"},
+    })
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        numbers = list(pool.map(
+            lambda _: itemdescription.generate_invoice_number(pipeline.db, "2026-10-19", str(user_oid)),
+            range(20),
+        ))
+
+    # The counter starts after the highest number already issued
+    assert sorted(numbers) == [f"PFI-E26-{seq:04d}" for seq in range(181, 201)]
+
+
+def test_first_number_for_a_user(pipeline):
+    from bson import ObjectId
+
+    itemdescription = sys.modules["itemdescription"]
+    assert itemdescription.generate_invoice_number(pipeline.db, "2025-01-02", str(ObjectId())) == "PFI-E25-0173"
@@ -0,0 +1,39 @@
+import sys
+
+
+def test_histories_keep_only_the_latest_entries(pipeline, monkeypatch):
+    from bson import ObjectId
+
+    job_status = sys.modules["job_status"]
+    monkeypatch.setattr(job_status, "JOB_STATUS_MAX_TRANSITIONS", 3)
+    monkeypatch.setattr(job_status, "JOB_STATUS_MAX_INVOCATIONS", 2)
+    collection, file_id = pipeline.db["job_status"], str(ObjectId())
+
+    for attempt in range(5):
+        with job_status.JobStatusRecorder(collection, file_id, "ocr", executionId=f"run-{attempt}") as recorder:
+            recorder.record("started")
+            recorder.record("failed", f"attempt {attempt}")
+
+    doc = collection.find_one({"job_id": file_id})
+    assert [t["message"] for t in doc["transitions"]] == ["attempt 3", None, "attempt 4"]
+    assert [i["executionId"] for i in doc["invocations"]] == ["run-3", "run-4"]
+
+
+def test_lambdas_create_the_unique_job_id_index(pipeline):
+    indexes = pipeline.db["job_status"].index_information()
+    assert indexes["job_id_1"] == {"key": [("job_id", 1)], "unique": True}
+
+
+def test_ensure_indexes_never_raises(pipeline):
+    from pymongo.errors import OperationFailure
+
+    job_status = sys.modules["job_status"]
+
+    class Db:
+        def __getitem__(self, name):
+            return self
+
+        def create_index(self, keys, **kwargs):
+            raise OperationFailure("E11000 duplicate key error")
+
+    assert job_status.ensure_indexes(Db()) is False
@@ -0,0 +1,11 @@
+def test_manifest_cannot_set_original_s3_file(pipeline):
+    import manifest  # BEO_S3_File_read is on sys.path once the pipeline is loaded
+
+    entry = {"fileId": "a" * 24, "userId": "b" * 24, "clusterId": "c" * 24, "creditId": "d" * 24,
+             "originalS3File": "../../other-tenant/raw/invoice.pdf", "priority": 2}
+
+    normalized, reason = manifest.validate_entry(entry)
+
+    assert reason is None
+    assert normalized["originalS3File"] is None
+    assert normalized["priority"] == 2
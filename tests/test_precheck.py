@@ -0,0 +1,41 @@
+import pytest
+
+COMPLETED = {"processingStatus": "Completed", "extractedValues": {"items": [{}]}, "sourceETag": "etag-1"}
+
+
+@pytest.fixture
+def decide(pipeline):
+    return pipeline.modules["precheck"].decide
+
+
+def test_completed_with_the_same_etag_is_skipped(decide):
+    assert decide(COMPLETED, "etag-1", force=False) == (True, "unchanged")
+
+
+def test_completed_with_a_changed_etag_is_processed(decide):
+    assert decide(COMPLETED, "etag-2", force=False) == (False, "changed")
+
+
+def test_completed_before_etags_were_stored_is_skipped_by_status(decide):
+    legacy = {k: v for k, v in COMPLETED.items() if k != "sourceETag"}
+    assert decide(legacy, "etag-1", force=False) == (True, "completed")
+
+
+@pytest.mark.parametrize("file_doc", [None, dict(COMPLETED, processingStatus="Failed"),
+                                      dict(COMPLETED, extractedValues=None)])
+def test_unprocessed_files_are_processed(decide, file_doc):
+    assert decide(file_doc, "etag-1", force=False) == (False, "new")
+
+
+def test_force_reprocess_wins(decide):
+    assert decide(COMPLETED, "etag-1", force=True) == (False, "forced")
+
+
+def test_precheck_is_off_unless_the_environment_opts_in():
+    from stepfunction_builder import build_definition, load_config
+
+    def file_states(env):
+        return build_definition(load_config(env))["States"]["ProcessFiles"]["ItemProcessor"]["States"]
+
+    assert "PrecheckFile" not in file_states("prod")
+    assert "PrecheckFile" in file_states("prod-scheduled")
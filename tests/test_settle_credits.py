@@ -0,0 +1,74 @@
+import json
+import os
+import sys
+
+ITERATION_FIELDS = {"fileId", "creditId", "error", "precheck", "settlement", "pages", "text_ref"}
+
+
+def test_map_results_keep_only_what_settlement_reads(pipeline):
+    from bson import ObjectId
+    from local_runner import run_local
+    from stepfunction_builder import load_config
+
+    page_counts = [1, 2, 3]
+    s3_uri = pipeline.seed(page_counts)
+    bucket, key = s3_uri[len("s3://"):].split("/", 1)
+    lost = json.loads(pipeline.s3.get_object(Bucket=bucket, Key=key)["Body"].read())["files"][0]
+    pipeline.s3.delete_object(Bucket=os.environ["S3_BUCKET_NAME"],
+                              Key=f"{lost['userId']}/{lost['clusterId']}/raw/beo_00000.pdf")
+
+    output, _ = run_local(load_config("prod-distributed"), page_counts, pipeline=pipeline, s3_uri=s3_uri)
+
+    assert all(set(item) <= ITERATION_FIELDS for item in output["results"])
+    assert output["settlement"]["debited"] == 2 and output["settlement"]["rolledBack"] == 1
+    assert pipeline.db["tb_credits"].find_one({"_id": ObjectId(lost["creditId"])}) is None
+
+
+def test_collect_outcomes_reads_batches_and_item_batcher_lists(pipeline):
+    settle_credits = sys.modules["settle_credits"]
+    debit = {"operation": "debit", "creditId": "c1", "fileId": "f1", "attempt": 0}
+    results = [
+        [{"fileId": "f1", "creditId": "c1", "settlement": debit}],
+        {"batchId": "00000", "settlements": [None, debit]},
+        {"batchId": "00001", "files": [{"fileId": "f2", "creditId": "c2"}], "error": {"Error": "TerminalError"}},
+    ]
+
+    outcomes = settle_credits.collect_outcomes(results)
+
+    assert outcomes[:2] == [debit, debit]
+    assert [(o["operation"], o["creditId"]) for o in outcomes[2:]] == [("rollback", "c2")]
+
+
+def test_map_results_carry_the_ocr_text_by_reference_only(pipeline):
+    from local_runner import run_local
+    from stepfunction_builder import load_config
+
+    page_counts = [1, 30]  # the second file's text is over the inline limit
+    output, _ = run_local(load_config("prod"), page_counts, pipeline=pipeline)
+
+    assert "text_content" not in json.dumps(output["results"])
+    assert [item["pages"] for item in output["results"]] == page_counts
+    small, large = output["results"]
+    assert small["text_ref"] is None and large["text_ref"]
+
+
+def test_rollbacks_after_a_redrive_use_the_redrive_count(pipeline):
+    from bson import ObjectId
+
+    settle_credits = sys.modules["settle_credits"]
+    file_oid, credit_oid = ObjectId(), ObjectId()
+    pipeline.db["tb_file_details"].insert_one({"_id": file_oid, "processingStatus": "Processing"})
+    pipeline.db["tb_credits"].insert_one({"_id": credit_oid, "type": "reserved", "credits": 1})
+    failed = {"fileId": str(file_oid), "creditId": str(credit_oid), "error": {"Error": "TerminalError"}}
+
+    result = settle_credits.lambda_handler({"results": [failed], "attempt": 2}, None)
+
+    assert result["rolledBack"] == 1
+    assert pipeline.db["tb_credit_ledger"].find_one({"_id": f"{file_oid}:{credit_oid}:2:rollback"})
+
+
+def test_settle_credits_receives_the_redrive_count():
+    from stepfunction_builder import build_definition, load_config
+
+    settle = build_definition(load_config("prod-distributed"))["States"]["SettleCredits"]
+    assert settle["Parameters"]["attempt.$"] == "$$.Execution.RedriveCount"
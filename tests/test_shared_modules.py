@@ -0,0 +1,52 @@
+"""
+The modules shared between Lambdas are committed once per Lambda directory
+(each is deployed on its own), and local_runner.py puts every directory on
+one sys.path, so only the first copy is ever exercised. Each shared
+module's "Shared by ..." header names its Lambdas; their copies must stay
+byte-identical.
+"""
+import os
+import re
+
+import pytest
+
+from local_runner import LAMBDA_DIRS, ROOT
+
+SHARED_BY = re.compile(r"#\s*Shared by (.*?)keep", re.S)
+
+
+def shared_modules():
+    """{module file name: Lambda directories named in its "Shared by" header}"""
+    modules = {}
+    for directory in sorted(LAMBDA_DIRS.values()):
+        for name in sorted(os.listdir(os.path.join(ROOT, directory))):
+            if not name.endswith(".py"):
+                continue
+            with open(os.path.join(ROOT, directory, name), encoding="utf-8") as f:
+                match = SHARED_BY.search(f.read(4096))
+            if match:
+                named = {d for d in LAMBDA_DIRS.values() if d in match.group(1)}
+                modules.setdefault(name, set()).update(named | {directory})
+    return modules
+
+
+SHARED_MODULES = shared_modules()
+
+
+def test_shared_modules_are_found():
+    assert {"batch.py", "errors.py", "job_status.py", "log.py", "payload_store.py",
+            "sampler.py", "tracing.py"} <= set(SHARED_MODULES)
+
+
+@pytest.mark.parametrize("name", sorted(SHARED_MODULES))
+def test_shared_module_copies_are_identical(name):
+    copies = {}
+    for directory in sorted(SHARED_MODULES[name]):
+        path = os.path.join(ROOT, directory, name)
+        assert os.path.exists(path), f"{directory} is missing its copy of {name}"
+        with open(path, "rb") as f:
+            copies[directory] = f.read()
+
+    reference = next(iter(copies))
+    differing = [d for d, body in copies.items() if body != copies[reference]]
+    assert not differing, f"{name} differs from {reference}/{name} in: {', '.join(differing)}"
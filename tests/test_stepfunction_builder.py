@@ -0,0 +1,73 @@
+"""
+Every environment's definition builds and validates, and its key states
+(types, Lambdas, transitions and catchers) match tests/golden/. After an
+intended change, regenerate the golden files with
+
+    UPDATE_GOLDEN=1 python -m pytest tests/test_stepfunction_builder.py
+"""
+import json
+import os
+
+import pytest
+
+from stepfunction_builder import ENVIRONMENTS, build_definition, load_config, validate_definition
+
+GOLDEN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden")
+
+
+def key_states(states):
+    """The shape of a state graph: what runs, and where each state goes next."""
+    shape = {}
+    for name, state in states.items():
+        entry = {"Type": state["Type"]}
+        if state.get("Resource"):
+            entry["Resource"] = state["Resource"].rsplit(":", 1)[-1]
+        for field in ("Next", "End", "Default"):
+            if field in state:
+                entry[field] = state[field]
+        if state.get("Choices"):
+            entry["Choices"] = [rule["Next"] for rule in state["Choices"]]
+        if state.get("Catch"):
+            entry["Catch"] = [catcher["Next"] for catcher in state["Catch"]]
+        if state.get("ItemProcessor"):
+            processor = state["ItemProcessor"]
+            entry["Mode"] = processor["ProcessorConfig"]["Mode"]
+            entry["StartAt"] = processor["StartAt"]
+            entry["States"] = key_states(processor["States"])
+        shape[name] = entry
+    return shape
+
+
+@pytest.mark.parametrize("env", sorted(ENVIRONMENTS))
+def test_environment_builds_a_valid_definition(env):
+    definition = build_definition(load_config(env))
+    assert validate_definition(definition) == []
+
+
+@pytest.mark.parametrize("env", sorted(ENVIRONMENTS))
+def test_key_states_match_golden(env):
+    definition = build_definition(load_config(env))
+    shape = {"StartAt": definition["StartAt"], "States": key_states(definition["States"])}
+    path = os.path.join(GOLDEN_DIR, f"stepfunction_{env}.json")
+
+    if os.getenv("UPDATE_GOLDEN"):
+        with open(path, "w") as f:
+            json.dump(shape, f, indent=2)
+            f.write("\n")
+    with open(path) as f:
+        assert shape == json.load(f)
+
+
+def test_deployed_definition_uses_only_deployed_lambdas():
+    from stepfunctionjson import DEFINITION
+
+    resources = json.dumps(DEFINITION)
+    config = load_config("prod")
+    for key in ("schedule", "precheck", "settle"):
+        assert config["functions"][key] not in resources
+
+
+def test_validate_definition_reports_broken_transitions():
+    definition = build_definition(load_config("prod"))
+    definition["States"]["LoadFilesFromS3"]["Next"] = "Missing"
+    assert validate_definition(definition) == ["States.LoadFilesFromS3: Next 'Missing' is not a state"]
@@ -0,0 +1,44 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def mongo(pipeline):
+    return sys.modules["mongo"]
+
+
+@pytest.fixture
+def file_id():
+    from bson import ObjectId
+
+    return ObjectId()
+
+
+def test_a_retry_after_failure_counts_one_attempt(mongo, file_id):
+    assert mongo.try_claim_processing(file_id, "first")
+    mongo.set_job_started(file_id, "job-1", "first")
+    mongo.set_job_failed(file_id, "boom", "first")
+
+    assert mongo.takeover_stale_lease(file_id, "second")["status"] == "FAILED"
+    mongo.set_job_started(file_id, "job-2", "second")
+
+    assert mongo.fetch_job_record(file_id)["attempts"] == 2
+
+
+def test_only_the_lease_owner_records_success(mongo, file_id):
+    assert mongo.try_claim_processing(file_id, "new-owner")
+
+    assert mongo.set_job_succeeded(file_id, {"page_count": 1}, 1, owner="old-owner") is None
+    assert mongo.fetch_job_record(file_id)["status"] == "CLAIMED"
+
+    record = mongo.set_job_succeeded(file_id, {"page_count": 1}, 1, owner="new-owner")
+    assert record["status"] == "SUCCEEDED" and record["succeededAt"] >= record["createdAt"]
+
+
+def test_lease_expiry_accepts_naive_datetimes_from_pymongo(mongo):
+    from datetime import datetime, timedelta, timezone
+
+    naive_past = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1)
+    assert mongo.lease_expired({"leaseExpiresAt": naive_past})
+    assert not mongo.lease_expired({"leaseExpiresAt": naive_past + timedelta(hours=1)})
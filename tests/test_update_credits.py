@@ -0,0 +1,106 @@
+"""
+Credit settlement through the ledger: a debit, its replay, then the
+rollback that compensates it in the same attempt.
+
+Runs against the local fake MongoDB, and against a real replica set
+(with_transaction needs one) when MONGO_TEST_URI is set, e.g.
+
+    MONGO_TEST_URI="mongodb://localhost:27017/?replicaSet=rs0" python -m pytest tests/test_update_credits.py
+"""
+import os
+import sys
+from uuid import uuid4
+
+import pytest
+
+MONGO_TEST_URI = os.getenv("MONGO_TEST_URI")
+
+
+@pytest.fixture(params=["local", "replica-set"])
+def credits(request, pipeline, monkeypatch):
+    """update_credits wired to the backend under test, and that backend's database."""
+    update_credits = sys.modules["update_credits"]
+    if request.param == "local":
+        yield update_credits, pipeline.db
+        return
+
+    if not MONGO_TEST_URI:
+        pytest.skip("MONGO_TEST_URI (a replica set) is not set")
+    # pymongo.MongoClient is the fake once the pipeline is loaded
+    from pymongo.mongo_client import MongoClient
+
+    client = MongoClient(MONGO_TEST_URI)
+    db = client[f"test_credits_{uuid4().hex[:8]}"]
+    monkeypatch.setattr(update_credits, "mongo_client", client)
+    for name in ("tb_credits", "tb_file_details", "tb_credit_ledger"):
+        db.create_collection(name)  # collections cannot be created inside a transaction
+        monkeypatch.setattr(update_credits, name, db[name])
+    try:
+        yield update_credits, db
+    finally:
+        client.drop_database(db.name)
+        client.close()
+
+
+def _seed(db):
+    from bson import ObjectId  # vendored in the Lambda dirs, on sys.path once the pipeline is loaded
+
+    file_oid, credit_oid = ObjectId(), ObjectId()
+    db["tb_file_details"].insert_one({"_id": file_oid, "processingStatus": "Processing"})
+    db["tb_credits"].insert_one({"_id": credit_oid, "type": "reserved", "credits": 2})
+    return file_oid, credit_oid
+
+
+def test_debit_replay_then_rollback(credits):
+    update_credits, db = credits
+    file_oid, credit_oid = _seed(db)
+
+    debit = update_credits.settle_credit("debit", credit_oid, file_oid, attempt=0)
+    assert debit["status"] == "success" and not debit["replayed"]
+    assert db["tb_credits"].find_one({"_id": credit_oid})["type"] == "debited"
+    assert db["tb_file_details"].find_one({"_id": file_oid})["processingStatus"] == "Completed"
+
+    replay = update_credits.settle_credit("debit", credit_oid, file_oid, attempt=0)
+    assert replay["replayed"] and replay["operation"] == "debit"
+
+    # The file failed after its debit, in the same attempt: the rollback must apply
+    rollback = update_credits.settle_credit("rollback", credit_oid, file_oid, attempt=0)
+    assert rollback["operation"] == "rollback" and not rollback["replayed"]
+    assert db["tb_credits"].find_one({"_id": credit_oid}) is None
+    assert db["tb_file_details"].find_one({"_id": file_oid})["processingStatus"] == "Failed"
+
+    assert update_credits.settle_credit("rollback", credit_oid, file_oid, attempt=0)["replayed"]
+    assert db["tb_credit_ledger"].count_documents({"creditId": credit_oid}) == 2
+
+
+def test_bulk_debit_then_rollback(credits):
+    update_credits, db = credits
+    file_oid, credit_oid = _seed(db)
+    debit = update_credits.build_settlement_outcome("debit", credit_oid, file_oid)
+    rollback = update_credits.build_settlement_outcome("rollback", credit_oid, file_oid)
+
+    assert update_credits.bulk_settle_credits([debit])["debited"] == 1
+    assert update_credits.bulk_settle_credits([debit])["replayed"] == 1
+
+    report = update_credits.bulk_settle_credits([rollback])
+    assert report["rolledBack"] == 1 and report["replayed"] == 0
+    assert db["tb_credits"].find_one({"_id": credit_oid}) is None
+    assert db["tb_file_details"].find_one({"_id": file_oid})["processingStatus"] == "Failed"
+
+
+def test_bulk_debit_of_a_missing_credit_is_a_failure(credits):
+    update_credits, db = credits
+    file_oid, credit_oid = _seed(db)
+    missing_file, missing_credit = _seed(db)
+    db["tb_credits"].delete_one({"_id": missing_credit})
+
+    report = update_credits.bulk_settle_credits([
+        update_credits.build_settlement_outcome("debit", credit_oid, file_oid),
+        update_credits.build_settlement_outcome("debit", missing_credit, missing_file),
+    ])
+
+    assert report["debited"] == 1 and report["failed"] == 1
+    assert report["failures"][0]["creditId"] == str(missing_credit)
+    assert db["tb_file_details"].find_one({"_id": missing_file})["processingStatus"] == "Processing"
+    assert db["tb_credit_ledger"].count_documents({"creditId": missing_credit}) == 0
+    assert db["tb_credit_ledger"].count_documents({"creditId": credit_oid}) == 1
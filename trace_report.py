@@ -0,0 +1,98 @@
+"""
+Per-stage latency report from the spans written by tracing.py.
+
+Reads JSON-lines span records (TRACE_EXPORTER=jsonl) or EMF records
+(TRACE_EXPORTER=emf) from files or stdin; other lines, e.g. the Lambdas'
+print() output in a CloudWatch Logs export, are ignored.
+
+    python trace_report.py /tmp/spans.jsonl
+    aws logs tail /aws/lambda/ycbeoocrlambda1 --format short | python trace_report.py -
+    python trace_report.py spans.jsonl --by-service --json
+"""
+import argparse
+import json
+import statistics
+import sys
+from collections import defaultdict
+
+from concurrency_controller import percentile
+
+# Root spans of the per-file Lambdas; their sum is a file's end-to-end time
+FILE_STAGES = ("precheck", "ocr", "structured", "fail")
+
+
+def read_spans(lines):
+    for line in lines:
+        start = line.find("{")
+        if start < 0:
+            continue
+        try:
+            record = json.loads(line[start:])
+        except ValueError:
+            continue
+        if isinstance(record, dict) and record.get("type") == "span":
+            yield record
+
+
+def stats(durations, errors=0):
+    return {
+        "count": len(durations),
+        "errors": errors,
+        "meanMs": round(statistics.fmean(durations), 1) if durations else 0.0,
+        "p50Ms": percentile(durations, 50),
+        "p95Ms": percentile(durations, 95),
+        "p99Ms": percentile(durations, 99),
+        "maxMs": max(durations, default=0.0),
+    }
+
+
+def build_report(spans, by_service=False):
+    durations = defaultdict(list)
+    errors = defaultdict(int)
+    per_file = defaultdict(float)
+
+    for record in spans:
+        name = record["span"]
+        if record.get("parent"):
+            name = f"{record['parent']}/{name}"
+        if by_service:
+            name = f"{record.get('service')}:{name}"
+        durations[name].append(record["durationMs"])
+        if record.get("status") == "error":
+            errors[name] += 1
+        if record["span"] in FILE_STAGES and not record.get("parent") and record.get("fileId"):
+            for file_id in str(record["fileId"]).split(","):
+                per_file[file_id] += record["durationMs"]
+
+    return {
+        "stages": {name: stats(values, errors[name]) for name, values in sorted(durations.items())},
+        "files": stats(list(per_file.values())),
+    }
+
+
+def format_report(report):
+    lines = [f"{'stage':<40} {'count':>6} {'err':>4} {'mean':>9} {'p50':>9} {'p95':>9} {'p99':>9}"]
+    rows = list(report["stages"].items()) + [("(per file, end to end)", report["files"])]
+    for name, s in rows:
+        lines.append(f"{name:<40} {s['count']:>6} {s['errors']:>4} {s['meanMs']:>9.1f} "
+                     f"{s['p50Ms']:>9.1f} {s['p95Ms']:>9.1f} {s['p99Ms']:>9.1f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-stage p50/p95/p99 from tracing.py spans")
+    parser.add_argument("paths", nargs="+", help="Span files (JSON lines or EMF); - for stdin")
+    parser.add_argument("--by-service", action="store_true", help="Split stages by Lambda function")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    spans = []
+    for path in args.paths:
+        if path == "-":
+            spans.extend(read_spans(sys.stdin))
+        else:
+            with open(path) as f:
+                spans.extend(read_spans(f))
+
+    report = build_report(spans, by_service=args.by_service)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))